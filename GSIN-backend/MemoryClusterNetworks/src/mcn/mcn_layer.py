@@ -1,12 +1,20 @@
 # src/mcn/mcn_layer.py
 import numpy as np, time
 from collections import deque
-from .memory_store import MemoryStore
+from operator import itemgetter
+from .memory_store import MemoryStore, _FAISS
 from .value_estimator import ValueEstimator
 from .compressor import Compressor
 from .retriever import score_with_values
 from .persistence import save_state, load_state
 
+# Stores larger than this are searched through the FAISS index (when available):
+# it returns the k * FAISS_CANDIDATE_FACTOR most similar items by (quantized)
+# cosine, which are then rescored exactly and by value. Smaller stores use the
+# dense NumPy path.
+FAISS_MIN_ITEMS = 1024
+FAISS_CANDIDATE_FACTOR = 4
+
 class MCNLayer:
     """
     MCN layer with adaptive maintenance + persistence + simple event logging.
@@ -30,7 +38,8 @@ class MCNLayer:
         # Legacy / misc
         max_items: int | None = 50000,        # used if budget=None
         lambda_decay: float = 1e-6,
-        min_clusters: int = 1
+        min_clusters: int = 1,
+        max_events: int = 4096                # event log keeps only the most recent entries
     ):
         self.store = MemoryStore(dim)
         self.vals = ValueEstimator(0, lambda_decay=lambda_decay)
@@ -45,7 +54,10 @@ class MCNLayer:
 
         # Latency SLO tracking
         self.latency_slo_ms = latency_slo_ms
-        self._lat_buf: deque[float] = deque(maxlen=slo_window)
+        # ring of the last `slo_window` search latencies (seconds)
+        self._lat_buf = np.empty(max(1, int(slo_window)), dtype=np.float64)
+        self._lat_head = 0
+        self._lat_filled = 0
         self._slo_breaches = 0
         self._slo_breach_count = slo_breach_count
 
@@ -53,9 +65,19 @@ class MCNLayer:
         self.auto_maintain = bool(auto_maintain)
 
         # Logging
-        self.events: list[dict] = []  # append dicts: {"t": ts, "event": str, ...}
+        self.events: deque[dict] = deque(maxlen=max_events)  # append dicts: {"t": ts, "event": str, ...}
 
     # ---------- helpers ----------
+    @staticmethod
+    def _gather(items, idx):
+        # items[i] for i in idx, with the gather done in C by itemgetter
+        idx = np.asarray(idx).tolist()
+        if len(idx) == 0:
+            return []
+        if len(idx) == 1:
+            return [items[idx[0]]]
+        return list(itemgetter(*idx)(items))
+
     @staticmethod
     def _l2norm(x):
         return x / (np.linalg.norm(x, axis=1, keepdims=True) + 1e-9)
@@ -79,9 +101,9 @@ class MCNLayer:
             self.maintain(reason=reason)
 
     def _slo_trigger(self):
-        if self.latency_slo_ms is None or len(self._lat_buf) < self._lat_buf.maxlen:
+        if self.latency_slo_ms is None or self._lat_filled < self._lat_buf.shape[0]:
             return False
-        p95 = np.percentile(np.array(self._lat_buf), 95)
+        p95 = np.percentile(self._lat_buf, 95)
         if p95 * 1000.0 > self.latency_slo_ms:
             self._slo_breaches += 1
         else:
@@ -104,20 +126,31 @@ class MCNLayer:
             return [], []
         t0 = time.time()
 
-        q = qvec.reshape(1, -1).astype("float32")
-        q = self._l2norm(q)
-        Vn = self._l2norm(self.store.vectors)
-        sims = (q @ Vn.T)
+        q = self._l2norm(qvec.reshape(1, -1).astype("float32")).reshape(-1)
 
         vals = self.vals.compute_values()
         if not np.any(vals > 0):
             vals = np.ones_like(vals)
 
-        idx, scores = score_with_values(sims, vals, topk=k)
-        self.vals.touch(idx, sims.flatten()[idx])
+        n = self._size()
+        if _FAISS and self.store.index is not None and n > FAISS_MIN_ITEMS:
+            # candidates from the quantized index; exact cosine for just those
+            _, cand = self.store.index.search(q.reshape(1, -1), min(n, k * FAISS_CANDIDATE_FACTOR))
+            cand = cand[0][cand[0] >= 0]
+            cand_sims = (self.store.vectors[cand] @ q) * self.store.inv_norms[cand]
+            local, scores = score_with_values(cand_sims, vals[cand], topk=k)
+            idx = cand[local]
+            self.vals.touch(idx, cand_sims[local])
+        else:
+            # cosine vs unit-norm q, using the store's cached inverse row norms
+            sims = (self.store.vectors @ q) * self.store.inv_norms
+            idx, scores = score_with_values(sims, vals, topk=k)
+            self.vals.touch(idx, sims[idx])
 
         # latency track
-        self._lat_buf.append(time.time() - t0)
+        self._lat_buf[self._lat_head] = time.time() - t0
+        self._lat_head = (self._lat_head + 1) % self._lat_buf.shape[0]
+        self._lat_filled = min(self._lat_filled + 1, self._lat_buf.shape[0])
         if self._slo_trigger():
             self._maybe_auto_maintain(reason="latency_slo")
 
@@ -147,28 +180,27 @@ class MCNLayer:
             return
 
         vals = self.vals.compute_values()
-        order = np.argsort(-vals)
+        # Only the top-B by value are ever used: select them in O(n), then sort just those
+        top = np.argpartition(vals, n - B)[n - B:] if B > 0 else np.empty(0, dtype=int)
+        order = top[np.argsort(-vals[top])]
         now = time.time()
-        ages = now - self.vals.birth
-        warm_mask = ages < self.warmup_secs
 
-        # Protect warm-up + top-q by value
-        keep_mask = warm_mask.copy()
+        # Protect warm-up (born within warmup_secs) + top-q by value
+        keep_mask = self.vals.birth > now - self.warmup_secs
         keep_target = min(int(np.ceil(q * n)), B)
-        keep_idx_by_value = order[:keep_target]
-        keep_mask[keep_idx_by_value] = True
-
-        keep_idx = np.where(keep_mask)[0]
-        tail_idx = np.where(~keep_mask)[0]
+        keep_mask[order[:keep_target]] = True
 
-        if keep_idx.size >= B:
+        # The trim path only needs the count; index arrays are built for the merge path
+        if np.count_nonzero(keep_mask) >= B:
             top_idx = order[:B]
             self._rebuild_from_indices(top_idx)
             self._log("maintain_trim_topB", budget=B, kept=len(top_idx), reason=reason)
-            self._lat_buf.clear()
+            self._lat_head = self._lat_filled = 0
             self._slo_breaches = 0
             return
 
+        keep_idx = np.flatnonzero(keep_mask)
+        tail_idx = np.flatnonzero(~keep_mask)
         remaining = max(B - keep_idx.size, self.min_clusters)
         if tail_idx.size == 0:
             self._log("maintain_skip_no_tail", budget=B, kept=keep_idx.size, reason=reason)
@@ -184,9 +216,13 @@ class MCNLayer:
         self.compressor.eps_ratio = old_ratio
 
         # Metadata for centroids (rep = highest-value member)
+        # Group tail members by label once (stable sort keeps each group in index order)
+        # instead of scanning all labels per centroid
+        sort_perm = np.argsort(labels, kind="stable")
+        bounds = np.searchsorted(labels[sort_perm], np.arange(centroids.shape[0] + 1))
         new_meta_centroids = []
         for c in range(centroids.shape[0]):
-            member_local = np.where(labels == c)[0]
+            member_local = sort_perm[bounds[c]:bounds[c + 1]]
             if member_local.size == 0:
                 new_meta_centroids.append({"centroid_of": []})
                 continue
@@ -198,7 +234,7 @@ class MCNLayer:
             new_meta_centroids.append(rep_copy)
 
         kept_V = V[keep_idx]
-        kept_meta = [M[i] for i in keep_idx]
+        kept_meta = self._gather(M, keep_idx)
         new_V = np.vstack([kept_V, centroids]).astype("float32")
         new_meta = kept_meta + new_meta_centroids
 
@@ -209,14 +245,14 @@ class MCNLayer:
         after = self._size()
 
         self._log("maintain_done", reason=reason, before=int(before), after=int(after), kept=len(kept_meta), centroids=int(centroids.shape[0]))
-        self._lat_buf.clear()
+        self._lat_head = self._lat_filled = 0
         self._slo_breaches = 0
 
     def _rebuild_from_indices(self, idx: np.ndarray):
         V = self.store.vectors
         M = self.store.meta
         new_V = V[idx]
-        new_meta = [M[i] for i in idx]
+        new_meta = self._gather(M, idx)
         self.store = MemoryStore(V.shape[1])
         self.store.add(new_V, meta_batch=new_meta)
         self.vals = ValueEstimator(len(new_meta), lambda_decay=self.vals.lambda_decay)
@@ -250,7 +286,7 @@ class MCNLayer:
             lambda_decay=self.vals.lambda_decay,
             dim=self.store.vectors.shape[1] if self._size() > 0 else 0,
             policy=policy,
-            extra=extra or {"events": self.events}
+            extra=extra or {"events": list(self.events)}
         )
         self._log("save", path=path)
 
@@ -267,13 +303,13 @@ class MCNLayer:
                    latency_slo_ms=pol.get("latency_slo_ms"),
                    auto_maintain=pol.get("auto_maintain", True))
         # rebuild store
-        self.store.add(state["vectors"].astype("float32"), meta_batch=state["meta"])
+        self.store.add(state["vectors"], meta_batch=state["meta"])
         # rebuild estimator
         self.vals = ValueEstimator(self.size(), lambda_decay=state["lambda_decay"])
         self.vals.values = state["values"].astype("float32")
         self.vals.birth = state["birth"].astype("float64")
         # events
         extra = state.get("extra") or {}
-        self.events = extra.get("events", [])
+        self.events.extend(extra.get("events", []))
         self._log("load", path=path)
         return self
@@ -1,24 +1,60 @@
 import numpy as np
 
 try:
-    import faiss  # optional; we still compute cosine separately
+    import faiss  # optional; inner-product index over normalized rows (= cosine)
     _FAISS = True
 except Exception:
     _FAISS = False
 
+def _new_index(dim: int):
+    # 8-bit scalar-quantized rows (a quarter of float32's memory traffic). The
+    # rows are unit-norm, so every component lies in [-1, 1]: training on that
+    # box fixes the quantization range without depending on the data.
+    index = faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_8bit_uniform, faiss.METRIC_INNER_PRODUCT)
+    index.train(np.vstack([-np.ones((1, dim)), np.ones((1, dim))]).astype("float32"))
+    return index
+
 class MemoryStore:
     def __init__(self, dim: int):
         self.dim = dim
-        self.vectors = np.empty((0, dim), dtype="float32")
+        # rows live in the first _size rows of buffers that grow geometrically,
+        # so streaming adds don't copy the whole store each time
+        self._size = 0
+        self._capacity = 0
+        self._buf = np.empty((0, dim), dtype="float32")
+        # 1/||v|| per row, kept in step with `vectors` so searches needn't recompute it
+        self._inv_buf = np.empty(0, dtype="float32")
         self.meta = []  # arbitrary dicts per item
         self.index = None
         if _FAISS:
-            self.index = faiss.IndexFlatL2(dim)
+            self.index = _new_index(dim)
+
+    @property
+    def vectors(self):
+        return self._buf[:self._size]
+
+    @property
+    def inv_norms(self):
+        return self._inv_buf[:self._size]
+
+    def _reserve(self, n: int):
+        if self._size + n <= self._capacity:
+            return
+        capacity = max(self._capacity * 2, self._size + n, 1024)
+        buf = np.empty((capacity, self.dim), dtype="float32")
+        buf[:self._size] = self._buf[:self._size]
+        inv_buf = np.empty(capacity, dtype="float32")
+        inv_buf[:self._size] = self._inv_buf[:self._size]
+        self._buf, self._inv_buf, self._capacity = buf, inv_buf, capacity
 
     def add(self, vecs: np.ndarray, meta_batch=None):
-        vecs = vecs.astype("float32")
+        vecs = vecs.astype("float32", copy=False)
         n = vecs.shape[0]
-        self.vectors = np.vstack([self.vectors, vecs])
+        self._reserve(n)
+        self._buf[self._size:self._size + n] = vecs
+        inv = self._inv_buf[self._size:self._size + n]
+        inv[:] = 1.0 / (np.linalg.norm(vecs, axis=1) + 1e-9)
+        self._size += n
         # ensure meta length matches vectors length
         if meta_batch is None:
             meta_batch = [{} for _ in range(n)]
@@ -32,8 +68,8 @@ class MemoryStore:
 
         if _FAISS:
             if self.index is None or self.index.d != self.dim:
-                self.index = faiss.IndexFlatL2(self.dim)
-            self.index.add(vecs)
+                self.index = _new_index(self.dim)
+            self.index.add(vecs * inv[:, None])
 
     def size(self):
-        return self.vectors.shape[0]
+        return self._size
@@ -78,7 +78,6 @@ def load_state(path: str):
         return dict(vectors=vectors, meta=meta, values=values, birth=birth,
                     lambda_decay=lambda_decay, dim=dim, policy=policy, extra=extra)
     else:
-        import os, json
         vectors = np.load(os.path.join(path, "vectors.npy"))
         values = np.load(os.path.join(path, "values.npy"))
         birth = np.load(os.path.join(path, "birth.npy"))
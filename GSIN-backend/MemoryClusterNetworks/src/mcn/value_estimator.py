@@ -1,23 +1,58 @@
 import numpy as np
 from time import time
 
+_COLUMNS = ("freq", "last_access", "sim_recent", "birth", "values")
+
+def _column(name):
+    # per-item array exposed as a view of the first n slots of its buffer;
+    # assigning copies into the buffer (lengths must match)
+    def get(self):
+        return self._bufs[name][:self._n]
+
+    def set(self, value):
+        value = np.asarray(value)
+        if value.shape != (self._n,):
+            raise ValueError(f"{name} must have shape ({self._n},), got {value.shape}")
+        self._bufs[name][:self._n] = value
+
+    return property(get, set)
+
 class ValueEstimator:
+    freq = _column("freq")                # usage count
+    last_access = _column("last_access")
+    sim_recent = _column("sim_recent")    # similarity to recent queries
+    birth = _column("birth")
+    values = _column("values")
+
     def __init__(self, n_items=0, alpha=0.5, beta=0.3, gamma=0.15, delta=0.05, lambda_decay=1e-6):
         self.alpha, self.beta, self.gamma, self.delta = alpha, beta, gamma, delta
         self.lambda_decay = lambda_decay
-        self.freq = np.zeros(n_items)        # usage count
-        self.last_access = np.zeros(n_items) + time()
-        self.sim_recent = np.zeros(n_items)  # similarity to recent queries
-        self.birth = np.zeros(n_items) + time()
-        self.values = np.ones(n_items)
+        # columns live in buffers that grow geometrically, so streaming adds
+        # don't copy every array on each grow
+        self._n = 0
+        self._cap = 0
+        self._bufs = {name: np.empty(0) for name in _COLUMNS}
+        self._scratch = np.empty((4, 0))  # work rows for compute_values
+        self.grow(n_items)
 
     def grow(self, n_new):
         t = time()
-        self.freq = np.hstack([self.freq, np.zeros(n_new)])
-        self.last_access = np.hstack([self.last_access, np.zeros(n_new) + t])
-        self.sim_recent = np.hstack([self.sim_recent, np.zeros(n_new)])
-        self.birth = np.hstack([self.birth, np.zeros(n_new) + t])
-        self.values = np.hstack([self.values, np.ones(n_new)])
+        n = self._n
+        if n + n_new > self._cap:
+            cap = max(self._cap * 2, n + n_new, 1024)
+            for name in _COLUMNS:
+                buf = np.empty(cap)
+                buf[:n] = self._bufs[name][:n]
+                self._bufs[name] = buf
+            self._scratch = np.empty((4, cap))
+            self._cap = cap
+        new = slice(n, n + n_new)
+        self._bufs["freq"][new] = 0.0
+        self._bufs["last_access"][new] = t
+        self._bufs["sim_recent"][new] = 0.0
+        self._bufs["birth"][new] = t
+        self._bufs["values"][new] = 1.0
+        self._n = n + n_new
 
     def touch(self, idxs, sim_batch):
         t = time()
@@ -26,15 +61,35 @@ class ValueEstimator:
         self.sim_recent[idxs] = np.clip(sim_batch, 0, 1)
 
     def compute_values(self):
+        # The four features are written as rows of one reusable (4, n) block and
+        # normalized together, so each step is one NumPy call for all of them.
         t = time()
-        age = np.clip(t - self.birth, 1.0, None)
-        recency = 1.0 / np.clip(t - self.last_access, 1.0, None)
-        V = (self.alpha*self._norm(self.freq) +
-             self.beta*self._norm(recency) +
-             self.gamma*self._norm(self.sim_recent) -
-             self.delta*self._norm(age))
-        self.values = np.clip(V, 0.0, None)
-        return self.values
+        n = self._n
+        if n == 0:
+            return self.values
+        S = self._scratch[:, :n]
+        S[0] = self.freq
+        # recency = 1 / max(t - last_access, 1)
+        np.subtract(t, self.last_access, out=S[1])
+        np.maximum(S[1], 1.0, out=S[1])
+        np.reciprocal(S[1], out=S[1])
+        S[2] = self.sim_recent
+        # age = max(t - birth, 1)
+        np.subtract(t, self.birth, out=S[3])
+        np.maximum(S[3], 1.0, out=S[3])
+
+        # per-row _norm: (x - p1) / (p99 - p1) clipped to [0, 1]; flat rows -> 0
+        lo, hi = np.percentile(S, [1, 99], axis=1)
+        span = hi - lo
+        scale = np.divide(1.0, span, out=np.zeros_like(span), where=span > 0)
+        S -= lo[:, None]
+        S *= scale[:, None]
+        np.clip(S, 0, 1, out=S)
+
+        weights = np.array([self.alpha, self.beta, self.gamma, -self.delta])
+        V = self.values
+        np.maximum(weights @ S, 0.0, out=V)
+        return V
 
     def decay(self, dt=None):
         if dt is None: dt = 86400.0  # default daily decay if called once/day
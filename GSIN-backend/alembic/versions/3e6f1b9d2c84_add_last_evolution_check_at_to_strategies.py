@@ -0,0 +1,27 @@
+"""add_last_evolution_check_at_to_strategies
+
+Revision ID: 3e6f1b9d2c84
+Revises: f19c3d7b8a26
+Create Date: 2026-10-17 21:04:18.552310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e6f1b9d2c84'
+down_revision: Union[str, None] = 'f19c3d7b8a26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Set by every evolution visit; strategies skipped without a backtest sort behind the rest
+    op.add_column('user_strategies', sa.Column('last_evolution_check_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('user_strategies', 'last_evolution_check_at')
@@ -0,0 +1,27 @@
+"""add_user_strategies_evolution_index
+
+Revision ID: 5d3c8e1f4a27
+Revises: e30aeaee520b
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d3c8e1f4a27'
+down_revision: Union[str, None] = 'e30aeaee520b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Evolution worker selects active, non-discarded strategies ranked by last_backtest_at
+    op.create_index('ix_user_strategies_evolution', 'user_strategies', ['is_active', 'status', 'last_backtest_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_strategies_evolution', table_name='user_strategies')
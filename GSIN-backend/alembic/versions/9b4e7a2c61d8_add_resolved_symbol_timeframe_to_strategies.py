@@ -0,0 +1,55 @@
+"""add_resolved_symbol_timeframe_to_strategies
+
+Revision ID: 9b4e7a2c61d8
+Revises: 5d3c8e1f4a27
+Create Date: 2026-10-17 14:03:27.551920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4e7a2c61d8'
+down_revision: Union[str, None] = '5d3c8e1f4a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _resolve(ruleset):
+    # Same defaults as the evolution worker (AAPL, 1d)
+    ruleset = ruleset or {}
+    symbol = ruleset.get("ticker") or ruleset.get("symbol") or ruleset.get("default_symbol", "AAPL")
+    if isinstance(symbol, list):
+        symbol = symbol[0] if symbol else "AAPL"
+    return symbol, ruleset.get("timeframe", "1d")
+
+
+def upgrade() -> None:
+    op.add_column('user_strategies', sa.Column('symbol_resolved', sa.String(length=32), nullable=True))
+    op.add_column('user_strategies', sa.Column('timeframe_resolved', sa.String(length=16), nullable=True))
+    
+    # Backfill from the existing rulesets
+    strategies = sa.table(
+        'user_strategies',
+        sa.column('id', sa.String),
+        sa.column('ruleset', sa.JSON),
+        sa.column('symbol_resolved', sa.String),
+        sa.column('timeframe_resolved', sa.String),
+    )
+    conn = op.get_bind()
+    rows = conn.execute(sa.select(strategies.c.id, strategies.c.ruleset)).fetchall()
+    for strategy_id, ruleset in rows:
+        symbol, timeframe = _resolve(ruleset)
+        conn.execute(
+            strategies.update()
+            .where(strategies.c.id == strategy_id)
+            .values(symbol_resolved=str(symbol)[:32], timeframe_resolved=str(timeframe)[:16])
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('user_strategies', 'timeframe_resolved')
+    op.drop_column('user_strategies', 'symbol_resolved')
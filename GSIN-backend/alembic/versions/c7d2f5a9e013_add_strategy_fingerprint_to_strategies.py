@@ -0,0 +1,46 @@
+"""add_strategy_fingerprint_to_strategies
+
+Revision ID: c7d2f5a9e013
+Revises: 9b4e7a2c61d8
+Create Date: 2026-10-17 16:21:08.304117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.strategy_engine.strategy_fingerprint import create_strategy_fingerprint
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2f5a9e013'
+down_revision: Union[str, None] = '9b4e7a2c61d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user_strategies', sa.Column('strategy_fingerprint', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_user_strategies_strategy_fingerprint'), 'user_strategies', ['strategy_fingerprint'], unique=False)
+    
+    # Backfill from the existing rulesets
+    strategies = sa.table(
+        'user_strategies',
+        sa.column('id', sa.String),
+        sa.column('ruleset', sa.JSON),
+        sa.column('strategy_fingerprint', sa.String),
+    )
+    conn = op.get_bind()
+    rows = conn.execute(sa.select(strategies.c.id, strategies.c.ruleset)).fetchall()
+    for strategy_id, ruleset in rows:
+        conn.execute(
+            strategies.update()
+            .where(strategies.c.id == strategy_id)
+            .values(strategy_fingerprint=create_strategy_fingerprint(ruleset or {}))
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_user_strategies_strategy_fingerprint'), table_name='user_strategies')
+    op.drop_column('user_strategies', 'strategy_fingerprint')
@@ -0,0 +1,38 @@
+"""add_total_trades_index_to_strategies
+
+Revision ID: e4a81b6d3f52
+Revises: c7d2f5a9e013
+Create Date: 2026-10-17 17:02:44.918365
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a81b6d3f52'
+down_revision: Union[str, None] = 'c7d2f5a9e013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Expression index for the monitoring worker's trade-count gate; matches
+    # the CAST(... ->> 'total_trades' AS FLOAT) SQLAlchemy emits for as_float()
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.create_index(
+        'ix_user_strategies_active_total_trades',
+        'user_strategies',
+        [sa.text("(CAST(last_backtest_results ->> 'total_trades' AS FLOAT))")],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_user_strategies_active_total_trades', table_name='user_strategies')
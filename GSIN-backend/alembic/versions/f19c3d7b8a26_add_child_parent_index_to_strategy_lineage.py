@@ -0,0 +1,29 @@
+"""add_child_parent_index_to_strategy_lineage
+
+Revision ID: f19c3d7b8a26
+Revises: e4a81b6d3f52
+Create Date: 2026-10-17 18:11:52.407613
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f19c3d7b8a26'
+down_revision: Union[str, None] = 'e4a81b6d3f52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_strategy_lineage_child_parent', 'strategy_lineage', ['child_strategy_id', 'parent_strategy_id'], unique=False)
+    # Covered by the composite index's leading column
+    op.drop_index(op.f('ix_strategy_lineage_child_strategy_id'), table_name='strategy_lineage')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_strategy_lineage_child_strategy_id'), 'strategy_lineage', ['child_strategy_id'], unique=False)
+    op.drop_index('ix_strategy_lineage_child_parent', table_name='strategy_lineage')
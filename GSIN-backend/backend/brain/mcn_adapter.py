@@ -51,6 +51,23 @@ class MCNAdapter:
     MCN_DIM = 32
     FIXED_DIM = 32  # Alias for backward compatibility
     
+    # PHASE E: Event type -> MCN category (unknown event types are not recorded)
+    EVENT_TYPE_TO_CATEGORY = {
+        "market_snapshot": "regime",
+        "regime_detected": "regime",
+        "strategy_backtest": "strategy",
+        "strategy_mutated": "strategy",
+        "strategy_created": "strategy",
+        "user_action": "user",
+        "user_preference": "user",
+        "user_risk_update": "user",
+        "market_pattern": "market",
+        "market_context": "market",
+        "trade_executed": "trade",
+        "trade_signal": "trade",
+        "signal_generated": "trade",
+    }
+    
     def _fix_dim(self, vector: np.ndarray, target_dim: int = None) -> np.ndarray:
         """
         PHASE: Fix vector dimension to target_dim (default: MCN_DIM = 32).
@@ -513,23 +530,7 @@ class MCNAdapter:
             }
             
             # PHASE E: Route event to correct MCN category using explicit mapping
-            EVENT_TYPE_TO_CATEGORY = {
-                "market_snapshot": "regime",
-                "regime_detected": "regime",
-                "strategy_backtest": "strategy",
-                "strategy_mutated": "strategy",
-                "strategy_created": "strategy",
-                "user_action": "user",
-                "user_preference": "user",
-                "user_risk_update": "user",
-                "market_pattern": "market",
-                "market_context": "market",
-                "trade_executed": "trade",
-                "trade_signal": "trade",
-                "signal_generated": "trade",
-            }
-            
-            category = EVENT_TYPE_TO_CATEGORY.get(event_type)
+            category = self.EVENT_TYPE_TO_CATEGORY.get(event_type)
             if not category:
                 # Unknown event type: silently ignore or log at debug only
                 import logging
@@ -650,6 +651,75 @@ class MCNAdapter:
             traceback.print_exc()
             return False
     
+    def record_events(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Record a batch of events in MCN.
+        
+        Each event is a dict of record_event's arguments (event_type, payload,
+        and optionally user_id / strategy_id). Events are added to each MCN
+        category in one call, and each touched category is saved once per batch
+        instead of every 10 events.
+        
+        Args:
+            events: Events to record
+        
+        Returns:
+            Number of events recorded
+        """
+        if not self.is_available or not events:
+            return 0
+        
+        import logging
+        logger = logging.getLogger(__name__)
+        
+        # category -> (vectors, metas)
+        batches: Dict[str, tuple] = {}
+        for event in events:
+            event_type = event.get("event_type")
+            payload = event.get("payload") or {}
+            category = self.EVENT_TYPE_TO_CATEGORY.get(event_type)
+            if not category or getattr(self, f"mcn_{category}", None) is None:
+                logger.debug("PHASE E: No MCN for event_type=%s (skipping)", event_type)
+                continue
+            try:
+                vector = self._fix_dim(self._event_to_vector(event_type, payload), self.MCN_DIM)
+            except Exception as e:
+                logger.debug("MCN event vectorization failed: %s", type(e).__name__)
+                continue
+            vectors, metas = batches.setdefault(category, ([], []))
+            vectors.append(vector)
+            metas.append({
+                "event_type": event_type,
+                "user_id": event.get("user_id"),
+                "strategy_id": event.get("strategy_id"),
+                "payload": payload,
+                "timestamp": payload.get("timestamp"),
+            })
+        
+        recorded = 0
+        for category, (vectors, metas) in batches.items():
+            target_mcn = getattr(self, f"mcn_{category}")
+            event_batch = np.vstack(vectors).astype(np.float32)
+            with self.thread_lock:
+                try:
+                    target_mcn.add(event_batch, meta_batch=metas)
+                except Exception as e:
+                    # HEAP CORRUPTION FIX: native errors must not escape
+                    logger.debug("MCN batch add() failed for %s: %s", category, type(e).__name__)
+                    continue
+            recorded += len(metas)
+            
+            if self.storage_path:
+                try:
+                    category_path = os.path.join(self.storage_path, f"mcn_{category}")
+                    os.makedirs(category_path, exist_ok=True)
+                    with self.thread_lock:
+                        target_mcn.save(os.path.join(category_path, "mcn_state.npz"))
+                except Exception as e:
+                    print(f"⚠️  PHASE E: Failed to save MCN {category} state: {e}")
+        
+        return recorded
+    
     def get_memory_for_strategy(
         self,
         strategy_id: str,
@@ -1146,11 +1216,16 @@ class MCNAdapter:
     def get_strategy_lineage_memory(
         self,
         strategy_id: str,
-        db: Optional[Any] = None
+        db: Optional[Any] = None,
+        memory_cache: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Provide context about strategy lineage and family tree.
         
+        Args:
+            memory_cache: Optional dict reused across calls (e.g. for one
+                monitoring cycle) so shared ancestors' memory is fetched once
+        
         Returns:
             {
                 "generation": 2,
@@ -1213,7 +1288,11 @@ class MCNAdapter:
                     
                     for ancestor in ancestors:
                         aid = ancestor["strategy_id"]
-                        memory = self.get_memory_for_strategy(aid, limit=10)
+                        memory = memory_cache.get(aid) if memory_cache is not None else None
+                        if memory is None:
+                            memory = self.get_memory_for_strategy(aid, limit=10)
+                            if memory_cache is not None:
+                                memory_cache[aid] = memory
                         patterns = memory.get("historical_patterns", [])
                         
                         if patterns:
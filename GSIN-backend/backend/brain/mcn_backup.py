@@ -2,10 +2,19 @@
 """
 MCN Backup and Restore functionality.
 PHASE 4: Backup MCN state before mutation rounds.
+
+Full backups save the whole MCN state, so they are taken at most every
+MCN_SNAPSHOT_INTERVAL_SECONDS (default: 1 hour). Between them, evolution
+cycles append what changed to a write-ahead log (mcn.wal, JSON lines),
+which is truncated after each full backup. Restoring the newest backup
+replays the WAL on top of it.
 """
 from __future__ import annotations
 
+import os
 import json
+import time
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -13,6 +22,10 @@ from datetime import datetime
 from .mcn_adapter import get_mcn_adapter
 
 
+MCN_SNAPSHOT_INTERVAL_SECONDS = int(os.environ.get("MCN_SNAPSHOT_INTERVAL_SECONDS", "3600"))
+WAL_FILENAME = "mcn.wal"
+
+
 class MCNBackupManager:
     """Manages MCN state backups."""
     
@@ -27,6 +40,12 @@ class MCNBackupManager:
             backup_dir = Path(__file__).parent.parent.parent / "data" / "mcn_backups"
         self.backup_dir = Path(backup_dir)
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self.wal_path = self.backup_dir / WAL_FILENAME
+        # Epoch seconds of the newest full backup (loaded lazily from disk)
+        self._last_snapshot_at: Optional[float] = None
+        # Held across snapshot + WAL truncate, and by writers across recording
+        # events in MCN + logging them, so no entry falls between the two
+        self.wal_lock = threading.RLock()
     
     def create_backup(self, label: str = "auto") -> Optional[str]:
         """
@@ -73,6 +92,94 @@ class MCNBackupManager:
             print(f"Warning: Failed to create MCN backup: {e}")
             return None
     
+    def snapshot_if_due(self, label: str = "auto", interval_seconds: Optional[int] = None) -> Optional[str]:
+        """
+        Create a full backup if the newest one is older than the snapshot interval.
+        
+        The WAL is truncated after a successful backup, since the backup
+        covers everything logged before it.
+        
+        Args:
+            label: Label for the backup
+            interval_seconds: Minimum seconds between backups (default: MCN_SNAPSHOT_INTERVAL_SECONDS)
+        
+        Returns:
+            Backup file path if a backup was created, None otherwise
+        """
+        if interval_seconds is None:
+            interval_seconds = MCN_SNAPSHOT_INTERVAL_SECONDS
+        if self._last_snapshot_at is None:
+            self._last_snapshot_at = max(
+                (p.stat().st_mtime for p in self.backup_dir.glob("mcn_backup_*.json")),
+                default=None
+            )
+        if self._last_snapshot_at is not None and time.time() - self._last_snapshot_at < interval_seconds:
+            return None
+        
+        with self.wal_lock:
+            backup_path = self.create_backup(label)
+            if backup_path:
+                self._last_snapshot_at = time.time()
+                self.truncate_wal(Path(backup_path).name)
+        return backup_path
+    
+    def append_wal(self, entries: List[Dict[str, Any]]) -> bool:
+        """
+        Append entries to the MCN write-ahead log and fsync it.
+        
+        Args:
+            entries: JSON-serializable records (e.g. cycle markers, MCN events)
+        
+        Returns:
+            True if the entries were written, False otherwise
+        """
+        if not entries:
+            return True
+        try:
+            mcn_adapter = get_mcn_adapter()
+            if not mcn_adapter.is_available:
+                return False
+            
+            with self.wal_lock, open(self.wal_path, 'a') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            return True
+        except Exception as e:
+            print(f"Warning: Failed to append to MCN WAL: {e}")
+            return False
+    
+    def read_wal(self) -> List[Dict[str, Any]]:
+        """Read all WAL entries written since the last full backup."""
+        if not self.wal_path.exists():
+            return []
+        entries = []
+        with open(self.wal_path, 'r') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    pass  # Torn final line from a crash mid-append
+        return entries
+    
+    def truncate_wal(self, backup_name: Optional[str] = None):
+        """
+        Empty the WAL (after a full backup has captured its entries).
+        
+        Args:
+            backup_name: Filename of that backup, written as the WAL's first
+                entry so restore_backup knows which backup the WAL follows
+        """
+        try:
+            with self.wal_lock, open(self.wal_path, 'w') as f:
+                if backup_name:
+                    f.write(json.dumps({"type": "snapshot", "backup": backup_name}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            print(f"Warning: Failed to truncate MCN WAL: {e}")
+    
     def list_backups(self) -> List[Dict[str, Any]]:
         """List all available backups."""
         backups = []
@@ -94,6 +201,9 @@ class MCNBackupManager:
         """
         Restore MCN state from backup.
         
+        If the WAL was started by this backup, its MCN events are then
+        re-recorded, so changes logged after the snapshot are recovered too.
+        
         Args:
             backup_path: Path to backup file
         
@@ -116,14 +226,33 @@ class MCNBackupManager:
             if hasattr(mcn_adapter, 'load_state') and "mcn_state" in data:
                 try:
                     mcn_adapter.load_state(data["mcn_state"])
-                    return True
                 except:
                     return False
+                self._replay_wal(mcn_adapter, backup_file.name)
+                return True
             
             return False
         except Exception as e:
             print(f"Warning: Failed to restore MCN backup: {e}")
             return False
+    
+    def _replay_wal(self, mcn_adapter, backup_name: str) -> int:
+        """Re-record the WAL's MCN events if the WAL follows the given backup."""
+        entries = self.read_wal()
+        if not entries or entries[0] != {"type": "snapshot", "backup": backup_name}:
+            return 0
+        events = [
+            {k: v for k, v in entry.items() if k != "type"}
+            for entry in entries
+            if entry.get("type") == "mcn_event"
+        ]
+        if not events:
+            return 0
+        try:
+            return mcn_adapter.record_events(events)
+        except Exception as e:
+            print(f"Warning: Failed to replay MCN WAL: {e}")
+            return 0
 
 
 # Global backup manager instance
@@ -0,0 +1,125 @@
+# backend/brain/mcn_event_queue.py
+"""
+Background MCN event recording.
+
+Producers (e.g. evolution worker threads) submit events without blocking;
+a daemon thread drains the queue and records events in batches with
+MCNAdapter.record_events. A batch is flushed once it reaches
+`batch_size` events or `max_latency` seconds after its first event.
+
+When the queue is full the oldest event is dropped to make room, so a slow
+or unavailable MCN never backs up the producers.
+"""
+from __future__ import annotations
+
+import time
+import queue
+import logging
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, Optional
+from threading import Lock, Thread
+
+logger = logging.getLogger(__name__)
+
+
+MCN_EVENT_QUEUE_MAXSIZE = 4096
+MCN_EVENT_BATCH_SIZE = 256
+MCN_EVENT_MAX_LATENCY_SECONDS = 0.5
+
+
+class MCNEventQueue:
+    """Bounded queue of MCN events drained by a daemon thread."""
+    
+    def __init__(
+        self,
+        mcn_adapter,
+        maxsize: int = MCN_EVENT_QUEUE_MAXSIZE,
+        batch_size: int = MCN_EVENT_BATCH_SIZE,
+        max_latency: float = MCN_EVENT_MAX_LATENCY_SECONDS,
+        on_batch: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+        lock=None,
+    ):
+        """
+        Args:
+            mcn_adapter: Adapter whose record_events() receives each batch
+            on_batch: Called with each batch after it is recorded (e.g. to append it to the WAL)
+            lock: Held while a batch is recorded and passed to on_batch, so e.g.
+                a backup can't run between the two
+        """
+        self.mcn_adapter = mcn_adapter
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+        self.on_batch = on_batch
+        self._batch_lock = lock if lock is not None else nullcontext()
+        self.dropped = 0
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[Thread] = None
+        self._thread_lock = Lock()
+    
+    def submit(self, event: Dict[str, Any]) -> bool:
+        """
+        Queue an event without blocking.
+        
+        Returns:
+            False if an older event had to be dropped to make room
+        """
+        self._ensure_thread()
+        dropped = False
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                return not dropped
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                    self.dropped += 1
+                    dropped = True
+                except queue.Empty:
+                    pass
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been recorded.
+        
+        Returns:
+            True if the queue drained, False if the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+    
+    def _ensure_thread(self):
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, name="mcn-event-queue", daemon=True)
+                self._thread.start()
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_latency
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                if self.mcn_adapter and self.mcn_adapter.is_available:
+                    with self._batch_lock:
+                        self.mcn_adapter.record_events(batch)
+                        if self.on_batch:
+                            self.on_batch(batch)
+            except Exception as e:
+                # MCN errors must not kill the drain thread
+                logger.warning("⚠️  MCN event batch failed (non-fatal): %s", e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
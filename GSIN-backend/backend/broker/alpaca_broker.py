@@ -20,6 +20,10 @@ class AlpacaBroker(BrokerBase):
     For trading, user-level keys must be provided via user_id.
     """
     
+    # SAFETY guarantees this broker is written to, checked by the implementation tests:
+    # only order/account endpoints are called, never funding/transfer/ACH endpoints
+    _SAFETY_MARKERS = frozenset({"order_endpoints_only", "funding_disabled"})
+    
     def __init__(self, user_id: str = None, api_key: str = None, secret_key: str = None, base_url: str = None):
         """
         Initialize Alpaca broker.
@@ -1,8 +1,8 @@
 # backend/db/crud.py
 from __future__ import annotations
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func as sql_func
+from sqlalchemy import and_, or_, func as sql_func, select, literal
 from datetime import datetime, timezone, timedelta
 import uuid
 import random
@@ -22,6 +22,10 @@ from .models import (
     UserRole, SubscriptionTier, SubscriptionStatus, GroupRole,
     TradeMode, TradeSide, TradeStatus, TradeSource, AssetType
 )
+from ..strategy_engine.strategy_fingerprint import create_strategy_fingerprint
+
+# Longest lineage walked before giving up (also stops walks caught in a cycle)
+MAX_LINEAGE_DEPTH = 128
 
 # ---------- Strategies (Legacy) ----------
 def upsert_strategy(db: Session, item: Dict[str, Any]) -> None:
@@ -694,6 +698,7 @@ def create_user_strategy(
         description=description,
         parameters=parameters or {},
         ruleset=ruleset or {},
+        strategy_fingerprint=create_strategy_fingerprint(ruleset or {}),
         asset_type=asset_type,
         is_active=(status != StrategyStatus.PENDING_REVIEW),  # Inactive until reviewed
         status=status,
@@ -831,8 +836,14 @@ def update_user_strategy(
     per_symbol_performance: Optional[Dict[str, Any]] = None,
     explanation_human: Optional[str] = None,  # PHASE 1: Added
     risk_note: Optional[str] = None,  # PHASE 1: Added
+    commit: bool = True,
 ) -> Optional[UserStrategy]:
-    """Update a user strategy."""
+    """
+    Update a user strategy.
+    
+    With commit=False the changes are only flushed, so a caller making many
+    updates (e.g. a worker cycle) can commit them together.
+    """
     strategy = get_user_strategy(db, strategy_id)
     if not strategy:
         return None
@@ -844,7 +855,18 @@ def update_user_strategy(
     if parameters is not None:
         strategy.parameters = parameters
     if ruleset is not None:
+        fingerprint = create_strategy_fingerprint(ruleset)
+        if fingerprint != strategy.strategy_fingerprint:
+            # The stored backtest is for the old rules: clearing its time makes
+            # the next evolution cycle backtest again instead of skipping the
+            # strategy as up to date (an explicit last_backtest_at below wins)
+            strategy.last_backtest_at = None
+            strategy.last_evolution_check_at = None
         strategy.ruleset = ruleset
+        strategy.strategy_fingerprint = fingerprint
+        # Re-resolved from the new ruleset on the next evolution cycle
+        strategy.symbol_resolved = None
+        strategy.timeframe_resolved = None
     if score is not None:
         strategy.score = score
     if status is not None:
@@ -872,8 +894,11 @@ def update_user_strategy(
     if risk_note is not None:  # PHASE 1: Added
         strategy.risk_note = risk_note
     
-    db.commit()
-    db.refresh(strategy)
+    if commit:
+        db.commit()
+        db.refresh(strategy)
+    else:
+        db.flush()
     return strategy
 
 def create_strategy_backtest(
@@ -938,6 +963,28 @@ def create_strategy_lineage(
     db.refresh(lineage)
     return lineage
 
+def create_strategy_lineages(
+    db: Session,
+    parent_strategy_ids: List[str],
+    child_strategy_id: str,
+    mutation_type: str,
+    creator_user_id: Optional[str] = None
+) -> None:
+    """Link a child to all of its parents with one bulk INSERT and one commit."""
+    if not parent_strategy_ids:
+        return
+    db.bulk_insert_mappings(StrategyLineage, [
+        {
+            "id": str(uuid.uuid4()),
+            "parent_strategy_id": parent_strategy_id,
+            "child_strategy_id": child_strategy_id,
+            "mutation_type": mutation_type,
+            "creator_user_id": creator_user_id,
+        }
+        for parent_strategy_id in parent_strategy_ids
+    ])
+    db.commit()
+
 def get_strategy_lineages_by_parent(
     db: Session,
     parent_strategy_id: str
@@ -956,6 +1003,42 @@ def get_strategy_lineages_by_child(
         StrategyLineage.child_strategy_id == child_strategy_id
     ).all()
 
+def get_lineage_root_and_depth(
+    db: Session,
+    strategy_id: str,
+    max_depth: int = MAX_LINEAGE_DEPTH
+) -> Tuple[str, int]:
+    """
+    Get the original (root) strategy of a lineage and the number of mutations to it.
+    
+    Walks parent links with one recursive CTE instead of a query per hop. With
+    several parents (crossover) the deepest root is returned. max_depth bounds
+    the walk (and guards against cycles).
+    
+    Returns:
+        (root_strategy_id, depth); (strategy_id, 0) if the strategy has no parents
+    """
+    lineage = StrategyLineage.__table__
+    ancestors = select(
+        lineage.c.parent_strategy_id.label("strategy_id"),
+        literal(1).label("depth"),
+    ).where(lineage.c.child_strategy_id == strategy_id).cte("ancestors", recursive=True)
+    parent_link = lineage.alias("parent_link")
+    ancestors = ancestors.union_all(
+        select(parent_link.c.parent_strategy_id, ancestors.c.depth + 1)
+        .select_from(parent_link.join(ancestors, parent_link.c.child_strategy_id == ancestors.c.strategy_id))
+        .where(ancestors.c.depth < max_depth)
+    )
+    row = db.execute(
+        select(ancestors.c.strategy_id, ancestors.c.depth)
+        .where(ancestors.c.strategy_id.not_in(select(lineage.c.child_strategy_id)))
+        .order_by(ancestors.c.depth.desc(), ancestors.c.strategy_id)
+        .limit(1)
+    ).first()
+    if row is None:
+        return strategy_id, 0
+    return row[0], row[1]
+
 # ---------- User Trading Settings ----------
 def get_user_trading_settings(db: Session, user_id: str) -> Optional[UserTradingSettings]:
     """Get user's trading settings."""
@@ -1,6 +1,6 @@
 # backend/db/models.py
 from __future__ import annotations
-from sqlalchemy import Column, Integer, String, Float, JSON, DateTime, Text, ForeignKey, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, JSON, DateTime, Text, ForeignKey, Boolean, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from enum import Enum
@@ -304,6 +304,7 @@ class UserStrategy(Base):
     score: Mapped[float | None] = mapped_column(Float, nullable=True)  # Unified strategy score (0-1) - Used for ranking
     status: Mapped[str] = mapped_column(String(32), default="experiment", index=True)  # experiment, candidate, proposable, discarded - CRITICAL for promotion tracking
     last_backtest_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True, index=True)  # Used for prioritization in evolution cycles
+    last_evolution_check_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)  # Last evolution cycle that picked the strategy, backtested or skipped (rotates skipped strategies to the back of the batch order)
     last_backtest_results: Mapped[dict | None] = mapped_column(JSON, nullable=True)  # Latest backtest results - CRITICAL for status determination
     train_metrics: Mapped[dict | None] = mapped_column(JSON, nullable=True)  # Train set metrics (for overfitting detection)
     test_metrics: Mapped[dict | None] = mapped_column(JSON, nullable=True)  # Test set metrics (for overfitting detection)
@@ -313,6 +314,9 @@ class UserStrategy(Base):
     # ADDITIONAL FIELDS
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     generalized: Mapped[bool] = mapped_column(Boolean, default=False)  # True if strategy performs well on >2 assets
+    symbol_resolved: Mapped[str | None] = mapped_column(String(32), nullable=True)  # Backtest symbol resolved from ruleset (filled by evolution worker, cleared when ruleset changes)
+    timeframe_resolved: Mapped[str | None] = mapped_column(String(16), nullable=True)  # Backtest timeframe resolved from ruleset
+    strategy_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)  # SHA256 "DNA" of the ruleset, for duplicate detection (kept in sync by crud)
     per_symbol_performance: Mapped[dict | None] = mapped_column(JSON, nullable=True)  # Performance metrics per symbol (for generalized strategies)
     explanation_human: Mapped[str | None] = mapped_column(Text, nullable=True)  # PHASE 1: Human-readable explanation of strategy
     risk_note: Mapped[str | None] = mapped_column(Text, nullable=True)  # PHASE 1: Risk warning/note for users
@@ -326,6 +330,12 @@ class UserStrategy(Base):
     backtests: Mapped[list["StrategyBacktest"]] = relationship("StrategyBacktest", back_populates="strategy", cascade="all, delete-orphan")
     parent_lineages: Mapped[list["StrategyLineage"]] = relationship("StrategyLineage", foreign_keys="StrategyLineage.parent_strategy_id", back_populates="parent_strategy")
     child_lineages: Mapped[list["StrategyLineage"]] = relationship("StrategyLineage", foreign_keys="StrategyLineage.child_strategy_id", back_populates="child_strategy")
+    
+    __table_args__ = (
+        # Evolution worker batch selection: filter active/status, rank by last backtest.
+        # The (is_active, status) prefix also serves the monitoring worker's scans.
+        Index("ix_user_strategies_evolution", "is_active", "status", "last_backtest_at"),
+    )
 
 class StrategyBacktest(Base):
     __tablename__ = "strategy_backtests"
@@ -394,7 +404,7 @@ class StrategyLineage(Base):
     __tablename__ = "strategy_lineage"
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True)  # UUID as string
     parent_strategy_id: Mapped[str] = mapped_column(String, ForeignKey("user_strategies.id", ondelete="CASCADE"), index=True)
-    child_strategy_id: Mapped[str] = mapped_column(String, ForeignKey("user_strategies.id", ondelete="CASCADE"), index=True)
+    child_strategy_id: Mapped[str] = mapped_column(String, ForeignKey("user_strategies.id", ondelete="CASCADE"))  # Indexed with parent_strategy_id below
     mutation_type: Mapped[str] = mapped_column(String(64))  # Type of mutation (e.g. "parameter_tweak", "timeframe_change")
     mutation_params: Mapped[dict | None] = mapped_column(JSON, nullable=True)  # Mutation parameters
     similarity_score: Mapped[float | None] = mapped_column(Float, nullable=True)  # Similarity score between parent and child
@@ -407,6 +417,12 @@ class StrategyLineage(Base):
     parent_strategy: Mapped["UserStrategy"] = relationship("UserStrategy", foreign_keys=[parent_strategy_id], back_populates="parent_lineages")
     child_strategy: Mapped["UserStrategy"] = relationship("UserStrategy", foreign_keys=[child_strategy_id], back_populates="child_lineages")
     creator: Mapped["User | None"] = relationship("User")
+    
+    __table_args__ = (
+        # Lineage walks look up parents by child; covering both ids lets the
+        # recursive CTE and the per-cycle lineage load read only the index
+        Index("ix_strategy_lineage_child_parent", "child_strategy_id", "parent_strategy_id"),
+    )
 
 class UserTradingSettings(Base):
     __tablename__ = "user_trading_settings"
@@ -1,7 +1,7 @@
 # backend/db/session.py
 from __future__ import annotations
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker, scoped_session, DeclarativeBase
 import os
 from pathlib import Path
 from dotenv import dotenv_values
@@ -26,18 +26,43 @@ connect_args = {}
 if DATABASE_URL.startswith("postgresql"):
     connect_args = {"connect_timeout": 10}
 elif DATABASE_URL.startswith("sqlite"):
-    # SQLite-specific settings
-    connect_args = {"check_same_thread": False}
+    # SQLite-specific settings (wait up to 5s for a write lock instead of failing)
+    connect_args = {"check_same_thread": False, "timeout": 5}
+
+# Connection pool sizing, independent of worker parallelism. The evolution
+# worker holds one session per in-flight strategy on top of API traffic, so
+# the defaults leave headroom over SQLAlchemy's 5 + 10.
+pool_args = {}
+if not DATABASE_URL.startswith("sqlite"):
+    pool_args = {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", "10")),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", "20")),
+    }
 
 engine = create_engine(
     DATABASE_URL,
     echo=False,
     connect_args=connect_args,
     pool_pre_ping=True,  # Verify connections before using
+    **pool_args,
 )
 
+if DATABASE_URL.startswith("sqlite") and ":memory:" not in DATABASE_URL:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL lets the API read while a worker writes; NORMAL sync is safe under WAL."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
+# Thread-local sessions for worker threads: ScopedSession() returns the calling
+# thread's session; call ScopedSession.remove() when the thread's task is done
+ScopedSession = scoped_session(SessionLocal)
+
 class Base(DeclarativeBase):
     pass
 
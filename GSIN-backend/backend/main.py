@@ -63,7 +63,7 @@ from backend.middleware.royalty_lock import RoyaltyLockMiddleware  # PHASE 4: Ro
 from backend.db.session import engine, get_db
 from backend.db.models import Base, UserStrategy
 from backend.db.session import SessionLocal
-from backend.workers.evolution_worker import run_evolution_worker_loop, EvolutionWorker
+from backend.workers.evolution_worker import EvolutionWorker
 from backend.strategy_engine.seed_loader import load_seed_strategies
 from pathlib import Path
 import threading
@@ -207,39 +207,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         log(f"[GSIN] Cache prewarming failed: {e}")
     
-    # Start evolution worker in background thread
-    def start_evolution_worker():
-        """Start evolution worker in a separate thread with auto-restart on crash."""
-        while True:
-            try:
-                log("[GSIN] Starting evolution worker...")
-                run_evolution_worker_loop()
-            except Exception as e:
-                log(f"[GSIN] Evolution worker crashed: {e}")
-                import traceback
-                traceback.print_exc()
-                log("[GSIN] Evolution worker will restart in 60 seconds...")
-                import time
-                time.sleep(60)  # Wait 60 seconds before restarting
-    
-    evolution_thread = threading.Thread(target=start_evolution_worker, daemon=True)
-    evolution_thread.start()
-    log("[GSIN] Evolution worker thread started")
-    
-    # Start Monitoring Worker
-    def start_monitoring_worker():
-        """Start the monitoring worker in a background thread."""
-        from backend.workers.monitoring_worker import run_monitoring_worker_loop
-        run_monitoring_worker_loop()
-    
-    monitoring_thread = threading.Thread(target=start_monitoring_worker, daemon=True)
-    monitoring_thread.start()
-    log("[GSIN] Monitoring worker thread started")
+    # Evolution and monitoring workers run as tasks on the app's event loop
+    # (each cycle in a worker thread), instead of a sleeping thread apiece
+    from backend.workers.scheduler import start_background_workers, stop_background_workers
+    worker_tasks = start_background_workers()
+    log("[GSIN] Evolution and monitoring workers scheduled")
     
     yield  # App is running
     
-    # Shutdown (if needed)
-    # Evolution worker thread is daemon, so it will exit when main process exits
+    await stop_background_workers(worker_tasks)
 
 
 def create_app() -> FastAPI:
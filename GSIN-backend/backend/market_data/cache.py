@@ -5,7 +5,7 @@ PRODUCTION-READY: Multi-layer cache for market data.
 - File cache for persistence
 - TTL-based expiration
 """
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 from datetime import datetime, timedelta
 from threading import Lock
 from pathlib import Path
@@ -22,7 +22,18 @@ class MarketDataCache:
     - TTL-based expiration (60s for live, 1h for historical)
     """
     
-    def __init__(self, max_size: int = 1000, cache_dir: str = "./cache"):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        cache_dir: str = "./cache",
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        """
+        Args:
+            clock: Returns the current time for stamping and aging entries
+                (injectable so tests can advance time without sleeping)
+        """
+        self._clock = clock
         self._cache: Dict[str, Dict[str, Any]] = {}
         self._lock = Lock()
         self._max_size = max_size
@@ -72,7 +83,7 @@ class MarketDataCache:
                 cached_at = entry.get("cached_at")
                 
                 if cached_at is not None:
-                    age = (datetime.now() - cached_at).total_seconds()
+                    age = (self._clock() - cached_at).total_seconds()
                     if age <= ttl_seconds:
                         # Update access order for LRU
                         if key in self._access_order:
@@ -96,7 +107,7 @@ class MarketDataCache:
                     # Restore to memory cache
                     self._cache[key] = {
                         "value": file_value,
-                        "cached_at": datetime.now()
+                        "cached_at": self._clock()
                     }
                     if key not in self._access_order:
                         self._access_order.append(key)
@@ -141,7 +152,7 @@ class MarketDataCache:
             # Store in memory
             self._cache[key] = {
                 "value": value,
-                "cached_at": datetime.now()
+                "cached_at": self._clock()
             }
             
             # Update access order
@@ -193,7 +204,7 @@ class MarketDataCache:
                 data = json.load(f)
             
             cached_at = datetime.fromisoformat(data.get("cached_at", ""))
-            age = (datetime.now() - cached_at).total_seconds()
+            age = (self._clock() - cached_at).total_seconds()
             
             if age > ttl_seconds:
                 # Expired, delete file
@@ -218,7 +229,7 @@ class MarketDataCache:
             with open(cache_file, 'w') as f:
                 json.dump({
                     "value": value,
-                    "cached_at": datetime.now().isoformat(),
+                    "cached_at": self._clock().isoformat(),
                     "key": key
                 }, f, default=str)
         except Exception:
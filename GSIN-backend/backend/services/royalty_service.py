@@ -157,34 +157,25 @@ class RoyaltyService:
     
     def _find_original_strategy(self, strategy_id: str, db: Session) -> str:
         """Find original strategy by traversing lineage backwards."""
-        from ..db.models import StrategyLineage
-        parent_lineages = db.query(StrategyLineage).filter(
-            StrategyLineage.child_strategy_id == strategy_id
-        ).all()
-        
-        if not parent_lineages:
-            # This is the original
-            return strategy_id
-        
-        # Recursively find original
-        parent_id = parent_lineages[0].parent_strategy_id
-        return self._find_original_strategy(parent_id, db)
+        current_id = strategy_id
+        for _ in range(crud.MAX_LINEAGE_DEPTH):
+            parent_lineages = crud.get_strategy_lineages_by_child(db, current_id)
+            if not parent_lineages:
+                # This is the original
+                break
+            current_id = parent_lineages[0].parent_strategy_id
+        return current_id
     
     def _count_mutations_from_original(self, original_strategy_id: str, current_strategy_id: str, db: Session) -> int:
         """Count number of mutations from original strategy."""
-        if original_strategy_id == current_strategy_id:
-            return 0
-        
-        from ..db.models import StrategyLineage
-        parent_lineages = db.query(StrategyLineage).filter(
-            StrategyLineage.child_strategy_id == current_strategy_id
-        ).all()
-        
-        if not parent_lineages:
-            return 0
-        
-        parent_id = parent_lineages[0].parent_strategy_id
-        return 1 + self._count_mutations_from_original(original_strategy_id, parent_id, db)
+        count = 0
+        while current_strategy_id != original_strategy_id and count < crud.MAX_LINEAGE_DEPTH:
+            parent_lineages = crud.get_strategy_lineages_by_child(db, current_strategy_id)
+            if not parent_lineages:
+                break
+            current_strategy_id = parent_lineages[0].parent_strategy_id
+            count += 1
+        return count
 
 
 # Singleton instance
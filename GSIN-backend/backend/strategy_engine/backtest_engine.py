@@ -3,10 +3,13 @@
 Backtesting engine for strategies.
 Uses market data to simulate strategy execution and calculate metrics.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
+from threading import Lock
 import statistics
 
+import numpy as np
+
 from ..market_data.types import CandleData
 from ..market_data.market_data_provider import get_historical_provider
 # TWELVE DATA INTEGRATION: Backtest engine uses historical provider (Twelve Data PRIMARY)
@@ -15,6 +18,59 @@ from .indicators import IndicatorCalculator
 from .ruleset_parser import RulesetParser
 from .constants import DEFAULT_SYMBOLS, MIN_ASSETS_FOR_GENERALIZATION, GENERALIZATION_WINRATE_THRESHOLD
 from .backtest_constants import get_required_candles
+from .ohlcv_cache import get_ohlcv_cache
+from .ratelimit import TokenBucket, TWELVE_DATA_BUCKET
+
+
+# Trading-day schedule per calendar year (weekdays; holidays are not modelled),
+# shared by all backtest threads and sliced per backtest window
+_SCHEDULE_CACHE: Dict[int, np.ndarray] = {}
+_schedule_lock = Lock()
+
+
+def _get_year_schedule(year: int) -> np.ndarray:
+    """Get the sorted trading days (datetime64[D]) of a calendar year."""
+    schedule = _SCHEDULE_CACHE.get(year)
+    if schedule is None:
+        # Lock only on a miss; reads of a filled entry never block
+        with _schedule_lock:
+            schedule = _SCHEDULE_CACHE.get(year)
+            if schedule is None:
+                days = np.arange(f"{year}-01-01", f"{year + 1}-01-01", dtype="datetime64[D]")
+                schedule = days[np.is_busday(days)]
+                _SCHEDULE_CACHE[year] = schedule
+    return schedule
+
+
+def count_trading_days(start_date: datetime, end_date: datetime) -> int:
+    """Count trading days in [start_date, end_date)."""
+    start = np.datetime64(start_date.date(), "D")
+    end = np.datetime64(end_date.date(), "D")
+    total = 0
+    for year in range(start_date.year, end_date.year + 1):
+        schedule = _get_year_schedule(year)
+        total += int(np.searchsorted(schedule, end) - np.searchsorted(schedule, start))
+    return max(total, 0)
+
+
+def get_candle_limit(timeframe: str, start_date: datetime, end_date: datetime) -> int:
+    """Get the number of candles to request for a backtest window (100-5000)."""
+    days_diff = (end_date - start_date).days
+    # Trading days in the window, sliced from the cached yearly schedule
+    trading_days = count_trading_days(start_date, end_date)
+    
+    # Request maximum realistic history (up to 5000 for Twelve Data)
+    if timeframe == "1d":
+        limit = max(min(trading_days + 100, 5000), 350)  # At least 350 for 1d
+    elif timeframe == "1h":
+        limit = min(trading_days * 6.5 + 100, 5000)  # ~6.5 hours per trading day
+    elif timeframe in ["15m", "30m"]:
+        limit = min(trading_days * 26 + 200, 5000)  # ~26 15-min periods per trading day
+    else:
+        limit = min(days_diff * 2 + 100, 5000)
+    
+    # Ensure we request at least 100 candles for meaningful backtest
+    return int(max(limit, 100))
 
 
 class BacktestEngine:
@@ -42,7 +98,8 @@ class BacktestEngine:
         user_risk_profile: Optional[Dict[str, Any]] = None,
         confidence: Optional[float] = None,
         strategy_risk_score: Optional[float] = None,
-        unlimited_capital_mode: bool = True  # Default to unlimited for Brain research
+        unlimited_capital_mode: bool = True,  # Default to unlimited for Brain research
+        ohlcv_cache: Optional[Dict[Tuple[str, str], List[CandleData]]] = None
     ) -> Dict[str, Any]:
         """
         Run a backtest for a strategy with rolling walk-forward analysis for true stability validation.
@@ -58,6 +115,8 @@ class BacktestEngine:
             end_date: Backtest end date
             train_test_split: Fraction of data for training (default 0.7 = 70% train, 30% test)
             use_rolling_walkforward: If True, use rolling walk-forward instead of simple split
+            ohlcv_cache: Optional candles already fetched for this date range, keyed by
+                (symbol, timeframe); a hit skips the network fetch
         
         Returns:
             Dictionary with backtest results including:
@@ -133,27 +192,14 @@ class BacktestEngine:
         ruleset = normalized_ruleset
         
         # TWELVE DATA INTEGRATION: Request maximum history (up to 5000 candles)
-        # Calculate number of candles needed (accounting for weekends/holidays)
-        days_diff = (end_date - start_date).days
-        # Estimate trading days (roughly 70% of calendar days are trading days)
-        estimated_trading_days = int(days_diff * 0.7)
+        limit = get_candle_limit(timeframe, start_date, end_date)
         
-        # Request maximum realistic history from Twelve Data
-        if timeframe == "1d":
-            # For daily, request up to 5000 candles (~20 years of trading days)
-            limit = min(estimated_trading_days + 100, 5000)
-        elif timeframe == "1h":
-            limit = min(estimated_trading_days * 6.5 + 100, 5000)  # ~6.5 hours per trading day
-        elif timeframe in ["15m", "30m"]:
-            limit = min(estimated_trading_days * 26 + 200, 5000)  # ~26 15-min periods per trading day
+        # Fetch candles (reuse the caller's prefetched candles when available)
+        cached_candles = ohlcv_cache.get((symbol, timeframe)) if ohlcv_cache else None
+        if cached_candles is not None:
+            candles = list(cached_candles)
         else:
-            limit = min(days_diff * 2 + 100, 5000)
-        
-        # Ensure we request at least 100 candles for meaningful backtest
-        limit = max(limit, 100)
-        
-        # Fetch candles
-        candles = self._fetch_candles(symbol, timeframe, limit, start_date, end_date)
+            candles = self._fetch_candles(symbol, timeframe, limit, start_date, end_date)
         
         # Defensive check: ensure candles is never None
         if candles is None:
@@ -458,32 +504,44 @@ class BacktestEngine:
         try:
             from ..market_data.market_data_provider import call_with_fallback
             
-            # Calculate limit based on date range - request maximum history
-            days_diff = (end_date - start_date).days
-            estimated_trading_days = int(days_diff * 0.7)
+            # Prefetch callers pass 0 and get the same limit run_backtest would request
+            if limit <= 0:
+                limit = get_candle_limit(timeframe, start_date, end_date)
             
-            # Request maximum realistic history (up to 5000 for Twelve Data)
-            # For 1d timeframe, ensure we request at least 350 candles (recommended minimum)
-            if timeframe == "1d":
-                limit = max(min(estimated_trading_days + 100, 5000), 350)  # At least 350 for 1d
-            elif timeframe == "1h":
-                limit = min(estimated_trading_days * 6.5 + 100, 5000)
-            elif timeframe in ["15m", "30m"]:
-                limit = min(estimated_trading_days * 26 + 200, 5000)
+            disk_cache = get_ohlcv_cache()
+            if disk_cache is None:
+                # Use call_with_fallback which goes through request queue
+                TWELVE_DATA_BUCKET.acquire()
+                all_candles = call_with_fallback(
+                    "get_candles",
+                    symbol,
+                    timeframe,
+                    limit=limit,
+                    start=start_date,
+                    end=end_date
+                )
             else:
-                limit = min(days_diff * 2 + 100, 5000)
-            
-            limit = max(limit, 100)  # Minimum 100 candles for other timeframes
-            
-            # Use call_with_fallback which goes through request queue
-            all_candles = call_with_fallback(
-                "get_candles",
-                symbol,
-                timeframe,
-                limit=limit,
-                start=start_date,
-                end=end_date
-            )
+                # Reuse completed bars from the disk cache; only the missing tail is requested
+                with disk_cache.key_lock(symbol, timeframe):
+                    all_candles = disk_cache.get(symbol, timeframe, limit)
+                    if all_candles is None:
+                        missing = disk_cache.missing_bars(symbol, timeframe, limit)
+                        TWELVE_DATA_BUCKET.acquire()
+                        fetched = call_with_fallback(
+                            "get_candles",
+                            symbol,
+                            timeframe,
+                            limit=limit if missing is None else missing,
+                            start=start_date,
+                            end=end_date
+                        )
+                        if isinstance(fetched, list) and fetched:
+                            all_candles = disk_cache.update(symbol, timeframe, fetched, limit, full_fetch=missing is None)
+                        elif missing is not None:
+                            # Refresh failed - fall back to the last cached bars
+                            all_candles = disk_cache.get(symbol, timeframe, limit, allow_stale=True)
+                        else:
+                            all_candles = fetched
             
             # Defensive check: ensure all_candles is never None
             if all_candles is None:
@@ -1014,7 +1072,8 @@ class BacktestEngine:
         timeframe: str,
         start_date: datetime,
         end_date: datetime,
-        symbols: Optional[List[str]] = None
+        symbols: Optional[List[str]] = None,
+        ohlcv_cache: Optional[Dict[Tuple[str, str], List[CandleData]]] = None
     ) -> Dict[str, Any]:
         """
         Execute backtest across multiple assets to test strategy generalization.
@@ -1025,6 +1084,7 @@ class BacktestEngine:
             start_date: Backtest start date
             end_date: Backtest end date
             symbols: List of symbols to test (defaults to DEFAULT_SYMBOLS)
+            ohlcv_cache: Optional prefetched candles keyed by (symbol, timeframe)
         
         Returns:
             Dictionary with:
@@ -1052,7 +1112,8 @@ class BacktestEngine:
                     timeframe=timeframe,
                     start_date=start_date,
                     end_date=end_date,
-                    train_test_split=0.7
+                    train_test_split=0.7,
+                    ohlcv_cache=ohlcv_cache
                 )
                 
                 per_symbol_results[symbol] = {
@@ -1151,3 +1212,33 @@ class BacktestEngine:
             "asset_count": len(successful_results),
         }
 
+
+# Process-pool entry points (used by the evolution worker to run backtest math
+# outside the parent's GIL). Each worker process keeps one engine.
+_process_engine: Optional[BacktestEngine] = None
+
+
+def init_backtest_process(bucket: TokenBucket):
+    """
+    Initializer for backtest worker processes.
+    
+    Args:
+        bucket: The parent's Twelve Data token bucket, so every process
+            draws from the one plan-wide budget
+    """
+    global TWELVE_DATA_BUCKET, _process_engine
+    TWELVE_DATA_BUCKET = bucket
+    _process_engine = BacktestEngine()
+
+
+def run_backtest_pure(method: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run BacktestEngine.<method>(**kwargs) in a worker process.
+    
+    Top-level and free of DB/ORM state so it can be pickled to a
+    ProcessPoolExecutor; candles should be passed in via ohlcv_cache.
+    """
+    global _process_engine
+    if _process_engine is None:
+        _process_engine = BacktestEngine()
+    return getattr(_process_engine, method)(**kwargs)
@@ -0,0 +1,55 @@
+# backend/strategy_engine/backtest_pool.py
+"""
+Shared process pool for CPU-bound backtest math.
+
+Used by the evolution and monitoring workers to run BacktestEngine methods
+(via run_backtest_pure) outside the parent's GIL. The pool is module-level,
+so its worker processes are spawned once per process whichever worker
+submits first.
+
+Configuration:
+- EVOLUTION_BACKTEST_PROCESSES: Worker process count (default: CPU count;
+  0 = no pool, backtests run in the calling thread)
+"""
+import os
+import multiprocessing
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+
+from .backtest_engine import init_backtest_process
+from .ratelimit import TWELVE_DATA_BUCKET
+
+
+# Processes for the CPU-bound backtest math (indicators, walk-forward), which
+# threads can't overlap because it holds the GIL (0 = run backtests in the I/O threads)
+EVOLUTION_BACKTEST_PROCESSES = int(os.environ.get("EVOLUTION_BACKTEST_PROCESSES", str(os.cpu_count() or 1)))
+
+_backtest_pool: Optional[ProcessPoolExecutor] = None
+_backtest_pool_lock = Lock()
+
+
+def get_backtest_pool() -> Optional[ProcessPoolExecutor]:
+    """Get the backtest process pool, or None if EVOLUTION_BACKTEST_PROCESSES is 0."""
+    global _backtest_pool
+    if EVOLUTION_BACKTEST_PROCESSES <= 0:
+        return None
+    with _backtest_pool_lock:
+        if _backtest_pool is None:
+            # spawn: forking a process that is running DB and HTTP threads is unsafe
+            _backtest_pool = ProcessPoolExecutor(
+                max_workers=EVOLUTION_BACKTEST_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_backtest_process,
+                initargs=(TWELVE_DATA_BUCKET,),
+            )
+        return _backtest_pool
+
+
+def reset_backtest_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next backtest starts a fresh one."""
+    global _backtest_pool
+    with _backtest_pool_lock:
+        if _backtest_pool is pool:
+            _backtest_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
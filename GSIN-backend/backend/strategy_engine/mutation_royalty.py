@@ -77,12 +77,12 @@ class MutationRoyaltyCalculator:
         Returns:
             MutationDistance with detailed change analysis
         """
-        original_ruleset = original_strategy.get("ruleset", {})
-        mutated_ruleset = mutated_strategy.get("ruleset", {})
+        original_ruleset = original_strategy.get("ruleset") or {}
+        mutated_ruleset = mutated_strategy.get("ruleset") or {}
         
         # Count parameter changes
-        original_params = original_strategy.get("parameters", {})
-        mutated_params = mutated_strategy.get("parameters", {})
+        original_params = original_strategy.get("parameters") or {}
+        mutated_params = mutated_strategy.get("parameters") or {}
         parameter_changes = self._count_parameter_changes(original_params, mutated_params)
         
         # Count rule changes
@@ -140,10 +140,8 @@ class MutationRoyaltyCalculator:
         """Count number of parameter changes."""
         changes = 0
         
-        # Compare all parameters
-        all_params = set(list(original_params.keys()) + list(mutated_params.keys()))
-        
-        for param in all_params:
+        # Compare all parameters (key views union without building lists)
+        for param in original_params.keys() | mutated_params.keys():
             original_val = original_params.get(param)
             mutated_val = mutated_params.get(param)
             
@@ -222,16 +222,14 @@ class MutationVisualizationEngine:
         db: Session
     ) -> Optional[str]:
         """Find original strategy by traversing lineage backwards."""
-        # Get all parent lineages
-        parent_lineages = crud.get_strategy_lineages_by_child(db, strategy_id)
-        
-        if not parent_lineages:
-            # This is the original
-            return strategy_id
-        
-        # Recursively find original
-        parent_id = parent_lineages[0].parent_strategy_id
-        return self._find_original_strategy(parent_id, db)
+        current_id = strategy_id
+        for _ in range(crud.MAX_LINEAGE_DEPTH):
+            parent_lineages = crud.get_strategy_lineages_by_child(db, current_id)
+            if not parent_lineages:
+                # This is the original
+                break
+            current_id = parent_lineages[0].parent_strategy_id
+        return current_id
     
     def _build_mutation_chain(
         self,
@@ -243,7 +241,7 @@ class MutationVisualizationEngine:
         chain = []
         current_id = current_strategy_id
         
-        while current_id != original_strategy_id:
+        while current_id != original_strategy_id and len(chain) < crud.MAX_LINEAGE_DEPTH:
             parent_lineages = crud.get_strategy_lineages_by_child(db, current_id)
             if not parent_lineages:
                 break
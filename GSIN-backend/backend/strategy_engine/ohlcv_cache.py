@@ -0,0 +1,209 @@
+# backend/strategy_engine/ohlcv_cache.py
+"""
+Disk-backed OHLCV cache for backtests.
+
+Completed bars are stored per (symbol, timeframe) so that evolution cycles
+(every 8 minutes) reuse history instead of re-requesting the whole window from
+Twelve Data. A series is refreshed at most once per bar period, and only the
+missing tail is requested.
+
+Configuration:
+- OHLCV_DISK_CACHE: Set to "false" to disable (default: enabled)
+- OHLCV_CACHE_DIR: Cache directory (default: ./cache/ohlcv)
+"""
+import os
+import json
+import time
+import logging
+import tempfile
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+
+from ..market_data.types import CandleData
+
+logger = logging.getLogger(__name__)
+
+
+# Bar length per timeframe, used to decide when a new bar has completed
+BAR_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
+# Extra bars requested on a tail refresh so late corrections overwrite cached bars
+TAIL_OVERLAP_BARS = 5
+# Same cap as the provider request size
+MAX_CACHED_BARS = 5000
+
+
+class OHLCVCache:
+    """Thread-safe file cache of completed OHLCV bars."""
+    
+    def __init__(self, cache_dir: str = "./cache/ohlcv"):
+        self._cache_dir = Path(cache_dir)
+        self._lock = Lock()
+        self._key_locks: Dict[Tuple[str, str], Lock] = {}
+    
+    def _bar_seconds(self, timeframe: str) -> int:
+        return BAR_SECONDS.get(timeframe, 86400)
+    
+    def _period_start(self, timeframe: str, now: Optional[float] = None) -> float:
+        """Start (epoch seconds) of the bar currently in progress."""
+        bar = self._bar_seconds(timeframe)
+        now = time.time() if now is None else now
+        return now - (now % bar)
+    
+    def _path(self, symbol: str, timeframe: str) -> Path:
+        safe_symbol = "".join(c if c.isalnum() else "_" for c in symbol.upper())
+        return self._cache_dir / f"{safe_symbol}_{timeframe}.json"
+    
+    def key_lock(self, symbol: str, timeframe: str) -> Lock:
+        """Lock serializing refreshes of one series (so concurrent callers fetch once)."""
+        with self._lock:
+            return self._key_locks.setdefault((symbol.upper(), timeframe), Lock())
+    
+    def _load(self, symbol: str, timeframe: str) -> Optional[Dict]:
+        path = self._path(symbol, timeframe)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except Exception:
+            return None  # Corrupt entries are refetched
+    
+    def get(self, symbol: str, timeframe: str, limit: int, allow_stale: bool = False) -> Optional[List[CandleData]]:
+        """
+        Get the last `limit` cached bars if the series is current.
+        
+        Args:
+            allow_stale: Return cached bars even if a newer bar has completed
+                (e.g. when the refresh request failed)
+        
+        Returns:
+            Candles (oldest first), or None if the series is missing, stale,
+            or was fetched with a smaller limit
+        """
+        data = self._load(symbol, timeframe)
+        if not data or data.get("depth", 0) < limit:
+            return None
+        if not allow_stale and data.get("fetched_at", 0) < self._period_start(timeframe):
+            return None
+        return self._to_candles(symbol, data["candles"][-limit:])
+    
+    def get_last_bar_ts(self, symbol: str, timeframe: str) -> Optional[float]:
+        """Open time (epoch seconds) of the newest cached completed bar, or None if not cached."""
+        data = self._load(symbol, timeframe)
+        if not data or not data.get("candles"):
+            return None
+        return data["candles"][-1][0]
+    
+    def missing_bars(self, symbol: str, timeframe: str, limit: int) -> Optional[int]:
+        """
+        Number of bars to request to bring a cached series up to date.
+        
+        Returns:
+            Bar count (including overlap), or None if the full `limit` must be fetched
+        """
+        data = self._load(symbol, timeframe)
+        if not data or not data.get("candles") or data.get("depth", 0) < limit:
+            return None
+        last_ts = data["candles"][-1][0]
+        # Bars that completed after the last cached one
+        missing = int((self._period_start(timeframe) - last_ts) // self._bar_seconds(timeframe)) - 1
+        return min(max(missing, 0) + TAIL_OVERLAP_BARS, limit)
+    
+    def update(
+        self,
+        symbol: str,
+        timeframe: str,
+        candles: List[CandleData],
+        limit: int,
+        full_fetch: bool = False
+    ) -> List[CandleData]:
+        """
+        Merge freshly fetched candles into the cached series.
+        
+        The bar still in progress is not stored (or returned), so a series only
+        changes when a bar completes.
+        
+        Args:
+            full_fetch: True if `candles` is a full `limit`-sized request rather
+                than a tail refresh
+        
+        Returns:
+            The last `limit` bars of the merged series (oldest first)
+        """
+        period_start = self._period_start(timeframe)
+        data = self._load(symbol, timeframe) or {}
+        bars = {row[0]: row for row in data.get("candles", [])}
+        for candle in candles:
+            ts = candle.timestamp
+            if ts.tzinfo is None:
+                ts = ts.replace(tzinfo=timezone.utc)
+            ts = ts.timestamp()
+            if ts >= period_start:
+                continue
+            bars[ts] = [ts, candle.open, candle.high, candle.low, candle.close, candle.volume]
+        
+        rows = [bars[ts] for ts in sorted(bars)][-MAX_CACHED_BARS:]
+        # Largest request the cached history is known to satisfy
+        depth = max(limit, data.get("depth", 0)) if full_fetch else data.get("depth", 0)
+        tmp_path = None
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(symbol, timeframe)
+            # A temp file per writer: processes in the backtest pools share the
+            # directory, and a shared temp name lets one truncate another's
+            # file just before it is published
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self._cache_dir, prefix=f"{path.stem}.", suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump({"fetched_at": time.time(), "depth": depth, "candles": rows}, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("⚠️  Failed to write OHLCV cache for %s (%s): %s", symbol, timeframe, e)
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+        
+        return self._to_candles(symbol, rows[-limit:])
+    
+    def _to_candles(self, symbol: str, rows: List[List]) -> List[CandleData]:
+        return [
+            CandleData(
+                symbol=symbol,
+                timestamp=datetime.fromtimestamp(ts, tz=timezone.utc),
+                open=o,
+                high=h,
+                low=l,
+                close=c,
+                volume=int(v),
+            )
+            for ts, o, h, l, c, v in rows
+        ]
+
+
+# Global cache instance
+_ohlcv_cache: Optional[OHLCVCache] = None
+_ohlcv_cache_lock = Lock()
+
+
+def get_ohlcv_cache() -> Optional[OHLCVCache]:
+    """Get the global OHLCV cache, or None if disabled via OHLCV_DISK_CACHE."""
+    global _ohlcv_cache
+    if os.environ.get("OHLCV_DISK_CACHE", "true").lower() == "false":
+        return None
+    with _ohlcv_cache_lock:
+        if _ohlcv_cache is None:
+            _ohlcv_cache = OHLCVCache(os.environ.get("OHLCV_CACHE_DIR", "./cache/ohlcv"))
+        return _ohlcv_cache
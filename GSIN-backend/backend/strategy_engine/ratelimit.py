@@ -0,0 +1,84 @@
+# backend/strategy_engine/ratelimit.py
+"""
+Token bucket rate limiting for historical data requests.
+
+Backtests acquire a token before each Twelve Data request, so concurrent
+workers saturate the plan's credits/min without exceeding it: callers only
+block when the bucket is empty, and bursts up to the bucket capacity go
+through immediately.
+
+The bucket's state lives in shared memory, so the parent process and the
+backtest pool processes it is handed to (see init_backtest_process) draw
+from one budget instead of each getting their own.
+"""
+import time
+import multiprocessing
+from typing import Optional
+
+
+# Twelve Data rate limit (377 credits/min for Grow plan)
+TWELVEDATA_CREDITS_PER_MIN = 377
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at `rate` tokens/second.
+    
+    Safe across threads and processes: tokens and the last refill time are
+    kept in shared memory under a process-shared lock. Like other
+    multiprocessing primitives, a bucket can only be passed to a child
+    process when it is started (e.g. through a pool initializer).
+    """
+    
+    # Longest single sleep while waiting for tokens, so a waiter re-checks
+    # the shared state regularly
+    MAX_WAIT_SECONDS = 0.5
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        # spawn context: the pools that share the bucket use spawn
+        ctx = multiprocessing.get_context("spawn")
+        self._lock = ctx.Lock()
+        # [tokens, updated_at]; time.monotonic() is system-wide, so it is
+        # comparable between processes
+        self._state = ctx.RawArray("d", [capacity, time.monotonic()])
+    
+    def _refill(self):
+        now = time.monotonic()
+        tokens, updated_at = self._state
+        self._state[0] = min(self.capacity, tokens + (now - updated_at) * self.rate)
+        self._state[1] = now
+    
+    def acquire(self, cost: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Take `cost` tokens, waiting for the bucket to refill if needed.
+        
+        Args:
+            cost: Tokens to take (must not exceed capacity)
+            timeout: Maximum seconds to wait (None = wait indefinitely)
+        
+        Returns:
+            True if the tokens were taken, False if the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._state[0] >= cost:
+                    self._state[0] -= cost
+                    return True
+                wait = (cost - self._state[0]) / self.rate
+            
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            # Sleep outside the lock so other callers can check in
+            time.sleep(min(wait, self.MAX_WAIT_SECONDS))
+
+
+# Shared by every backtest in the process and, via init_backtest_process,
+# by the backtest pool processes it starts
+TWELVE_DATA_BUCKET = TokenBucket(TWELVEDATA_CREDITS_PER_MIN / 60.0, TWELVEDATA_CREDITS_PER_MIN)
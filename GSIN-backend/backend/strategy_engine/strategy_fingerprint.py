@@ -11,6 +11,7 @@ A strategy fingerprint is based on:
 """
 import json
 import hashlib
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
 
@@ -132,6 +133,15 @@ def create_strategy_fingerprint(
     Returns:
         SHA256 hash string representing the strategy's "DNA"
     """
+    # Rulesets aren't hashable, so the cache is keyed by their canonical JSON
+    ruleset_json = json.dumps(ruleset or {}, sort_keys=True, default=str)
+    return _fingerprint_from_json(ruleset_json, timeframe)
+
+
+@lru_cache(maxsize=4096)
+def _fingerprint_from_json(ruleset_json: str, timeframe: Optional[str]) -> str:
+    ruleset = json.loads(ruleset_json)
+    
     # Extract components
     primary_symbols = extract_primary_symbols(ruleset)
     direction = extract_direction(ruleset)
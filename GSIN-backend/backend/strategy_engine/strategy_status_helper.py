@@ -6,6 +6,7 @@ This module provides a single point of control for strategy status changes,
 ensuring all status transitions trigger appropriate notifications.
 """
 from typing import Optional, Dict, Any
+import uuid
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
 
@@ -15,6 +16,12 @@ from .status_manager import StrategyStatus
 from ..utils.logger import log
 
 
+# Key in a pending_updates dict holding notification rows queued by
+# set_strategy_status; the caller pops it and inserts the rows in the same
+# transaction as the bulk strategy update
+PENDING_NOTIFICATIONS_KEY = "_notifications"
+
+
 def set_strategy_status(
     db: Session,
     strategy: UserStrategy,
@@ -22,6 +29,8 @@ def set_strategy_status(
     reason: Optional[str] = None,
     triggered_by: str = "system",
     update_is_active: Optional[bool] = None,
+    pending_updates: Optional[Dict[str, Any]] = None,
+    commit: bool = True,
     **kwargs
 ) -> bool:
     """
@@ -34,6 +43,11 @@ def set_strategy_status(
         reason: Optional reason for status change
         triggered_by: "system" or "user"
         update_is_active: Optional override for is_active flag
+        pending_updates: If given, the field updates are merged into this dict
+            (for a later bulk write) instead of being written now, and the
+            notification row is queued under PENDING_NOTIFICATIONS_KEY so it
+            is only written if the status change is
+        commit: If False, changes are flushed but left for the caller to commit
         **kwargs: Additional fields to update (e.g., score, is_proposable)
     
     Returns:
@@ -66,22 +80,37 @@ def set_strategy_status(
             **kwargs
         }
         
-        crud.update_user_strategy(
-            db=db,
-            strategy_id=strategy.id,
-            **update_data
-        )
-        
-        # Send notification
-        _send_strategy_notification(
-            db=db,
-            user_id=strategy.user_id,
-            strategy_id=strategy.id,
-            strategy_name=strategy.name,
-            old_status=old_status,
-            new_status=new_status,
-            reason=reason
-        )
+        if pending_updates is not None:
+            # None means "leave unchanged", as in crud.update_user_strategy
+            pending_updates.update({k: v for k, v in update_data.items() if v is not None})
+            notification = _build_notification_row(
+                user_id=strategy.user_id,
+                strategy_name=strategy.name,
+                old_status=old_status,
+                new_status=new_status,
+                reason=reason,
+            )
+            if notification:
+                pending_updates.setdefault(PENDING_NOTIFICATIONS_KEY, []).append(notification)
+        else:
+            crud.update_user_strategy(
+                db=db,
+                strategy_id=strategy.id,
+                commit=commit,
+                **update_data
+            )
+            
+            # Send notification
+            _send_strategy_notification(
+                db=db,
+                user_id=strategy.user_id,
+                strategy_id=strategy.id,
+                strategy_name=strategy.name,
+                old_status=old_status,
+                new_status=new_status,
+                reason=reason,
+                commit=commit
+            )
         
         log(f"✅ Strategy {strategy.id} status changed: {old_status} → {new_status} (triggered by: {triggered_by})")
         
@@ -94,6 +123,65 @@ def set_strategy_status(
         return False
 
 
+def _build_notification_row(
+    user_id: str,
+    strategy_name: str,
+    old_status: str,
+    new_status: str,
+    reason: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """Notification column values for a status change, or None if it isn't notified."""
+    # Map status to notification title/body
+    notification_templates = {
+        StrategyStatus.PENDING_REVIEW: {
+            "title": "Strategy Under Review",
+            "body": f"Your strategy '{strategy_name}' was received and is under review."
+        },
+        StrategyStatus.DUPLICATE: {
+            "title": "Strategy Marked as Duplicate",
+            "body": f"Your strategy '{strategy_name}' matches an existing strategy and was marked as duplicate. You will not receive royalties for this one."
+        },
+        StrategyStatus.REJECTED: {
+            "title": "Strategy Rejected",
+            "body": f"Your strategy '{strategy_name}' was rejected. {reason or 'Reason: Strategy failed initial validation checks.'}"
+        },
+        StrategyStatus.EXPERIMENT: {
+            "title": "Strategy Accepted",
+            "body": f"Your strategy '{strategy_name}' passed initial checks and is now being backtested by the Brain."
+        },
+        StrategyStatus.CANDIDATE: {
+            "title": "Strategy Promoted to Candidate",
+            "body": f"Your strategy '{strategy_name}' is showing promising results and moved to candidate status."
+        },
+        StrategyStatus.PROPOSABLE: {
+            "title": "Strategy Now Live!",
+            "body": f"Your strategy '{strategy_name}' has passed robustness checks and is now available for other users to run. You are now eligible for royalties according to your plan."
+        },
+        StrategyStatus.DISCARDED: {
+            "title": "Strategy Deprecated",
+            "body": f"Your strategy '{strategy_name}' has been deprecated based on new performance data."
+        },
+    }
+    
+    # Only send notification if status changed to a new status that has a template
+    if new_status not in notification_templates:
+        return None
+    
+    # Don't send notification if transitioning from pending_review to experiment (already handled)
+    if old_status == StrategyStatus.PENDING_REVIEW and new_status == StrategyStatus.EXPERIMENT:
+        # This notification is already sent by Monitoring Worker
+        return None
+    
+    template = notification_templates[new_status]
+    return {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id,
+        "title": template["title"],
+        "body": template["body"],
+        "read_flag": False,
+    }
+
+
 def _send_strategy_notification(
     db: Session,
     user_id: str,
@@ -101,70 +189,27 @@ def _send_strategy_notification(
     strategy_name: str,
     old_status: str,
     new_status: str,
-    reason: Optional[str] = None
+    reason: Optional[str] = None,
+    commit: bool = True
 ) -> bool:
     """Send a notification to the user about strategy status change."""
     try:
         from ..db.models import Notification
-        import uuid
         
-        # Map status to notification title/body
-        notification_templates = {
-            StrategyStatus.PENDING_REVIEW: {
-                "title": "Strategy Under Review",
-                "body": f"Your strategy '{strategy_name}' was received and is under review."
-            },
-            StrategyStatus.DUPLICATE: {
-                "title": "Strategy Marked as Duplicate",
-                "body": f"Your strategy '{strategy_name}' matches an existing strategy and was marked as duplicate. You will not receive royalties for this one."
-            },
-            StrategyStatus.REJECTED: {
-                "title": "Strategy Rejected",
-                "body": f"Your strategy '{strategy_name}' was rejected. {reason or 'Reason: Strategy failed initial validation checks.'}"
-            },
-            StrategyStatus.EXPERIMENT: {
-                "title": "Strategy Accepted",
-                "body": f"Your strategy '{strategy_name}' passed initial checks and is now being backtested by the Brain."
-            },
-            StrategyStatus.CANDIDATE: {
-                "title": "Strategy Promoted to Candidate",
-                "body": f"Your strategy '{strategy_name}' is showing promising results and moved to candidate status."
-            },
-            StrategyStatus.PROPOSABLE: {
-                "title": "Strategy Now Live!",
-                "body": f"Your strategy '{strategy_name}' has passed robustness checks and is now available for other users to run. You are now eligible for royalties according to your plan."
-            },
-            StrategyStatus.DISCARDED: {
-                "title": "Strategy Deprecated",
-                "body": f"Your strategy '{strategy_name}' has been deprecated based on new performance data."
-            },
-        }
-        
-        # Only send notification if status changed to a new status that has a template
-        if new_status not in notification_templates:
+        row = _build_notification_row(user_id, strategy_name, old_status, new_status, reason)
+        if row is None:
             return False
         
-        # Don't send notification if transitioning from pending_review to experiment (already handled)
-        if old_status == StrategyStatus.PENDING_REVIEW and new_status == StrategyStatus.EXPERIMENT:
-            # This notification is already sent by Monitoring Worker
-            return True
-        
-        template = notification_templates[new_status]
-        
-        notification = Notification(
-            id=str(uuid.uuid4()),
-            user_id=user_id,
-            title=template["title"],
-            body=template["body"],
-            read_flag=False,
-        )
+        notification = Notification(**row)
         
         db.add(notification)
-        db.commit()
+        if commit:
+            db.commit()
+        else:
+            db.flush()
         
         return True
     
     except Exception as e:
         log(f"⚠️  Failed to send notification: {e}")
         return False
-
@@ -19,7 +19,9 @@ PHASE 2 (mature stage, after 200 strategies and 1000 MCN events):
 - max_drawdown ≤ 10%
 - symbol-robustness test: strategy must remain profitable across 3 symbols
 """
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Mapping, Tuple
+from functools import lru_cache
+from types import MappingProxyType
 from datetime import datetime, timezone, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -94,10 +96,14 @@ def get_evolution_phase(db: Session) -> Tuple[str, Dict[str, Any]]:
     return phase, phase_info
 
 
-def get_thresholds_for_phase(phase: str) -> Dict[str, Any]:
+@lru_cache(maxsize=None)
+def get_thresholds_for_phase(phase: str) -> Mapping[str, Any]:
     """
     PHASE 2: Get thresholds for a given evolution phase.
     
+    Thresholds depend only on the phase, so results are cached and returned
+    as a read-only mapping shared by every caller.
+    
     Returns:
         {
             "winrate_min": float,
@@ -109,29 +115,29 @@ def get_thresholds_for_phase(phase: str) -> Dict[str, Any]:
         }
     """
     if phase == EvolutionPhase.COLD_START:
-        return {
+        return MappingProxyType({
             "winrate_min": 0.25,
             "sharpe_min": 0.2,
             "trades_min": 5,
             "max_drawdown_max": None,  # Not required in cold start
             "symbol_robustness_required": False,
             "min_symbols": 1,
-        }
+        })
     elif phase == EvolutionPhase.GROWTH:
-        return {
+        return MappingProxyType({
             "winrate_min": 0.55,
             "sharpe_min": 0.5,
             "trades_min": 10,
             "max_drawdown_max": None,  # Not required in growth
             "symbol_robustness_required": False,
             "min_symbols": 1,
-        }
+        })
     elif phase == EvolutionPhase.MATURE:
         # PHASE 2: More flexible - allow different types of elite strategies
         # Option 1: High win rate strategy (winrate >= 0.80 AND sharpe >= 1.0)
         # Option 2: High Sharpe strategy (winrate >= 0.55 AND sharpe >= 1.5)
         # This accepts both high-win-rate OR high-Sharpe strategies
-        return {
+        return MappingProxyType({
             "winrate_min": 0.55,  # Lowered from 0.90 - now part of OR condition
             "winrate_min_high_win": 0.80,  # For high win rate path
             "sharpe_min": 1.0,  # For high win rate path
@@ -141,17 +147,17 @@ def get_thresholds_for_phase(phase: str) -> Dict[str, Any]:
             "symbol_robustness_required": True,
             "min_symbols": 3,  # Must be profitable across 3 symbols
             "flexible_thresholds": True,  # Flag to indicate flexible logic
-        }
+        })
     else:
         # Default to growth phase thresholds
-        return {
+        return MappingProxyType({
             "winrate_min": 0.55,
             "sharpe_min": 0.5,
             "trades_min": 10,
             "max_drawdown_max": None,
             "symbol_robustness_required": False,
             "min_symbols": 1,
-        }
+        })
 
 
 def check_strategy_meets_thresholds(
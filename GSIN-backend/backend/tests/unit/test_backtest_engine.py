@@ -4,7 +4,8 @@ PHASE 6: Unit tests for backtesting engine.
 """
 import pytest
 from datetime import datetime, timezone, timedelta
-from backend.strategy_engine.backtest_engine import BacktestEngine
+from backend.strategy_engine import backtest_engine as backtest_engine_module
+from backend.strategy_engine.backtest_engine import BacktestEngine, count_trading_days, get_candle_limit
 
 
 class TestBacktestEngine:
@@ -107,3 +108,79 @@ class TestBacktestEngine:
             else:
                 raise
 
+    
+    def test_ohlcv_cache_skips_fetch(self, monkeypatch):
+        """Test prefetched candles are used instead of fetching from the provider."""
+        from backend.market_data.types import CandleData
+        
+        engine = BacktestEngine(market_provider=object())
+        
+        def fail_fetch(*args, **kwargs):
+            raise AssertionError("candles should come from ohlcv_cache")
+        monkeypatch.setattr(engine, "_fetch_candles", fail_fetch)
+        
+        end_date = datetime.now(timezone.utc)
+        start_date = end_date - timedelta(days=90)
+        candles = [
+            CandleData(
+                symbol="AAPL",
+                timestamp=start_date + timedelta(days=i),
+                open=100 + i % 7,
+                high=102 + i % 7,
+                low=99 + i % 7,
+                close=101 + i % 7,
+                volume=1000,
+            )
+            for i in range(60)
+        ]
+        ruleset = {
+            "ticker": "AAPL",
+            "timeframe": "1d",
+            "entry_rules": {"condition": "always_true"},
+            "exit_rules": {"stop_loss": 0.02, "take_profit": 0.05}
+        }
+        
+        results = engine.run_backtest(
+            symbol="AAPL",
+            ruleset=ruleset,
+            timeframe="1d",
+            start_date=start_date,
+            end_date=end_date,
+            ohlcv_cache={("AAPL", "1d"): candles}
+        )
+        
+        assert not results.get("insufficient_data")
+        assert len(candles) == 60  # Cached list is not consumed by the backtest
+    
+    def test_count_trading_days_across_years(self):
+        """Test trading days are counted across a year boundary, skipping weekends."""
+        # Mon 2024-12-30 .. Fri 2025-01-03 (end date exclusive)
+        assert count_trading_days(datetime(2024, 12, 30), datetime(2025, 1, 6)) == 5
+        assert count_trading_days(datetime(2025, 1, 4), datetime(2025, 1, 6)) == 0
+    
+    def test_candle_limit_uses_trading_days(self):
+        """Test the candle limit is sized from the trading-day count of the window."""
+        # Mon 2024-01-01 .. Sun 2024-01-14: 10 trading days
+        start_date, end_date = datetime(2024, 1, 1), datetime(2024, 1, 15)
+        assert get_candle_limit("1h", start_date, end_date) == 165
+        assert get_candle_limit("15m", start_date, end_date) == 460
+        assert get_candle_limit("1d", start_date, end_date) == 350
+    
+    def test_fetch_candles_requests_given_limit(self, monkeypatch):
+        """Test _fetch_candles requests the limit it is given, or the computed one for 0."""
+        from backend.market_data import market_data_provider
+        
+        requested = []
+        def fake_call(method, symbol, timeframe, limit, start, end):
+            requested.append(limit)
+            return []
+        monkeypatch.setattr(market_data_provider, "call_with_fallback", fake_call)
+        monkeypatch.setattr(backtest_engine_module, "get_ohlcv_cache", lambda: None)
+        monkeypatch.setattr(backtest_engine_module.TWELVE_DATA_BUCKET, "acquire", lambda *args: None)
+        
+        engine = BacktestEngine(market_provider=object())
+        start_date, end_date = datetime(2024, 1, 1), datetime(2024, 1, 15)
+        engine._fetch_candles("AAPL", "1h", 1234, start_date, end_date)
+        engine._fetch_candles("AAPL", "1h", 0, start_date, end_date)
+        
+        assert requested == [1234, 165]
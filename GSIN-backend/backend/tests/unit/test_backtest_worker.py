@@ -0,0 +1,92 @@
+# backend/tests/unit/test_backtest_worker.py
+"""
+Unit tests for the background backtest worker's process pool and concurrency limit.
+"""
+from datetime import datetime, timedelta, timezone
+from concurrent.futures.process import BrokenProcessPool
+
+from backend.workers import backtest_worker as backtest_worker_module
+from backend.workers.backtest_worker import BacktestWorker, BacktestJob, MAX_BACKTEST_WORKERS
+
+
+class BrokenPool:
+    """Process pool stand-in whose worker processes have died."""
+
+    def __init__(self):
+        self.shutdown_calls = []
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, **kwargs):
+        self.shutdown_calls.append(kwargs)
+
+
+def make_job():
+    end = datetime.now(timezone.utc)
+    return BacktestJob("job-1", "strategy-1", "user-1", "AAPL", "1d", end - timedelta(days=30), end)
+
+
+def drain(semaphore):
+    """Take every free permit without blocking and return how many there were."""
+    count = 0
+    while semaphore.acquire(blocking=False):
+        count += 1
+    return count
+
+
+class TestRunInProcess:
+    """Test the process pool fallback."""
+
+    def test_broken_pool_falls_back_to_thread(self, monkeypatch):
+        """Test a broken pool is shut down, dropped, and the job runs in-thread."""
+        worker = BacktestWorker()
+        pool = BrokenPool()
+        worker._process_pool = pool
+        calls = []
+
+        def compute_in_thread(*args):
+            calls.append(args)
+            return {"total_trades": 0}, 0.5
+
+        monkeypatch.setattr(backtest_worker_module, "_compute_backtest", compute_in_thread)
+
+        results, score = worker._run_in_process(make_job(), {"ticker": "AAPL"})
+
+        assert (results, score) == ({"total_trades": 0}, 0.5)
+        assert len(calls) == 1
+        assert pool.shutdown_calls == [{"wait": False, "cancel_futures": True}]
+        assert worker._process_pool is None
+
+
+class TestUpdateMaxWorkers:
+    """Test the concurrency limit swap."""
+
+    def test_swaps_semaphore_to_new_limit(self):
+        """Test new jobs are admitted against a fresh semaphore sized to the new limit."""
+        worker = BacktestWorker(max_workers=2)
+        old = worker._semaphore
+
+        worker.update_max_workers(5)
+
+        assert worker._semaphore is not old
+        assert worker.max_workers == 5
+        assert drain(worker._semaphore) == 5
+        assert drain(old) == 2
+
+    def test_limit_is_capped(self):
+        """Test the limit never exceeds the thread pool size."""
+        worker = BacktestWorker()
+        worker.update_max_workers(MAX_BACKTEST_WORKERS + 10)
+        assert worker.max_workers == MAX_BACKTEST_WORKERS
+
+    def test_running_job_releases_its_own_semaphore(self, monkeypatch):
+        """Test a job running across the swap returns its permit to the old semaphore."""
+        worker = BacktestWorker(max_workers=2)
+        old = worker._semaphore
+        monkeypatch.setattr(worker, "_execute_backtest", lambda job: worker.update_max_workers(4))
+
+        worker._run_backtest(make_job())
+
+        assert drain(old) == 2
+        assert drain(worker._semaphore) == 4
@@ -0,0 +1,99 @@
+# backend/tests/unit/test_evolution_worker.py
+"""
+Unit tests for the evolution worker's database housekeeping.
+"""
+from datetime import datetime, timedelta, timezone
+
+from backend.db.models import UserStrategy
+from backend.market_data.types import CandleData
+from backend.strategy_engine.status_manager import StrategyStatus
+from backend.workers import evolution_worker as evolution_worker_module
+from backend.workers.evolution_worker import EvolutionWorker, EvolutionContext
+
+
+def add_strategies(db_session, scores):
+    """Insert active strategies with the given {id: score}."""
+    for strategy_id, score in scores.items():
+        db_session.add(UserStrategy(
+            id=strategy_id,
+            user_id="u1",
+            name=strategy_id,
+            parameters={},
+            ruleset={},
+            score=score,
+            status=StrategyStatus.EXPERIMENT,
+            is_active=True,
+        ))
+    db_session.commit()
+
+
+class TestEnforceStrategyLimit:
+    """Test the active strategy cap."""
+
+    def test_deactivates_lowest_scores(self, db_session):
+        """Test only the top scores stay active; a missing score counts as 0."""
+        add_strategies(db_session, {"a": 0.9, "b": None, "c": 0.5, "d": -0.1})
+        worker = EvolutionWorker.__new__(EvolutionWorker)
+        worker._enforce_strategy_limit(db_session, 2)
+
+        db_session.expire_all()
+        active = {s.id for s in db_session.query(UserStrategy).filter(UserStrategy.is_active == True)}
+        assert active == {"a", "c"}
+
+    def test_under_limit_is_untouched(self, db_session):
+        """Test nothing is deactivated below the cap."""
+        add_strategies(db_session, {"a": 0.9, "b": 0.1})
+        EvolutionWorker.__new__(EvolutionWorker)._enforce_strategy_limit(db_session, 5)
+        assert db_session.query(UserStrategy).filter(UserStrategy.is_active == True).count() == 2
+
+
+class TestSelectBatch:
+    """Test evolution batch selection."""
+
+    def test_up_to_date_strategies_do_not_hold_the_batch(self, db_session, monkeypatch):
+        """Test strategies skipped as up to date move behind strategies that have new bars."""
+        monkeypatch.setattr(evolution_worker_module, "MAX_REQUESTS_PER_CYCLE", 3)
+        monkeypatch.setattr(evolution_worker_module, "is_known_insufficient", lambda *args: False)
+        now = datetime.now(timezone.utc)
+        # Five daily strategies backtested after the last daily bar closed, and one
+        # intraday strategy backtested more recently than all of them
+        for i in range(5):
+            db_session.add(UserStrategy(
+                id=f"daily-{i}", user_id="u1", name=f"daily-{i}", parameters={}, ruleset={},
+                status=StrategyStatus.CANDIDATE, is_active=True, symbol_resolved="AAPL",
+                timeframe_resolved="1d", last_backtest_at=now - timedelta(hours=3, minutes=i),
+            ))
+        db_session.add(UserStrategy(
+            id="intraday", user_id="u1", name="intraday", parameters={}, ruleset={},
+            status=StrategyStatus.CANDIDATE, is_active=True, symbol_resolved="MSFT",
+            timeframe_resolved="15m", last_backtest_at=now - timedelta(hours=1),
+        ))
+        db_session.commit()
+
+        last_daily_bar = CandleData(
+            symbol="AAPL", timestamp=now - timedelta(days=2), open=1, high=1, low=1, close=1, volume=1,
+        )
+        ctx = EvolutionContext(
+            start_date=now - timedelta(days=30),
+            end_date=now,
+            ohlcv_cache={("AAPL", "1d"): [last_daily_bar]},
+        )
+        worker = EvolutionWorker.__new__(EvolutionWorker)
+        active_filter = (UserStrategy.is_active == True,)
+
+        batches = []
+        for _ in range(2):
+            rows = worker._select_batch(db_session, active_filter, datetime.now(timezone.utc))
+            batches.append([strategy.id for strategy, _ in rows])
+            updates = []
+            for strategy, _ in rows:
+                if strategy.id == "intraday":
+                    continue
+                result, update = worker._process_strategy(db_session, strategy, ctx)
+                assert result["action"] == "up_to_date"
+                updates.append(update)
+            db_session.bulk_update_mappings(UserStrategy, updates)
+            db_session.commit()
+
+        assert batches[0] == ["daily-4", "daily-3", "daily-2"]
+        assert batches[1] == ["daily-1", "daily-0", "intraday"]
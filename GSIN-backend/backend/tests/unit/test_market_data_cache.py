@@ -0,0 +1,40 @@
+# backend/tests/unit/test_market_data_cache.py
+"""
+Unit tests for the market data cache TTL handling.
+"""
+from datetime import datetime, timedelta
+
+from backend.market_data.cache import MarketDataCache
+
+
+class FakeClock:
+    """Clock the test advances by hand."""
+
+    def __init__(self):
+        self.now = datetime(2024, 1, 2, 9, 30)
+
+    def __call__(self):
+        return self.now
+
+
+class TestMarketDataCacheTTL:
+    """Test market data cache expiry against an injected clock."""
+
+    def test_entry_served_within_ttl(self, tmp_path):
+        """Test an entry younger than its TTL is returned."""
+        clock = FakeClock()
+        cache = MarketDataCache(cache_dir=str(tmp_path), clock=clock)
+        cache.set("price", "AAPL", {"price": 150.0})
+
+        clock.now += timedelta(seconds=5)
+        assert cache.get("price", "AAPL", ttl_seconds=5) == {"price": 150.0}
+
+    def test_entry_expires_after_ttl(self, tmp_path):
+        """Test an entry older than its TTL is a miss and is evicted."""
+        clock = FakeClock()
+        cache = MarketDataCache(cache_dir=str(tmp_path), clock=clock)
+        cache.set("price", "TSLA", {"price": 200.0})
+
+        clock.now += timedelta(seconds=10)
+        assert cache.get("price", "TSLA", ttl_seconds=5) is None
+        assert cache.get_stats()["total_entries"] == 0
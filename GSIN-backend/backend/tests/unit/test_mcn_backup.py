@@ -0,0 +1,91 @@
+# backend/tests/unit/test_mcn_backup.py
+"""
+Unit tests for MCN snapshots and WAL replay.
+"""
+import json
+import threading
+
+import pytest
+
+from backend.brain import mcn_backup
+from backend.brain.mcn_backup import MCNBackupManager
+
+
+class FakeAdapter:
+    """MCN adapter stand-in with an in-memory event list as its state."""
+
+    is_available = True
+    mcn = True
+
+    def __init__(self):
+        self.events = []
+        self.saving = threading.Event()
+        self.release = None
+
+    def save_state(self):
+        self.saving.set()
+        if self.release is not None:
+            self.release.wait(5)
+        return list(self.events)
+
+    def load_state(self, state):
+        self.events = list(state)
+
+    def record_events(self, events):
+        self.events.extend(event["payload"]["i"] for event in events)
+        return len(events)
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    fake = FakeAdapter()
+    monkeypatch.setattr(mcn_backup, "get_mcn_adapter", lambda: fake)
+    return fake
+
+
+def event(i):
+    return {"event_type": "strategy_backtest", "payload": {"i": i}, "strategy_id": None}
+
+
+class TestMCNBackup:
+    """Test MCN backup manager."""
+
+    def test_restore_replays_wal_after_snapshot(self, tmp_path, adapter):
+        """Test restoring the newest backup re-records the events logged after it."""
+        manager = MCNBackupManager(tmp_path)
+        adapter.record_events([event(0)])
+        backup_path = manager.snapshot_if_due("test", interval_seconds=0)
+        adapter.record_events([event(1), event(2)])
+        manager.append_wal([{"type": "mcn_event", **event(1)}, {"type": "mcn_event", **event(2)}])
+        manager.append_wal([{"type": "evolution_cycle"}])
+
+        adapter.events = []
+        assert manager.restore_backup(backup_path)
+        assert adapter.events == [0, 1, 2]
+
+    def test_restore_of_older_backup_skips_wal(self, tmp_path, adapter):
+        """Test the WAL is not replayed on a backup it doesn't follow."""
+        manager = MCNBackupManager(tmp_path)
+        old_path = manager.create_backup("old")
+        manager.snapshot_if_due("new", interval_seconds=0)
+        manager.append_wal([{"type": "mcn_event", **event(1)}])
+
+        assert manager.restore_backup(old_path)
+        assert adapter.events == []
+
+    def test_wal_append_waits_for_snapshot(self, tmp_path, adapter):
+        """Test an entry logged during a snapshot lands after the WAL truncate."""
+        manager = MCNBackupManager(tmp_path)
+        adapter.release = threading.Event()
+        snapshot = threading.Thread(target=manager.snapshot_if_due, args=("test", 0))
+        snapshot.start()
+        assert adapter.saving.wait(5)
+        appender = threading.Thread(target=manager.append_wal, args=([{"type": "mcn_event", **event(1)}],))
+        appender.start()
+        adapter.release.set()
+        snapshot.join(5)
+        appender.join(5)
+
+        lines = [json.loads(line) for line in manager.wal_path.read_text().splitlines()]
+        assert lines[0]["type"] == "snapshot"
+        assert lines[1:] == [{"type": "mcn_event", **event(1)}]
@@ -0,0 +1,71 @@
+# backend/tests/unit/test_mcn_event_queue.py
+"""
+Unit tests for the background MCN event queue.
+"""
+from threading import Event
+
+from backend.brain.mcn_event_queue import MCNEventQueue
+
+
+class RecordingAdapter:
+    """MCN adapter stand-in that records each batch."""
+
+    is_available = True
+
+    def __init__(self, gate=None):
+        self.batches = []
+        self.gate = gate
+
+    def record_events(self, events):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.batches.append(list(events))
+        return len(events)
+
+
+class TestMCNEventQueue:
+    """Test MCN event queue."""
+
+    def test_events_are_recorded_in_batches(self):
+        """Test submitted events are drained in batches and passed to on_batch."""
+        adapter = RecordingAdapter()
+        logged = []
+        mcn_queue = MCNEventQueue(adapter, batch_size=2, max_latency=0.05, on_batch=logged.extend)
+
+        for i in range(5):
+            assert mcn_queue.submit({"event_type": "strategy_backtest", "payload": {"i": i}})
+        assert mcn_queue.flush(timeout=5)
+
+        recorded = [event["payload"]["i"] for batch in adapter.batches for event in batch]
+        assert recorded == [0, 1, 2, 3, 4]
+        assert all(len(batch) <= 2 for batch in adapter.batches)
+        assert [event["payload"]["i"] for event in logged] == recorded
+
+    def test_full_queue_drops_oldest(self):
+        """Test a full queue drops its oldest event instead of blocking."""
+        gate = Event()
+        adapter = RecordingAdapter(gate=gate)
+        mcn_queue = MCNEventQueue(adapter, maxsize=2, batch_size=1, max_latency=0.01)
+
+        # The first event is taken by the drain thread, which then blocks on the gate
+        mcn_queue.submit({"payload": {"i": 0}})
+        while mcn_queue._queue.qsize():
+            pass
+        assert mcn_queue.submit({"payload": {"i": 1}})
+        assert mcn_queue.submit({"payload": {"i": 2}})
+        assert not mcn_queue.submit({"payload": {"i": 3}})
+        assert mcn_queue.dropped == 1
+
+        gate.set()
+        assert mcn_queue.flush(timeout=5)
+        assert [batch[0]["payload"]["i"] for batch in adapter.batches] == [0, 2, 3]
+
+    def test_unavailable_mcn_discards_events(self):
+        """Test events are drained (not recorded) when MCN is unavailable."""
+        adapter = RecordingAdapter()
+        adapter.is_available = False
+        mcn_queue = MCNEventQueue(adapter, max_latency=0.01)
+
+        mcn_queue.submit({"payload": {}})
+        assert mcn_queue.flush(timeout=5)
+        assert adapter.batches == []
@@ -0,0 +1,72 @@
+# backend/tests/unit/test_mcn_layer.py
+"""
+Unit tests for the in-process MCN stub store.
+"""
+import numpy as np
+import pytest
+
+import mcn_layer
+
+
+@pytest.fixture(autouse=True)
+def empty_store(monkeypatch):
+    """Start every test from an empty store."""
+    monkeypatch.setattr(mcn_layer, "_VECS", None)
+    monkeypatch.setattr(mcn_layer, "_META", [None] * mcn_layer._MAX)
+    monkeypatch.setattr(mcn_layer, "_n", 0)
+    monkeypatch.setattr(mcn_layer, "_head", 0)
+
+
+class TestMCNLayer:
+    """Test MCN stub store."""
+
+    def test_remember_and_peek(self):
+        """Test entries come back oldest first with their metadata."""
+        mcn_layer.remember([[1, 2, 3], [4, 5, 6]], [{"id": 1}, {"id": 2}])
+
+        items = mcn_layer._peek()
+        assert [item["meta"]["id"] for item in items] == [1, 2]
+        assert items[1]["vec"] == [4.0, 5.0, 6.0]
+        assert items[0]["w"] == 1.0
+        assert [item["meta"]["id"] for item in mcn_layer._peek(1)] == [2]
+
+    def test_cap_keeps_newest(self, monkeypatch):
+        """Test the store drops its oldest entries past _MAX, including across the ring wrap."""
+        monkeypatch.setattr(mcn_layer, "_MAX", 3)
+        monkeypatch.setattr(mcn_layer, "_W", np.empty(3, np.float32))
+        monkeypatch.setattr(mcn_layer, "_TS", np.empty(3, np.float64))
+        monkeypatch.setattr(mcn_layer, "_META", [None] * 3)
+
+        for i in range(5):
+            mcn_layer.remember([[i, 0, 0]], [{"id": i}])
+        assert [item["meta"]["id"] for item in mcn_layer._peek()] == [2, 3, 4]
+
+        mcn_layer.remember([[i, 0, 0] for i in range(5, 10)], [{"id": i} for i in range(5, 10)])
+        assert [item["meta"]["id"] for item in mcn_layer._peek()] == [7, 8, 9]
+
+    def test_maintain_decays_and_drops(self):
+        """Test maintain decays weights and drops entries below the floor."""
+        mcn_layer.remember([[0, 0, 0], [1, 1, 1]], [{"id": 0}, {"id": 1}])
+        mcn_layer._W[0] = 1e-4  # First entry falls below the floor after one decay
+        mcn_layer.maintain()
+
+        items = mcn_layer._peek()
+        assert [item["meta"]["id"] for item in items] == [1]
+        assert items[0]["w"] == pytest.approx(mcn_layer._DECAY)
+
+    def test_query_orders_by_weight_then_time(self):
+        """Test query returns the top entries by (weight, timestamp), highest last."""
+        mcn_layer.remember([[0, 0, 0], [1, 1, 1], [2, 2, 2]], [{"id": 0}, {"id": 1}, {"id": 2}])
+        mcn_layer._W[1] = 0.5
+
+        assert [item["meta"]["id"] for item in mcn_layer.query([[0, 0, 0]], topk=2)] == [0, 2]
+
+    def test_stats(self):
+        """Test stats average the first three dimensions and weights."""
+        assert mcn_layer._stats()["count"] == 0
+        mcn_layer.remember([[1, 2, 3, 9], [3, 4, 5, 9]], [{}, {}])
+
+        stats = mcn_layer._stats()
+        assert stats["count"] == 2
+        assert stats["avg_vec"] == [2.0, 3.0, 4.0]
+        assert stats["avg_w"] == 1.0
@@ -0,0 +1,174 @@
+# backend/tests/unit/test_monitoring_worker.py
+"""
+Unit tests for the monitoring worker's strategy selection.
+"""
+from concurrent.futures import Future
+
+from backend.db import crud
+from backend.db.models import UserStrategy, Notification
+from backend.strategy_engine.status_manager import StrategyStatus
+from backend.workers import monitoring_worker as monitoring_module
+from backend.workers.monitoring_worker import MonitoringWorker, _regime_score
+
+
+class TestRobustnessSelection:
+    """Test which strategies get a robustness check."""
+
+    def test_robustness_check_gates_on_trades_in_sql(self, db_session):
+        """Test only active strategies with enough backtest trades are loaded."""
+        worker = MonitoringWorker.__new__(MonitoringWorker)
+        cases = {"enough": {"total_trades": 25}, "few": {"total_trades": 3}, "none": None}
+        for name, results in cases.items():
+            strategy = crud.create_user_strategy(
+                db_session, user_id="u1", name=name, ruleset={},
+                initial_status=StrategyStatus.CANDIDATE,
+            )
+            crud.update_user_strategy(db_session, strategy.id, last_backtest_results=results)
+
+        assert [s.name for s in worker._get_strategies_for_robustness_check(db_session)] == ["enough"]
+
+
+class FakeEngine:
+    """Records candle fetches instead of calling the data provider."""
+
+    def __init__(self):
+        self.fetches = []
+
+    def _fetch_candles(self, symbol, timeframe, limit, start_date, end_date):
+        self.fetches.append((symbol, timeframe))
+        return [] if symbol == "EMPTY" else ["candle"]
+
+
+class TestSanityCandles:
+    """Test sanity-check candles are shared across pending strategies."""
+
+    def test_fetches_once_per_symbol_timeframe(self, db_session):
+        """Test strategies on the same series share one fetch and empty series are left out."""
+        worker = MonitoringWorker.__new__(MonitoringWorker)
+        worker.backtest_engine = FakeEngine()
+        worker._sanity_candles = {}
+        rulesets = [{"ticker": "AAPL"}, {}, {"ticker": "AAPL", "timeframe": "1h"}, {"ticker": "EMPTY"}]
+        strategies = [
+            crud.create_user_strategy(db_session, user_id="u1", name=str(i), ruleset=ruleset)
+            for i, ruleset in enumerate(rulesets)
+        ]
+
+        worker._sanity_candles = worker._prefetch_sanity_candles(strategies)
+
+        assert sorted(worker.backtest_engine.fetches) == [("AAPL", "1d"), ("AAPL", "1h"), ("EMPTY", "1d")]
+        assert set(worker._sanity_candles) == {("AAPL", "1d"), ("AAPL", "1h")}
+        assert worker._sanity_check_kwargs(strategies[1])["ohlcv_cache"] == {("AAPL", "1d"): ["candle"]}
+        assert "ohlcv_cache" not in worker._sanity_check_kwargs(strategies[3])
+
+
+class TestPendingReviewTransaction:
+    """Test pending-review status changes share the cycle's transaction."""
+
+    def test_changes_visible_before_commit_and_rolled_back_together(self, db_session):
+        """Test a duplicate marked earlier in the cycle is seen by later checks, and nothing persists on rollback."""
+        worker = MonitoringWorker.__new__(MonitoringWorker)
+        worker._sanity_candles = {}
+        ruleset = {"ticker": "AAPL", "entry_rules": [{"indicator": "rsi"}]}
+        first = crud.create_user_strategy(db_session, user_id="u1", name="a", ruleset=ruleset)
+        second = crud.create_user_strategy(db_session, user_id="u2", name="b", ruleset=dict(ruleset))
+        backtest = Future()
+        backtest.set_result({"total_trades": 50, "win_rate": 0.6, "max_drawdown": 0.05, "sharpe_ratio": 1.0})
+
+        assert worker._process_pending_strategy(db_session, first)["action"] == "duplicate"
+        assert worker._process_pending_strategy(db_session, second, backtest)["action"] == "accepted"
+
+        db_session.rollback()
+        statuses = {s.name: s.status for s in db_session.query(UserStrategy)}
+        assert statuses == {"a": StrategyStatus.PENDING_REVIEW, "b": StrategyStatus.PENDING_REVIEW}
+
+
+class TestCycleSavepoints:
+    """Test one strategy's failed write doesn't undo the rest of the cycle."""
+
+    def test_failed_strategy_rolled_back_others_committed(self, db_session, monkeypatch):
+        """Test a strategy whose status flush fails is rolled back alone and the others still commit."""
+        worker = MonitoringWorker.__new__(MonitoringWorker)
+        monkeypatch.setattr(worker, "_prefetch_sanity_candles", lambda strategies: {}, raising=False)
+        monkeypatch.setattr(worker, "_submit_sanity_checks", lambda strategies: {}, raising=False)
+        monkeypatch.setattr(worker, "_run_sanity_check", lambda strategy, backtest=None: {"passed": False, "reason": "Too few trades."}, raising=False)
+        monkeypatch.setattr(worker, "_get_strategies_for_robustness_check", lambda db: [], raising=False)
+        for name in ("a", "bad", "c"):
+            crud.create_user_strategy(db_session, user_id="u1", name=name, ruleset={"ticker": name.upper()})
+
+        real_set_strategy_status = monitoring_module.set_strategy_status
+
+        def set_status_failing_for_bad(db, strategy, *args, **kwargs):
+            if strategy.name == "bad":
+                db.add(Notification(id="broken"))  # Missing NOT NULL title/body: the flush fails
+            return real_set_strategy_status(db, strategy, *args, **kwargs)
+
+        monkeypatch.setattr(monitoring_module, "set_strategy_status", set_status_failing_for_bad)
+
+        stats = worker.run_monitoring_cycle(db_session)
+
+        db_session.rollback()
+        statuses = {s.name: s.status for s in db_session.query(UserStrategy)}
+        assert statuses == {"a": StrategyStatus.REJECTED, "bad": StrategyStatus.PENDING_REVIEW, "c": StrategyStatus.REJECTED}
+        assert db_session.query(Notification).count() == 2
+        assert stats["rejected"] == 2
+
+
+class RecordingMCN:
+    """Counts lineage-memory lookups."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_strategy_lineage_memory(self, strategy_id, db=None, memory_cache=None):
+        self.calls += 1
+        return {}
+
+
+class TestCandidatePromotion:
+    """Test the candidate → proposable gate."""
+
+    def test_mcn_skipped_when_numeric_gates_fail(self, db_session):
+        """Test MCN is not queried for a candidate that fails the metric thresholds."""
+        worker = MonitoringWorker.__new__(MonitoringWorker)
+        worker.mcn_adapter = RecordingMCN()
+        worker._lineage_cache = {}
+        worker._ancestor_memory_cache = {}
+        strategy = crud.create_user_strategy(
+            db_session, user_id="u1", name="weak", ruleset={},
+            initial_status=StrategyStatus.CANDIDATE,
+        )
+        crud.update_user_strategy(db_session, strategy.id, last_backtest_results={
+            "total_trades": 60, "win_rate": 0.3, "sharpe_ratio": 0.1, "max_drawdown": None,
+        })
+
+        assert worker._check_robustness_and_promote(db_session, strategy)["action"] == "no_change"
+        assert worker.mcn_adapter.calls == 0
+
+    def test_robustness_score_reuses_regime_score(self, db_session):
+        """Test a precomputed regime score gives the same robustness score."""
+        worker = MonitoringWorker.__new__(MonitoringWorker)
+        strategy = crud.create_user_strategy(db_session, user_id="u1", name="s", ruleset={})
+        strategy.last_backtest_results = {"sharpe_ratio": 1.0, "profit_factor": 1.5, "max_drawdown": 0.1}
+        strategy.per_symbol_performance = {"AAPL": {"win_rate": 0.6}, "MSFT": {"win_rate": 0.4}}
+
+        regime_score = _regime_score(strategy.per_symbol_performance)
+        assert regime_score == 0.5
+        assert worker._calculate_robustness_score(strategy, regime_score) == worker._calculate_robustness_score(strategy)
+        assert _regime_score(None) is None
+
+
+class TestCheckDuplicate:
+    """Test fingerprint duplicate detection."""
+
+    def test_uses_stored_fingerprint(self, db_session, monkeypatch):
+        """Test the stored fingerprint is used instead of re-hashing the ruleset."""
+        worker = MonitoringWorker.__new__(MonitoringWorker)
+        original = crud.create_user_strategy(db_session, user_id="u1", name="a", ruleset={"ticker": "AAPL"})
+        copy = crud.create_user_strategy(db_session, user_id="u2", name="b", ruleset={"ticker": "AAPL"})
+        crud.create_user_strategy(db_session, user_id="u3", name="c", ruleset={"ticker": "MSFT"})
+
+        def fail(ruleset):
+            raise AssertionError("fingerprint recomputed")
+
+        monkeypatch.setattr(monitoring_module, "create_strategy_fingerprint", fail)
+        assert worker._check_duplicate(db_session, copy).id == original.id
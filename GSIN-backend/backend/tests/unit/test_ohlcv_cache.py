@@ -0,0 +1,102 @@
+# backend/tests/unit/test_ohlcv_cache.py
+"""
+Unit tests for the disk-backed OHLCV cache.
+"""
+import time
+import threading
+from datetime import datetime, timezone
+
+from backend.market_data.types import CandleData
+from backend.strategy_engine.ohlcv_cache import OHLCVCache
+
+
+def make_candles(start_ts: float, count: int, bar_seconds: int = 86400):
+    """Build `count` consecutive candles starting at start_ts."""
+    return [
+        CandleData(
+            symbol="AAPL",
+            timestamp=datetime.fromtimestamp(start_ts + i * bar_seconds, tz=timezone.utc),
+            open=100.0 + i,
+            high=101.0 + i,
+            low=99.0 + i,
+            close=100.5 + i,
+            volume=1000 + i,
+        )
+        for i in range(count)
+    ]
+
+
+class TestOHLCVCache:
+    """Test OHLCV cache."""
+
+    def test_empty_cache_requires_full_fetch(self, tmp_path):
+        """Test a missing series needs a full fetch."""
+        cache = OHLCVCache(str(tmp_path))
+        assert cache.get("AAPL", "1d", 100) is None
+        assert cache.missing_bars("AAPL", "1d", 100) is None
+
+    def test_update_drops_in_progress_bar(self, tmp_path):
+        """Test only completed bars are stored and returned."""
+        cache = OHLCVCache(str(tmp_path))
+        today = cache._period_start("1d")
+        candles = make_candles(today - 10 * 86400, 11)  # Last one is today's bar
+
+        stored = cache.update("AAPL", "1d", candles, limit=100, full_fetch=True)
+
+        assert len(stored) == 10
+        assert stored[-1].timestamp.timestamp() == today - 86400
+        assert [c.close for c in cache.get("AAPL", "1d", 100)] == [c.close for c in stored]
+
+    def test_limit_beyond_depth_is_a_miss(self, tmp_path):
+        """Test a series fetched with a smaller limit is not served for a larger one."""
+        cache = OHLCVCache(str(tmp_path))
+        today = cache._period_start("1d")
+        cache.update("AAPL", "1d", make_candles(today - 10 * 86400, 10), limit=100, full_fetch=True)
+
+        assert cache.get("AAPL", "1d", 50) is not None
+        assert cache.get("AAPL", "1d", 350) is None
+        assert cache.missing_bars("AAPL", "1d", 350) is None
+
+    def test_stale_series_refreshes_tail(self, tmp_path, monkeypatch):
+        """Test a stale series asks only for the missing tail and merges it."""
+        cache = OHLCVCache(str(tmp_path))
+        today = cache._period_start("1d")
+        cache.update("AAPL", "1d", make_candles(today - 10 * 86400, 10), limit=100, full_fetch=True)
+
+        # Three days later the cached series is stale
+        later = time.time() + 3 * 86400
+        monkeypatch.setattr(time, "time", lambda: later)
+        assert cache.get("AAPL", "1d", 100) is None
+        assert cache.get("AAPL", "1d", 100, allow_stale=True) is not None
+        assert cache.missing_bars("AAPL", "1d", 100) == 3 + 5
+
+        merged = cache.update("AAPL", "1d", make_candles(today - 2 * 86400, 5), limit=100)
+        assert len(merged) == 13
+        assert cache.get("AAPL", "1d", 100) is not None
+
+    def test_last_bar_ts(self, tmp_path):
+        """Test the newest cached completed bar's open time is reported."""
+        cache = OHLCVCache(str(tmp_path))
+        assert cache.get_last_bar_ts("AAPL", "1d") is None
+
+        today = cache._period_start("1d")
+        cache.update("AAPL", "1d", make_candles(today - 10 * 86400, 11), limit=100, full_fetch=True)
+        assert cache.get_last_bar_ts("AAPL", "1d") == today - 86400
+
+    def test_update_writes_through_private_temp_files(self, tmp_path):
+        """Test concurrent writers of one series each publish a complete file."""
+        cache = OHLCVCache(str(tmp_path))
+        today = cache._period_start("1d")
+        candles = make_candles(today - 10 * 86400, 10)
+
+        threads = [
+            threading.Thread(target=cache.update, args=("AAPL", "1d", candles, 100), kwargs={"full_fetch": True})
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache.get("AAPL", "1d", 100)) == 10
+        assert [p.name for p in tmp_path.iterdir()] == ["AAPL_1d.json"]
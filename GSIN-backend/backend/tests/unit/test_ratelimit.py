@@ -0,0 +1,49 @@
+# backend/tests/unit/test_ratelimit.py
+"""
+Unit tests for the token bucket rate limiter.
+"""
+import time
+import multiprocessing
+
+from backend.strategy_engine.ratelimit import TokenBucket
+
+
+def drain(bucket, count):
+    """Take `count` tokens (run in a child process)."""
+    for _ in range(count):
+        bucket.acquire()
+
+
+class TestTokenBucket:
+    """Test token bucket."""
+    
+    def test_burst_up_to_capacity(self):
+        """Test a full bucket allows a burst of `capacity` requests without waiting."""
+        bucket = TokenBucket(rate=1.0, capacity=5)
+        start = time.monotonic()
+        assert all(bucket.acquire() for _ in range(5))
+        assert time.monotonic() - start < 0.5
+    
+    def test_empty_bucket_times_out(self):
+        """Test acquire gives up once the timeout expires."""
+        bucket = TokenBucket(rate=0.1, capacity=1)
+        assert bucket.acquire()
+        assert bucket.acquire(timeout=0.05) is False
+    
+    def test_refills_at_rate(self):
+        """Test an empty bucket refills at `rate` tokens/second."""
+        bucket = TokenBucket(rate=50.0, capacity=1)
+        assert bucket.acquire()
+        start = time.monotonic()
+        assert bucket.acquire(timeout=1.0)
+        assert 0.01 <= time.monotonic() - start < 0.5
+    
+    def test_shared_with_spawned_process(self):
+        """Test a child process started with the bucket draws from the same budget."""
+        bucket = TokenBucket(rate=0.01, capacity=3)
+        child = multiprocessing.get_context("spawn").Process(target=drain, args=(bucket, 2))
+        child.start()
+        child.join(60)
+        assert child.exitcode == 0
+        assert bucket.acquire(timeout=0.05)
+        assert bucket.acquire(timeout=0.05) is False
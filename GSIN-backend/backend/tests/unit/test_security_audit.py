@@ -0,0 +1,134 @@
+# backend/tests/unit/test_security_audit.py
+"""Unit tests for the security auditor."""
+from pathlib import Path
+
+import pytest
+
+from backend.utils.security_audit import SecurityAuditor, run_security_audit
+
+
+SAMPLE_SOURCE = '''JWT_SECRET = "abc"
+client_secret = 'xyz'
+password = "hunter2"
+
+def lookup(cursor, user):
+    cursor.execute("SELECT * FROM users WHERE name = '%s'" % user)
+
+def digest(data):
+    return hashlib.md5(data).hexdigest()
+
+def report(API_KEY):
+    logger.info(f"using token {API_KEY}")
+'''
+
+
+@pytest.fixture
+def audit_root(tmp_path):
+    """Create a throwaway source tree to audit."""
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "service.py").write_text(SAMPLE_SOURCE)
+    (tmp_path / "app" / "clean.py").write_text("def add(a, b):\n    return a + b\n")
+    return tmp_path
+
+
+class TestSecurityAuditor:
+    """Test security audit checks."""
+
+    def test_hardcoded_secrets(self, audit_root):
+        """Test each secret pattern is reported with its line number."""
+        issues = SecurityAuditor(str(audit_root)).check_hardcoded_secrets()
+        found = sorted((issue["type"], issue["line"]) for issue in issues)
+        assert found == [
+            ("Hardcoded JWT secret", 1),
+            ("Hardcoded password", 3),
+            ("Hardcoded secret", 1),
+            ("Hardcoded secret", 2),
+        ]
+        assert all(issue["file"] == str(Path("app") / "service.py") for issue in issues)
+
+    def test_sql_injection(self, audit_root):
+        """Test string-formatted execute calls are flagged once per file."""
+        issues = SecurityAuditor(str(audit_root)).check_sql_injection()
+        assert [issue["file"] for issue in issues] == [str(Path("app") / "service.py")]
+
+    def test_structural_checks_ignore_comments_and_parameters(self, audit_root):
+        """Test parameterised queries and mentions in comments aren't flagged."""
+        (audit_root / "app" / "safe.py").write_text(
+            "# never call hashlib.md5 here\n"
+            "def lookup(cursor, user):\n"
+            "    cursor.execute(\"SELECT * FROM users WHERE name = %s\", (user,))\n"
+        )
+        auditor = SecurityAuditor(str(audit_root), use_cache=False)
+        flagged = {issue["file"] for issue in auditor.check_sql_injection() + auditor.check_weak_crypto()}
+        assert str(Path("app") / "safe.py") not in flagged
+
+    def test_weak_crypto(self, audit_root):
+        """Test MD5/SHA1 usage is flagged."""
+        issues = SecurityAuditor(str(audit_root)).check_weak_crypto()
+        assert len(issues) == 1
+        assert issues[0]["severity"] == "MEDIUM"
+
+    def test_env_vars(self, audit_root):
+        """Test logging of sensitive variables is flagged per variable."""
+        issues = SecurityAuditor(str(audit_root)).check_env_vars()
+        messages = sorted(issue["message"] for issue in issues)
+        assert messages == [
+            "Potential logging of sensitive variable: API_KEY",
+            "Potential logging of sensitive variable: TOKEN",
+        ]
+
+    def test_large_file_is_scanned(self, audit_root):
+        """Test files above the mmap threshold are still scanned correctly."""
+        padding = "x = 1\n" * 20000
+        (audit_root / "app" / "generated.py").write_text(padding + 'api_key = "k"\n')
+        issues = SecurityAuditor(str(audit_root)).check_hardcoded_secrets()
+        generated = [issue for issue in issues if issue["file"].endswith("generated.py")]
+        assert [(issue["type"], issue["line"]) for issue in generated] == [("Hardcoded API key", 20001)]
+
+    def test_large_file_gets_structural_checks(self, audit_root):
+        """Test files above the mmap threshold are parsed too, so results don't depend on size."""
+        source = (
+            "# never call hashlib.md5 here\n"
+            "def lookup(cursor, user):\n"
+            "    cursor.execute(\"SELECT * FROM users WHERE name = %s\", (user,))\n"
+        )
+        (audit_root / "app" / "safe.py").write_text(source)
+        (audit_root / "app" / "generated.py").write_text("x = 1\n" * 20000 + source)
+        auditor = SecurityAuditor(str(audit_root), use_cache=False)
+        flagged = {issue["file"] for issue in auditor.check_sql_injection() + auditor.check_weak_crypto()}
+        assert flagged == {str(Path("app") / "service.py")}
+
+    def test_skips_test_files(self, audit_root):
+        """Test files are excluded from the audit."""
+        (audit_root / "app" / "test_service.py").write_text(SAMPLE_SOURCE)
+        (audit_root / "tests").mkdir()
+        (audit_root / "tests" / "helpers.py").write_text(SAMPLE_SOURCE)
+        issues = SecurityAuditor(str(audit_root)).check_hardcoded_secrets()
+        assert all(issue["file"].startswith("app") for issue in issues)
+        assert all("test_service" not in issue["file"] for issue in issues)
+
+    def test_audits_names_containing_test(self, audit_root):
+        """Test modules merely containing "test" (e.g. backtest) are audited."""
+        (audit_root / "latest").mkdir()
+        (audit_root / "latest" / "backtester.py").write_text('api_key = "k"\n')
+        issues = SecurityAuditor(str(audit_root)).check_hardcoded_secrets()
+        assert str(Path("latest") / "backtester.py") in {issue["file"] for issue in issues}
+
+    def test_cache_reuses_and_invalidates(self, audit_root):
+        """Test cached results are reused until a file changes."""
+        auditor = SecurityAuditor(str(audit_root))
+        first = auditor.check_hardcoded_secrets()
+        assert (audit_root / ".gsin_audit_cache.json").exists()
+        assert SecurityAuditor(str(audit_root)).check_hardcoded_secrets() == first
+
+        (audit_root / "app" / "clean.py").write_text('password = "changed"\n')
+        issues = SecurityAuditor(str(audit_root)).check_hardcoded_secrets()
+        assert len(issues) == len(first) + 1
+
+    def test_run_full_audit(self, audit_root):
+        """Test full audit aggregates all categories."""
+        results = run_security_audit(str(audit_root))
+        assert results["total_issues"] == 8
+        assert results["high_severity"] == 7
+        assert results["summary"]["status"] == "FAIL"
+        assert results["results"]["cors_config"] == []
@@ -0,0 +1,59 @@
+# backend/tests/unit/test_strategy_fingerprint.py
+"""
+Unit tests for strategy fingerprinting and duplicate detection.
+"""
+from datetime import datetime, timezone
+
+from backend.db import crud
+from backend.strategy_engine.status_manager import StrategyStatus
+from backend.strategy_engine.strategy_fingerprint import create_strategy_fingerprint
+from backend.workers.monitoring_worker import MonitoringWorker
+
+
+RULESET = {
+    "ticker": "AAPL",
+    "timeframe": "1d",
+    "entry_rules": [{"indicator": "rsi", "operator": "<", "value": 30}],
+    "stop_loss": 0.02,
+}
+
+
+class TestStrategyFingerprint:
+    """Test fingerprint storage and duplicate lookup."""
+
+    def test_fingerprint_ignores_key_order(self):
+        """Test equal rulesets fingerprint the same regardless of key order."""
+        reordered = dict(reversed(list(RULESET.items())))
+        assert create_strategy_fingerprint(reordered) == create_strategy_fingerprint(RULESET)
+
+    def test_fingerprint_stored_on_create_and_update(self, db_session):
+        """Test crud keeps the stored fingerprint in sync with the ruleset."""
+        strategy = crud.create_user_strategy(db_session, user_id="u1", name="s", ruleset=RULESET)
+        assert strategy.strategy_fingerprint == create_strategy_fingerprint(RULESET)
+
+        changed = {**RULESET, "timeframe": "1h"}
+        strategy = crud.update_user_strategy(db_session, strategy.id, ruleset=changed)
+        assert strategy.strategy_fingerprint == create_strategy_fingerprint(changed)
+
+    def test_ruleset_change_clears_last_backtest(self, db_session):
+        """Test editing the rules marks the strategy for a fresh backtest."""
+        strategy = crud.create_user_strategy(db_session, user_id="u1", name="s", ruleset=RULESET)
+        strategy = crud.update_user_strategy(db_session, strategy.id, last_backtest_at=datetime.now(timezone.utc))
+        strategy.last_evolution_check_at = strategy.last_backtest_at
+
+        strategy = crud.update_user_strategy(db_session, strategy.id, ruleset=dict(RULESET))
+        assert strategy.last_backtest_at is not None  # Same rules: results still hold
+
+        strategy = crud.update_user_strategy(db_session, strategy.id, ruleset={**RULESET, "stop_loss": 0.05})
+        assert strategy.last_backtest_at is None
+        assert strategy.last_evolution_check_at is None  # Back in the never-backtested priority
+
+    def test_check_duplicate(self, db_session):
+        """Test duplicates are found by fingerprint, skipping terminal strategies."""
+        worker = MonitoringWorker.__new__(MonitoringWorker)
+        original = crud.create_user_strategy(db_session, user_id="u1", name="a", ruleset=RULESET)
+        upload = crud.create_user_strategy(db_session, user_id="u2", name="b", ruleset=dict(RULESET))
+        assert worker._check_duplicate(db_session, upload).id == original.id
+
+        crud.update_user_strategy(db_session, original.id, status=StrategyStatus.DISCARDED)
+        assert worker._check_duplicate(db_session, upload) is None
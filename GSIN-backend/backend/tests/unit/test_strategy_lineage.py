@@ -0,0 +1,79 @@
+# backend/tests/unit/test_strategy_lineage.py
+"""
+Unit tests for strategy lineage traversal.
+"""
+from backend.db import crud
+from backend.db.models import StrategyLineage
+from backend.services.royalty_service import royalty_service
+from backend.workers.evolution_worker import LineageIndex
+
+
+def add_lineage(db_session, links):
+    """Insert (parent, child) lineage rows."""
+    for i, (parent, child) in enumerate(links):
+        db_session.add(StrategyLineage(
+            id=f"lineage-{i}",
+            parent_strategy_id=parent,
+            child_strategy_id=child,
+            mutation_type="mutation",
+        ))
+    db_session.commit()
+
+
+class TestLineageRoot:
+    """Test lineage root lookup."""
+
+    def test_original_strategy_is_its_own_root(self, db_session):
+        """Test a strategy without parents is the root at depth 0."""
+        assert crud.get_lineage_root_and_depth(db_session, "a") == ("a", 0)
+
+    def test_walks_to_root(self, db_session):
+        """Test the root and mutation count are found in one query."""
+        add_lineage(db_session, [("a", "b"), ("b", "c"), ("c", "d")])
+        assert crud.get_lineage_root_and_depth(db_session, "b") == ("a", 1)
+        assert crud.get_lineage_root_and_depth(db_session, "d") == ("a", 3)
+
+    def test_crossover_returns_deepest_root(self, db_session):
+        """Test a child with two parents resolves to the deeper original."""
+        add_lineage(db_session, [("a", "b"), ("b", "c"), ("x", "c")])
+        assert crud.get_lineage_root_and_depth(db_session, "c") == ("a", 2)
+
+    def test_bulk_lineage_links_all_parents(self, db_session):
+        """Test a crossover child is linked to every parent in one call."""
+        crud.create_strategy_lineages(db_session, ["a", "x"], "c", "crossover")
+        parents = {l.parent_strategy_id for l in crud.get_strategy_lineages_by_child(db_session, "c")}
+        assert parents == {"a", "x"}
+
+
+class TestLineageIndex:
+    """Test the per-cycle in-memory lineage index."""
+
+    def test_matches_query(self, db_session):
+        """Test the index resolves the same roots as the recursive query."""
+        add_lineage(db_session, [("a", "b"), ("b", "c"), ("x", "c"), ("c", "d"), ("y", "z")])
+        index = LineageIndex.load(db_session)
+        for sid in ["a", "b", "c", "d", "z", "unknown"]:
+            assert index.root_and_depth(sid) == crud.get_lineage_root_and_depth(db_session, sid)
+
+    def test_add_extends_loaded_lineage(self, db_session):
+        """Test links created during the cycle are visible without reloading."""
+        add_lineage(db_session, [("a", "b")])
+        index = LineageIndex.load(db_session)
+        index.add("c", "b")
+        assert index.root_and_depth("c") == ("a", 2)
+
+
+class TestRoyaltyLineageWalk:
+    """Test the royalty service's lineage walk."""
+
+    def test_walks_to_original(self, db_session):
+        """Test the original and mutation count follow the first parent."""
+        add_lineage(db_session, [("a", "b"), ("b", "c")])
+        assert royalty_service._find_original_strategy("c", db_session) == "a"
+        assert royalty_service._count_mutations_from_original("a", "c", db_session) == 2
+
+    def test_cycle_is_bounded(self, db_session):
+        """Test a lineage cycle stops at the depth cap instead of recursing forever."""
+        add_lineage(db_session, [("a", "b"), ("b", "a")])
+        assert royalty_service._find_original_strategy("a", db_session) in {"a", "b"}
+        assert royalty_service._count_mutations_from_original("x", "a", db_session) == crud.MAX_LINEAGE_DEPTH
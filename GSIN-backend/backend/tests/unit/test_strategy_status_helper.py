@@ -0,0 +1,37 @@
+# backend/tests/unit/test_strategy_status_helper.py
+"""
+Unit tests for centralized strategy status changes and their notifications.
+"""
+from backend.db import crud
+from backend.db.models import Notification
+from backend.strategy_engine.status_manager import StrategyStatus
+from backend.strategy_engine.strategy_status_helper import set_strategy_status, PENDING_NOTIFICATIONS_KEY
+
+
+RULESET = {"ticker": "AAPL", "timeframe": "1d"}
+
+
+class TestSetStrategyStatus:
+    """Test set_strategy_status."""
+
+    def test_immediate_write_sends_notification(self, db_session):
+        """Test a direct status change updates the row and notifies the owner."""
+        strategy = crud.create_user_strategy(db_session, user_id="u1", name="s", ruleset=RULESET)
+
+        assert set_strategy_status(db_session, strategy, StrategyStatus.CANDIDATE)
+
+        assert crud.get_user_strategy(db_session, strategy.id).status == StrategyStatus.CANDIDATE
+        assert db_session.query(Notification).filter_by(user_id="u1").count() == 1
+
+    def test_pending_updates_queue_notification(self, db_session):
+        """Test a deferred status change queues its notification instead of writing it."""
+        strategy = crud.create_user_strategy(db_session, user_id="u1", name="s", ruleset=RULESET)
+        update = {"id": strategy.id}
+
+        assert set_strategy_status(db_session, strategy, StrategyStatus.DISCARDED, pending_updates=update)
+
+        assert update["status"] == StrategyStatus.DISCARDED
+        [row] = update[PENDING_NOTIFICATIONS_KEY]
+        assert row["user_id"] == "u1"
+        assert row["title"] == "Strategy Deprecated"
+        assert db_session.query(Notification).count() == 0
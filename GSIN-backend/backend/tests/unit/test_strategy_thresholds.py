@@ -0,0 +1,20 @@
+# backend/tests/unit/test_strategy_thresholds.py
+"""
+Unit tests for the per-phase evolution thresholds.
+"""
+import pytest
+
+from backend.strategy_engine.strategy_thresholds import EvolutionPhase, get_thresholds_for_phase
+
+
+class TestGetThresholdsForPhase:
+    """Test get_thresholds_for_phase."""
+
+    def test_cached_thresholds_are_read_only(self):
+        """Test the shared cached thresholds can't be modified by a caller."""
+        thresholds = get_thresholds_for_phase(EvolutionPhase.GROWTH)
+
+        with pytest.raises(TypeError):
+            thresholds["winrate_min"] = 0.0
+
+        assert get_thresholds_for_phase(EvolutionPhase.GROWTH)["winrate_min"] == 0.55
@@ -0,0 +1,29 @@
+# backend/tests/unit/test_worker_scheduler.py
+"""
+Unit tests for the periodic worker scheduler.
+"""
+import asyncio
+
+from backend.workers.scheduler import run_periodic, stop_background_workers
+
+
+class TestRunPeriodic:
+    """Test periodic worker scheduling."""
+
+    async def test_keeps_running_after_errors(self):
+        """Test a failing cycle is logged and the next one still runs."""
+        calls = []
+
+        def run_once():
+            calls.append(len(calls))
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return {"ok": True}
+
+        task = asyncio.create_task(run_periodic("test worker", run_once, 0.01))
+        while len(calls) < 3:
+            await asyncio.sleep(0.01)
+        await stop_background_workers([task])
+
+        assert task.cancelled()
+        assert len(calls) >= 3
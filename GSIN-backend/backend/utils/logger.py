@@ -2,18 +2,31 @@
 """
 Enhanced logging utility with structured logging support.
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from typing import Optional, Dict, Any
 import json
 
+# Records are handed to a queue and written to stdout by a background thread,
+# so worker threads logging mid-cycle never block on the stdout write
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _stdout_handler, respect_handler_level=True)
+_log_listener.start()
+# Drain whatever is still queued on shutdown
+atexit.register(_log_listener.stop)
+
 # Configure root logger
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format='%(message)s',  # Full format is applied by the stdout handler
     handlers=[
-        logging.StreamHandler(sys.stdout)
+        logging.handlers.QueueHandler(_log_queue)
     ]
 )
 
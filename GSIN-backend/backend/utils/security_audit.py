@@ -2,96 +2,341 @@
 """
 Security audit utilities for checking common vulnerabilities.
 """
+import ast
+import hashlib
+import json
+import mmap
 import os
 import re
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any
 from pathlib import Path
 
 
+# (group name, pattern, issue type). Patterns are bytes: files are scanned as
+# raw bytes, which skips UTF-8 decoding and all patterns are pure ASCII.
+SECRET_PATTERNS = [
+    ("password", rb'password\s*=\s*["\'][^"\']+["\']', "Hardcoded password"),
+    ("api_key", rb'api_key\s*=\s*["\'][^"\']+["\']', "Hardcoded API key"),
+    ("secret", rb'secret\s*=\s*["\'][^"\']+["\']', "Hardcoded secret"),
+    ("private_key", rb'private_key\s*=\s*["\'][^"\']+["\']', "Hardcoded private key"),
+    ("jwt_secret", rb'JWT_SECRET\s*=\s*["\'][^"\']+["\']', "Hardcoded JWT secret"),
+]
+
+SENSITIVE_VARS = [b"JWT_SECRET", b"API_KEY", b"SECRET", b"PASSWORD", b"TOKEN"]
+
+# Lowercase substrings at least one of which must be present for a check's
+# regex to possibly match; files without any of them skip that regex entirely
+SECRET_KEYWORDS = (b"password", b"api_key", b"secret", b"private_key")
+SENSITIVE_KEYWORDS = tuple(var.lower() for var in SENSITIVE_VARS)
+
+# Files larger than this are memory-mapped instead of read into memory
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+# Per-file results are cached under the audit root, keyed by mtime/size
+CACHE_FILENAME = ".gsin_audit_cache.json"
+# Bump when check logic changes in a way the pattern stamp doesn't capture
+CACHE_FORMAT_VERSION = 3
+
+# Result categories produced by the shared per-file scan
+FILE_CHECKS = ("hardcoded_secrets", "sql_injection", "weak_crypto", "env_vars")
+
+# Directories never descended into (dot-directories are skipped as well)
+PRUNED_DIRS = {
+    "__pycache__", ".venv", "venv", ".git", "node_modules",
+    ".tox", ".mypy_cache", "dist", "build",
+    "tests", "test",
+}
+
+
+WEAK_HASHES = {"md5", "sha1"}
+
+
+def _find_risky_calls(tree: ast.AST) -> Tuple[bool, bool]:
+    """
+    Structurally detect SQL formatting and weak hashing in a parsed module.
+    
+    Returns (sql_injection, weak_crypto). Unlike the text patterns, strings
+    and comments are ignored, and parameterised queries such as
+    ``execute("... %s", (x,))`` are not flagged.
+    """
+    sql_found = crypto_found = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute):
+            # hashlib.md5 / hashlib.sha1
+            if (node.attr in WEAK_HASHES and isinstance(node.value, ast.Name)
+                    and node.value.id == "hashlib"):
+                crypto_found = True
+        elif isinstance(node, ast.Call) and node.args:
+            # execute("..." % args)
+            func = node.func
+            name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+            first = node.args[0]
+            if name == "execute" and isinstance(first, ast.BinOp) and isinstance(first.op, ast.Mod):
+                sql_found = True
+        if sql_found and crypto_found:
+            break
+    return sql_found, crypto_found
+
+
+def _should_skip(name: str, is_dir: bool) -> bool:
+    """
+    Return True if a directory or file entry is excluded from the audit.
+    
+    Matches exact names rather than any "test" substring, so e.g. a module
+    under "latest/" is still audited.
+    """
+    if is_dir:
+        return name in PRUNED_DIRS or name.startswith(".")
+    return (
+        not name.endswith(".py")
+        or name.startswith("test_")
+        or name.endswith("_test.py")
+        or name == "conftest.py"
+    )
+
+
+def _walk_py(root: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (path, relative_path) for every auditable Python file under root.
+    
+    Uses an explicit stack of os.scandir iterators so cache, virtualenv and
+    test directories are pruned before they are entered, rather than being
+    enumerated by rglob and filtered afterwards.
+    """
+    stack = [(root, "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    rel_path = os.path.join(rel_dir, name) if rel_dir else name
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        if _should_skip(name, is_dir):
+                            continue
+                        if is_dir:
+                            stack.append((entry.path, rel_path))
+                        else:
+                            yield entry.path, rel_path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
 class SecurityAuditor:
     """Security audit tool for codebase."""
     
-    def __init__(self, root_path: str = None):
+    def __init__(self, root_path: str = None, use_cache: bool = True):
         self.root_path = Path(root_path) if root_path else Path(__file__).parent.parent.parent
         self.issues: List[Dict[str, Any]] = []
-    
-    def check_hardcoded_secrets(self) -> List[Dict[str, Any]]:
-        """Check for hardcoded secrets in code."""
-        issues = []
-        secret_patterns = [
-            (r'password\s*=\s*["\'][^"\']+["\']', "Hardcoded password"),
-            (r'api_key\s*=\s*["\'][^"\']+["\']', "Hardcoded API key"),
-            (r'secret\s*=\s*["\'][^"\']+["\']', "Hardcoded secret"),
-            (r'private_key\s*=\s*["\'][^"\']+["\']', "Hardcoded private key"),
-            (r'JWT_SECRET\s*=\s*["\'][^"\']+["\']', "Hardcoded JWT secret"),
-        ]
-        
-        for py_file in self.root_path.rglob("*.py"):
-            if "test" in str(py_file) or "__pycache__" in str(py_file):
-                continue
-            
-            try:
-                content = py_file.read_text()
-                for pattern, issue_type in secret_patterns:
-                    matches = re.finditer(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        issues.append({
-                            "type": issue_type,
-                            "file": str(py_file.relative_to(self.root_path)),
-                            "line": content[:match.start()].count('\n') + 1,
-                            "severity": "HIGH",
-                            "message": f"Potential hardcoded secret found"
-                        })
-            except Exception:
-                pass
+        self.use_cache = use_cache
+        self.cache_path = self.root_path / CACHE_FILENAME
         
-        return issues
+        # Patterns are compiled once so the per-file loop only does matching.
+        # All secret patterns are unioned into one regex so each file is scanned
+        # once; m.lastgroup identifies which pattern hit. The alternation sits in
+        # a lookahead so overlapping hits (e.g. "secret" inside "JWT_SECRET = ...")
+        # are still reported separately, as with one scan per pattern.
+        self._secrets_re = re.compile(
+            b"(?=" + b"|".join(
+                b"(?P<" + name.encode() + b">" + pattern + b")" for name, pattern, _ in SECRET_PATTERNS
+            ) + b")",
+            re.IGNORECASE,
+        )
+        self._secret_types = {name: issue_type for name, _, issue_type in SECRET_PATTERNS}
+        # Spans inside execute(...) are capped so unbalanced parentheses can't
+        # drive quadratic backtracking; calls may still span lines
+        self._sql_re = re.compile(rb'execute\s*\([^)]{0,500}%[^)]{0,500}\)')
+        self._crypto_re = re.compile(rb'hashlib\.(?:md5|sha1)\b')
+        # Rest of each line following a log/print call; sensitive vars are then
+        # looked up in that tail, so each file is scanned once instead of per var
+        self._log_line_re = re.compile(rb'(?:log|print)[^\n]*', re.IGNORECASE)
+        
+        # Cached results are only valid for the exact pattern set that produced them
+        stamp = hashlib.sha256()
+        for compiled in (self._secrets_re, self._sql_re, self._crypto_re, self._log_line_re):
+            stamp.update(compiled.pattern + b"\0")
+        stamp.update(b",".join(SENSITIVE_VARS))
+        stamp.update(str(CACHE_FORMAT_VERSION).encode())
+        self._cache_version = stamp.hexdigest()
+        self._cache: Dict[str, Any] = {}
     
-    def check_sql_injection(self) -> List[Dict[str, Any]]:
-        """Check for potential SQL injection vulnerabilities."""
-        issues = []
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load cached per-file results, discarding them if patterns changed."""
+        if not self.use_cache:
+            return {}
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self._cache_version:
+            return {}
+        return data.get("files", {})
+    
+    def _save_cache(self, files: Dict[str, Any]) -> None:
+        """Persist per-file results; failures only cost a rescan next time."""
+        if not self.use_cache:
+            return
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"version": self._cache_version, "files": files}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+    
+    def _iter_py_files(self) -> Iterator[Tuple[str, str]]:
+        """Yield (path, relative_path) for the Python files to audit."""
+        return _walk_py(str(self.root_path))
+    
+    def _scan_content(self, rel_path: str, content: Union[bytes, mmap.mmap]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run every per-file textual check against already-loaded content.
         
-        for py_file in self.root_path.rglob("*.py"):
-            if "test" in str(py_file) or "__pycache__" in str(py_file):
-                continue
-            
+        content may be an mmap for large files; only find() and regex matching
+        are used on it directly (``in`` on an mmap tests single bytes).
+        """
+        found: Dict[str, List[Dict[str, Any]]] = {category: [] for category in FILE_CHECKS}
+        # Cheap substring screens first; most files are clean and never reach
+        # the regexes. Mapped files skip the case-insensitive screens rather
+        # than materialising a lowercased copy.
+        lc = content.lower() if isinstance(content, bytes) else None
+        
+        # Hardcoded secrets
+        if lc is None or any(keyword in lc for keyword in SECRET_KEYWORDS):
+            # Matches arrive in offset order, so a running line counter advanced
+            # with find() gives line numbers in one sweep without slicing
+            line, pos = 1, 0
+            for match in self._secrets_re.finditer(content):
+                start = match.start()
+                nl = content.find(b"\n", pos, start)
+                while nl != -1:
+                    line += 1
+                    pos = nl + 1
+                    nl = content.find(b"\n", pos, start)
+                found["hardcoded_secrets"].append({
+                    "type": self._secret_types[match.lastgroup],
+                    "file": rel_path,
+                    "line": line,
+                    "severity": "HIGH",
+                    "message": f"Potential hardcoded secret found"
+                })
+        
+        # SQL formatting and weak hashing are matched on the AST when the file
+        # parses, whatever its size; the regexes are the fallback for
+        # unparsable files. Mapped files are only copied out to be parsed once
+        # the substring screen has matched.
+        sql_candidate = content.find(b"execute") != -1 and content.find(b"%") != -1
+        crypto_candidate = content.find(b"hashlib.") != -1
+        sql_found = crypto_found = False
+        if sql_candidate or crypto_candidate:
             try:
-                content = py_file.read_text()
-                # Check for string formatting in SQL queries
-                if re.search(r'execute\s*\([^)]*%[^)]*\)', content):
-                    issues.append({
-                        "type": "SQL Injection Risk",
-                        "file": str(py_file.relative_to(self.root_path)),
+                tree = ast.parse(content if isinstance(content, bytes) else bytes(content))
+            except (SyntaxError, ValueError):
+                tree = None
+            if tree is not None:
+                sql_found, crypto_found = _find_risky_calls(tree)
+            else:
+                sql_found = sql_candidate and self._sql_re.search(content) is not None
+                crypto_found = crypto_candidate and self._crypto_re.search(content) is not None
+        
+        # Check for string formatting in SQL queries
+        if sql_found:
+            found["sql_injection"].append({
+                "type": "SQL Injection Risk",
+                "file": rel_path,
+                "severity": "HIGH",
+                "message": "Potential SQL injection via string formatting"
+            })
+        
+        # Check for MD5 or SHA1 usage
+        if crypto_found:
+            found["weak_crypto"].append({
+                "type": "Weak Cryptography",
+                "file": rel_path,
+                "severity": "MEDIUM",
+                "message": "MD5 or SHA1 detected - use SHA256 or better"
+            })
+        
+        # Check for logging of sensitive env vars
+        if lc is None or (
+            (b"log" in lc or b"print" in lc) and any(keyword in lc for keyword in SENSITIVE_KEYWORDS)
+        ):
+            logged = b" ".join(self._log_line_re.findall(content)).upper()
+            for var in SENSITIVE_VARS:
+                if var in logged:
+                    found["env_vars"].append({
+                        "type": "Sensitive Data Exposure",
+                        "file": rel_path,
                         "severity": "HIGH",
-                        "message": "Potential SQL injection via string formatting"
+                        "message": f"Potential logging of sensitive variable: {var.decode()}"
                     })
-            except Exception:
-                pass
         
-        return issues
+        return found
     
-    def check_weak_crypto(self) -> List[Dict[str, Any]]:
-        """Check for weak cryptographic implementations."""
-        issues = []
+    def _scan_one(self, file_entry: Tuple[str, str]) -> Optional[Tuple[List[int], Dict[str, List[Dict[str, Any]]]]]:
+        """
+        Read and scan a single file.
         
-        for py_file in self.root_path.rglob("*.py"):
-            if "test" in str(py_file) or "__pycache__" in str(py_file):
-                continue
+        Returns ([mtime_ns, size], issues), reusing the cached issues when the
+        file is unchanged, or None if it can't be read.
+        """
+        path, rel_path = file_entry
+        try:
+            st = os.stat(path)
+            fingerprint = [st.st_mtime_ns, st.st_size]
+            cached = self._cache.get(rel_path)
+            if cached and cached[:2] == fingerprint:
+                return fingerprint, cached[2]
             
-            try:
-                content = py_file.read_text()
-                # Check for MD5 or SHA1 usage
-                if re.search(r'hashlib\.(md5|sha1)', content):
-                    issues.append({
-                        "type": "Weak Cryptography",
-                        "file": str(py_file.relative_to(self.root_path)),
-                        "severity": "MEDIUM",
-                        "message": "MD5 or SHA1 detected - use SHA256 or better"
-                    })
-            except Exception:
-                pass
+            with open(path, "rb") as f:
+                if st.st_size > MMAP_THRESHOLD_BYTES:
+                    # Large (e.g. generated) files are matched straight from
+                    # the page cache instead of being copied into memory
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return fingerprint, self._scan_content(rel_path, mm)
+                content = f.read()
+            return fingerprint, self._scan_content(rel_path, content)
+        except Exception:
+            return None
+    
+    def _scan_files(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Read each Python file once and run all per-file checks on it."""
+        results: Dict[str, List[Dict[str, Any]]] = {category: [] for category in FILE_CHECKS}
+        files = list(self._iter_py_files())
+        self._cache = self._load_cache()
+        new_cache: Dict[str, Any] = {}
         
-        return issues
+        # Files are independent; reads and C-level regex matching overlap across
+        # threads. Each worker returns its own issues, merged here in file order.
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+            for (_, rel_path), scanned in zip(files, executor.map(self._scan_one, files)):
+                if not scanned:
+                    continue
+                fingerprint, found = scanned
+                new_cache[rel_path] = fingerprint + [found]
+                for category, issues in found.items():
+                    results[category].extend(issues)
+        
+        # Rewriting from this run also drops entries for deleted files
+        self._save_cache(new_cache)
+        return results
+    
+    def check_hardcoded_secrets(self) -> List[Dict[str, Any]]:
+        """Check for hardcoded secrets in code."""
+        return self._scan_files()["hardcoded_secrets"]
+    
+    def check_sql_injection(self) -> List[Dict[str, Any]]:
+        """Check for potential SQL injection vulnerabilities."""
+        return self._scan_files()["sql_injection"]
+    
+    def check_weak_crypto(self) -> List[Dict[str, Any]]:
+        """Check for weak cryptographic implementations."""
+        return self._scan_files()["weak_crypto"]
     
     def check_cors_config(self) -> List[Dict[str, Any]]:
         """Check CORS configuration."""
@@ -113,38 +358,18 @@ class SecurityAuditor:
     
     def check_env_vars(self) -> List[Dict[str, Any]]:
         """Check environment variable usage."""
-        issues = []
-        
-        # Check if sensitive env vars are being logged
-        for py_file in self.root_path.rglob("*.py"):
-            if "test" in str(py_file) or "__pycache__" in str(py_file):
-                continue
-            
-            try:
-                content = py_file.read_text()
-                # Check for logging of sensitive env vars
-                sensitive_vars = ["JWT_SECRET", "API_KEY", "SECRET", "PASSWORD", "TOKEN"]
-                for var in sensitive_vars:
-                    if re.search(rf'log.*{var}|print.*{var}', content, re.IGNORECASE):
-                        issues.append({
-                            "type": "Sensitive Data Exposure",
-                            "file": str(py_file.relative_to(self.root_path)),
-                            "severity": "HIGH",
-                            "message": f"Potential logging of sensitive variable: {var}"
-                        })
-            except Exception:
-                pass
-        
-        return issues
+        return self._scan_files()["env_vars"]
     
     def run_full_audit(self) -> Dict[str, Any]:
         """Run full security audit."""
+        # One pass over the tree feeds all per-file checks
+        file_results = self._scan_files()
         results = {
-            "hardcoded_secrets": self.check_hardcoded_secrets(),
-            "sql_injection": self.check_sql_injection(),
-            "weak_crypto": self.check_weak_crypto(),
+            "hardcoded_secrets": file_results["hardcoded_secrets"],
+            "sql_injection": file_results["sql_injection"],
+            "weak_crypto": file_results["weak_crypto"],
             "cors_config": self.check_cors_config(),
-            "env_vars": self.check_env_vars(),
+            "env_vars": file_results["env_vars"],
         }
         
         total_issues = sum(len(issues) for issues in results.values())
@@ -6,23 +6,19 @@ import os
 from pathlib import Path
 from dotenv import dotenv_values
 
-# Try to import Sentry
+# Load config once; both the import-failure warning and init_sentry use it
+CFG_PATH = Path(__file__).resolve().parents[3] / "config" / ".env"
+_CFG = dotenv_values(str(CFG_PATH)) if CFG_PATH.exists() else {}
+
+# Try to import Sentry (integrations are imported in init_sentry, only when used)
 try:
     import sentry_sdk
-    from sentry_sdk.integrations.fastapi import FastApiIntegration
-    from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
-    from sentry_sdk.integrations.httpx import HttpxIntegration
     SENTRY_AVAILABLE = True
 except ImportError:
     sentry_sdk = None
     SENTRY_AVAILABLE = False
     # Only show warning if SENTRY_DSN is set (user wants Sentry but SDK not installed)
-    import os
-    from pathlib import Path
-    from dotenv import dotenv_values
-    CFG_PATH = Path(__file__).resolve().parents[3] / "config" / ".env"
-    cfg = dotenv_values(str(CFG_PATH)) if CFG_PATH.exists() else {}
-    if os.getenv("SENTRY_DSN") or cfg.get("SENTRY_DSN"):
+    if os.getenv("SENTRY_DSN") or _CFG.get("SENTRY_DSN"):
         print("WARNING: sentry-sdk not installed. Error monitoring disabled. Install with: pip install sentry-sdk")
 
 
@@ -31,17 +27,17 @@ def init_sentry():
     if not SENTRY_AVAILABLE:
         return False
     
-    # Load config
-    CFG_PATH = Path(__file__).resolve().parents[3] / "config" / ".env"
-    cfg = dotenv_values(str(CFG_PATH)) if CFG_PATH.exists() else {}
-    
-    sentry_dsn = os.environ.get("SENTRY_DSN") or cfg.get("SENTRY_DSN")
+    sentry_dsn = os.environ.get("SENTRY_DSN") or _CFG.get("SENTRY_DSN")
     
     if not sentry_dsn:
         print("⚠️  SENTRY_DSN not set. Error monitoring disabled.")
         return False
     
     try:
+        from sentry_sdk.integrations.fastapi import FastApiIntegration
+        from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+        from sentry_sdk.integrations.httpx import HttpxIntegration
+        
         sentry_sdk.init(
             dsn=sentry_dsn,
             integrations=[
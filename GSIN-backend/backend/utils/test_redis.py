@@ -4,6 +4,8 @@ Test Redis connection and functionality.
 Run this script to verify Redis is working correctly.
 """
 import sys
+import json
+import time
 from pathlib import Path
 
 # Add parent directory to path
@@ -48,36 +50,60 @@ def test_redis_connection():
         print(f"   ❌ Ping error: {e}")
         return False
     
-    # Test 2: Set/Get
-    print("\n💾 Test 2: Set/Get")
+    # Test 2: Set/Get, Increment and Exists in one round trip. These commands
+    # don't depend on each other's results, so they are pipelined instead of
+    # paying one network RTT each.
+    print("\n💾 Test 2: Set/Get, Increment, Exists (pipelined)")
     try:
         test_key = "gsin_test:connection"
         test_value = {"test": True, "timestamp": "2024-12-19"}
+        counter_key = "gsin_test:counter"
+        exists_key = "gsin_test:exists"
+        
+        started = time.perf_counter()
+        pipe = redis_client.client.pipeline(transaction=False)
+        pipe.delete(counter_key)
+        pipe.setex(test_key, 60, json.dumps(test_value))
+        pipe.get(test_key)
+        pipe.incrby(counter_key, 1)
+        pipe.incrby(counter_key, 2)
+        pipe.expire(counter_key, 60)
+        pipe.setex(exists_key, 60, "test")
+        pipe.exists(exists_key)
+        pipe.delete(test_key, counter_key, exists_key)
+        _, set_ok, retrieved, value1, value2, _, _, exists_count, _ = pipe.execute()
+        elapsed_ms = (time.perf_counter() - started) * 1000
         
-        # Set value
-        success = redis_client.set(test_key, test_value, ttl_seconds=60)
-        if not success:
+        if not set_ok:
             print("   ❌ Set failed")
             return False
         print("   ✅ Set successful")
         
-        # Get value
-        retrieved = redis_client.get(test_key)
-        if retrieved == test_value:
+        if retrieved is not None and json.loads(retrieved) == test_value:
             print("   ✅ Get successful (value matches)")
         else:
             print(f"   ⚠️  Get successful but value mismatch: {retrieved}")
         
-        # Cleanup
-        redis_client.delete(test_key)
-        print("   ✅ Cleanup successful")
+        if value1 == 1 and value2 == 3:
+            print("   ✅ Increment successful")
+        else:
+            print(f"   ⚠️  Increment unexpected values: {value1}, {value2}")
+        
+        if exists_count:
+            print("   ✅ Exists check successful")
+        else:
+            print("   ❌ Exists check failed")
+            return False
+        
+        print(f"   ✅ Cleanup successful ({elapsed_ms:.1f} ms for one round trip)")
     except Exception as e:
-        print(f"   ❌ Set/Get error: {e}")
+        print(f"   ❌ Pipeline error: {e}")
         return False
     
-    # Test 3: Lock
+    # Test 3: Lock (sequential: each step depends on the previous one)
     print("\n🔒 Test 3: Distributed Lock")
     try:
+        started = time.perf_counter()
         lock_key = "gsin_test:lock"
         lock_obj = redis_client.acquire_lock(lock_key, timeout_seconds=10)
         
@@ -97,6 +123,7 @@ def test_redis_connection():
                 print("   ✅ Lock released")
             else:
                 print("   ⚠️  Lock release failed")
+            print(f"   ⏱  {(time.perf_counter() - started) * 1000:.1f} ms")
         else:
             print("   ❌ Lock acquisition failed")
             return False
@@ -104,42 +131,6 @@ def test_redis_connection():
         print(f"   ❌ Lock error: {e}")
         return False
     
-    # Test 4: Increment
-    print("\n🔢 Test 4: Increment Counter")
-    try:
-        counter_key = "gsin_test:counter"
-        value1 = redis_client.increment(counter_key, amount=1, ttl_seconds=60)
-        value2 = redis_client.increment(counter_key, amount=2, ttl_seconds=60)
-        
-        if value1 == 1 and value2 == 3:
-            print("   ✅ Increment successful")
-        else:
-            print(f"   ⚠️  Increment unexpected values: {value1}, {value2}")
-        
-        # Cleanup
-        redis_client.delete(counter_key)
-    except Exception as e:
-        print(f"   ❌ Increment error: {e}")
-        return False
-    
-    # Test 5: Exists
-    print("\n🔍 Test 5: Key Exists")
-    try:
-        exists_key = "gsin_test:exists"
-        redis_client.set(exists_key, "test", ttl_seconds=60)
-        
-        if redis_client.exists(exists_key):
-            print("   ✅ Exists check successful")
-        else:
-            print("   ❌ Exists check failed")
-            return False
-        
-        # Cleanup
-        redis_client.delete(exists_key)
-    except Exception as e:
-        print(f"   ❌ Exists error: {e}")
-        return False
-    
     print("\n" + "=" * 60)
     print("✅ ALL TESTS PASSED - Redis is working correctly!")
     print("=" * 60)
@@ -3,20 +3,56 @@
 Background worker for running backtests asynchronously.
 Prevents backtests from blocking API requests.
 """
+import os
 import uuid
 import threading
-from typing import Dict, Any, Optional
-from datetime import datetime, timezone
+import multiprocessing
+from typing import Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from threading import Lock
 
-from ..strategy_engine.backtest_engine import BacktestEngine
+from ..strategy_engine.backtest_engine import BacktestEngine, init_backtest_process
+from ..strategy_engine.ratelimit import TWELVE_DATA_BUCKET
 from ..strategy_engine.scoring import score_strategy
 from ..strategy_engine.status_manager import determine_strategy_status, should_discard_strategy
-from ..db.session import get_db
+from ..strategy_engine.strategy_explanation import generate_human_explanation
+from ..db.session import SessionLocal
+from ..db.models import AdminSettings
 from ..db import crud
 
+# Upper bound on concurrent backtests (matches the admin settings limit). The
+# thread pool is sized to this once; the configured limit is enforced by a
+# semaphore so it can change without recreating the pool.
+MAX_BACKTEST_WORKERS = 20
+
+
+def _compute_backtest(
+    symbol: str,
+    ruleset: Dict[str, Any],
+    timeframe: str,
+    start_date: datetime,
+    end_date: datetime
+) -> Tuple[Dict[str, Any], float]:
+    """
+    Run the CPU-bound part of a job (backtest + scoring).
+    
+    Module-level so it can be pickled into a worker process; it touches no
+    database state, so all reads and writes stay in the calling thread.
+    """
+    engine = BacktestEngine()
+    results = engine.run_backtest(
+        symbol=symbol,
+        ruleset=ruleset,
+        timeframe=timeframe,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    score = score_strategy(results, use_test_metrics=True)
+    return results, score
+
 
 class BacktestJobStatus(str, Enum):
     PENDING = "pending"
@@ -56,11 +92,47 @@ class BacktestWorker:
     """Manages background backtest jobs."""
     
     def __init__(self, max_workers: int = 3):
-        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="backtest")
+        self.executor = ThreadPoolExecutor(max_workers=MAX_BACKTEST_WORKERS, thread_name_prefix="backtest")
+        self.max_workers = min(max_workers, MAX_BACKTEST_WORKERS)
+        self._semaphore = threading.BoundedSemaphore(self.max_workers)
         self.jobs: Dict[str, BacktestJob] = {}
         self.lock = Lock()
         # Clean up old jobs after 1 hour
         self.job_retention_hours = 1
+        # Finished jobs are swept on submit, at most once per interval
+        self.cleanup_interval_seconds = 60
+        self._last_cleanup = datetime.now(timezone.utc)
+        # Backtests run in worker processes so concurrent jobs aren't serialized
+        # on the GIL; created on first use
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get or create the process pool used for backtest computation."""
+        with self.lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=min(MAX_BACKTEST_WORKERS, os.cpu_count() or 1),
+                    # spawn: forking a threaded server process is unsafe
+                    mp_context=multiprocessing.get_context("spawn"),
+                    # Children fetch candles, so they share the parent's rate limit
+                    initializer=init_backtest_process,
+                    initargs=(TWELVE_DATA_BUCKET,),
+                )
+            return self._process_pool
+    
+    def _run_in_process(self, job: BacktestJob, ruleset: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+        """Run a job's backtest in the process pool, falling back to this thread."""
+        args = (job.symbol, ruleset, job.timeframe, job.start_date, job.end_date)
+        pool = self._get_process_pool()
+        try:
+            return pool.submit(_compute_backtest, *args).result()
+        except BrokenProcessPool:
+            # A worker process died; drop the pool so the next job gets a fresh one
+            with self.lock:
+                if self._process_pool is pool:
+                    self._process_pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            return _compute_backtest(*args)
     
     def submit_backtest(
         self,
@@ -87,124 +159,127 @@ class BacktestWorker:
         with self.lock:
             self.jobs[job_id] = job
         
+        now = datetime.now(timezone.utc)
+        if (now - self._last_cleanup).total_seconds() >= self.cleanup_interval_seconds:
+            self._last_cleanup = now
+            self.cleanup_expired_jobs()
+        
         # Submit to executor
         self.executor.submit(self._run_backtest, job)
         
         return job_id
     
     def _run_backtest(self, job: BacktestJob):
-        """Run the backtest in background thread."""
+        """Run the backtest in background thread once a concurrency slot is free."""
+        # Hold a reference: update_max_workers may swap in a new semaphore while
+        # this job runs, and the permit must go back to the one it came from
+        semaphore = self._semaphore
+        with semaphore:
+            self._execute_backtest(job)
+    
+    def _execute_backtest(self, job: BacktestJob):
+        """Execute a backtest job and record its results."""
         job.status = BacktestJobStatus.RUNNING
         
         try:
-            # Get database session
-            db = next(get_db())
-            try:
-                # Get strategy
-                strategy = crud.get_user_strategy(db, job.strategy_id)
-                if not strategy:
-                    raise ValueError(f"Strategy {job.strategy_id} not found")
-                
-                # Check ownership
-                if strategy.user_id != job.user_id:
-                    raise ValueError("Strategy does not belong to user")
-                
-                # Run backtest
-                engine = BacktestEngine()
-                results = engine.run_backtest(
-                    symbol=job.symbol,
-                    ruleset=strategy.ruleset,
-                    timeframe=job.timeframe,
-                    start_date=job.start_date,
-                    end_date=job.end_date,
-                )
-                
-                # Calculate score
-                score = score_strategy(results, use_test_metrics=True)
-                
-                # Save backtest record
-                backtest = crud.create_strategy_backtest(
-                    db=db,
-                    strategy_id=job.strategy_id,
-                    symbol=job.symbol,
-                    timeframe=job.timeframe,
-                    start_date=job.start_date,
-                    end_date=job.end_date,
-                    total_return=results["total_return"],
-                    win_rate=results["win_rate"],
-                    max_drawdown=results["max_drawdown"],
-                    avg_pnl=results["avg_pnl"],
-                    total_trades=results["total_trades"],
-                    sharpe_ratio=results.get("sharpe_ratio"),
-                    results=results,
-                )
-                
-                # Update strategy status
-                strategy_dict = {
-                    "id": strategy.id,
-                    "evolution_attempts": strategy.evolution_attempts or 0,
-                    "status": strategy.status or "experiment",
-                }
-                
-                if should_discard_strategy(strategy_dict, results):
-                    new_status = "discarded"
-                    is_proposable = False
-                else:
-                    new_status, is_proposable = determine_strategy_status(
-                        strategy=strategy_dict,
-                        backtest_results=results,
-                        current_status=strategy.status or "experiment",
-                        db=db  # Pass DB for MCN checks
+            # Session context closes the connection even if the job fails
+            with SessionLocal() as db:
+                try:
+                    # Get strategy
+                    strategy = crud.get_user_strategy(db, job.strategy_id)
+                    if not strategy:
+                        raise ValueError(f"Strategy {job.strategy_id} not found")
+                    
+                    # Check ownership
+                    if strategy.user_id != job.user_id:
+                        raise ValueError("Strategy does not belong to user")
+                    
+                    # Run backtest and calculate score in a worker process
+                    results, score = self._run_in_process(job, strategy.ruleset)
+                    
+                    # Save backtest record
+                    backtest = crud.create_strategy_backtest(
+                        db=db,
+                        strategy_id=job.strategy_id,
+                        symbol=job.symbol,
+                        timeframe=job.timeframe,
+                        start_date=job.start_date,
+                        end_date=job.end_date,
+                        total_return=results["total_return"],
+                        win_rate=results["win_rate"],
+                        max_drawdown=results["max_drawdown"],
+                        avg_pnl=results["avg_pnl"],
+                        total_trades=results["total_trades"],
+                        sharpe_ratio=results.get("sharpe_ratio"),
+                        results=results,
                     )
-                
-                # PHASE 1: Generate/update explanation when status changes or backtest completes
-                from ..strategy_engine.strategy_explanation import generate_human_explanation
-                explanation_human, risk_note = generate_human_explanation(
-                    {"name": strategy.name, "ruleset": strategy.ruleset, "asset_type": strategy.asset_type.value},
-                    results
-                )
-                
-                # Update strategy
-                crud.update_user_strategy(
-                    db=db,
-                    strategy_id=job.strategy_id,
-                    score=score,
-                    status=new_status,
-                    is_proposable=is_proposable,
-                    last_backtest_at=datetime.now(timezone.utc),
-                    last_backtest_results=results,
-                    train_metrics=results.get("train_metrics"),
-                    test_metrics=results.get("test_metrics"),
-                    explanation_human=explanation_human,
-                    risk_note=risk_note,
-                )
-                
-                db.commit()
-                
-                # Prepare response
-                job.results = {
-                    "backtest_id": backtest.id,
-                    "strategy_id": job.strategy_id,
-                    "symbol": job.symbol,
-                    "timeframe": job.timeframe,
-                    "total_return": results["total_return"],
-                    "win_rate": results["win_rate"],
-                    "max_drawdown": results["max_drawdown"],
-                    "avg_pnl": results["avg_pnl"],
-                    "total_trades": results["total_trades"],
-                    "sharpe_ratio": results.get("sharpe_ratio"),
-                    "score": score,
-                    "equity_curve": results.get("equity_curve", []),
-                    "train_metrics": results.get("train_metrics"),
-                    "test_metrics": results.get("test_metrics"),
-                    "overfitting_detected": results.get("overfitting_detected", False),
-                }
-                
-                job.status = BacktestJobStatus.COMPLETED
-                job.completed_at = datetime.now(timezone.utc)
-                
-            finally:
-                db.close()
+                    
+                    # Update strategy status
+                    strategy_dict = {
+                        "id": strategy.id,
+                        "evolution_attempts": strategy.evolution_attempts or 0,
+                        "status": strategy.status or "experiment",
+                    }
+                    
+                    if should_discard_strategy(strategy_dict, results):
+                        new_status = "discarded"
+                        is_proposable = False
+                    else:
+                        new_status, is_proposable = determine_strategy_status(
+                            strategy=strategy_dict,
+                            backtest_results=results,
+                            current_status=strategy.status or "experiment",
+                            db=db  # Pass DB for MCN checks
+                        )
+                    
+                    # PHASE 1: Generate/update explanation when status changes or backtest completes
+                    explanation_human, risk_note = generate_human_explanation(
+                        {"name": strategy.name, "ruleset": strategy.ruleset, "asset_type": strategy.asset_type.value},
+                        results
+                    )
+                    
+                    # Update strategy
+                    crud.update_user_strategy(
+                        db=db,
+                        strategy_id=job.strategy_id,
+                        score=score,
+                        status=new_status,
+                        is_proposable=is_proposable,
+                        last_backtest_at=datetime.now(timezone.utc),
+                        last_backtest_results=results,
+                        train_metrics=results.get("train_metrics"),
+                        test_metrics=results.get("test_metrics"),
+                        explanation_human=explanation_human,
+                        risk_note=risk_note,
+                    )
+                    
+                    db.commit()
+                    
+                    # Prepare response
+                    job.results = {
+                        "backtest_id": backtest.id,
+                        "strategy_id": job.strategy_id,
+                        "symbol": job.symbol,
+                        "timeframe": job.timeframe,
+                        "total_return": results["total_return"],
+                        "win_rate": results["win_rate"],
+                        "max_drawdown": results["max_drawdown"],
+                        "avg_pnl": results["avg_pnl"],
+                        "total_trades": results["total_trades"],
+                        "sharpe_ratio": results.get("sharpe_ratio"),
+                        "score": score,
+                        "equity_curve": results.get("equity_curve", []),
+                        "train_metrics": results.get("train_metrics"),
+                        "test_metrics": results.get("test_metrics"),
+                        "overfitting_detected": results.get("overfitting_detected", False),
+                    }
+                    
+                    job.status = BacktestJobStatus.COMPLETED
+                    job.completed_at = datetime.now(timezone.utc)
+                    
+                except Exception:
+                    db.rollback()
+                    raise
                 
         except Exception as e:
             job.status = BacktestJobStatus.FAILED
@@ -233,13 +308,33 @@ class BacktestWorker:
                 "completed_at": job.completed_at.isoformat() if job.completed_at else None,
             }
     
+    def cleanup_expired_jobs(self) -> int:
+        """
+        Remove finished jobs older than the retention window.
+        
+        Returns:
+            Number of jobs removed
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=self.job_retention_hours)
+        
+        with self.lock:
+            expired = [
+                job_id for job_id, job in self.jobs.items()
+                if job.completed_at and job.completed_at < cutoff
+            ]
+            for job_id in expired:
+                del self.jobs[job_id]
+        
+        return len(expired)
+    
     def update_max_workers(self, max_workers: int):
         """Update the maximum number of concurrent backtests."""
         with self.lock:
-            # Shutdown old executor
-            self.executor.shutdown(wait=False)
-            # Create new executor with updated max_workers
-            self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="backtest")
+            # Swap the admission semaphore instead of recreating the executor, so
+            # in-flight jobs (and their DB sessions) are never orphaned. Running
+            # jobs release permits on the old semaphore; new jobs use the new limit.
+            self.max_workers = min(max_workers, MAX_BACKTEST_WORKERS)
+            self._semaphore = threading.BoundedSemaphore(self.max_workers)
 
 
 # Global worker instance
@@ -254,9 +349,6 @@ def get_backtest_worker() -> BacktestWorker:
     with _worker_lock:
         if _backtest_worker is None:
             # Get max_workers from admin settings or default to 3
-            from ..db.session import SessionLocal
-            from ..db.models import AdminSettings
-            
             db = SessionLocal()
             try:
                 settings = db.query(AdminSettings).filter(AdminSettings.id == "default").first()
@@ -14,28 +14,40 @@ Configuration:
 - MIN_TRADES_FOR_EVAL: Minimum trades to evaluate (default: 50)
 - MAX_EVOLUTION_ATTEMPTS: Max attempts before discard (default: 10)
 - MAX_STRATEGIES_TO_MAINTAIN: Max active strategies (default: 100)
+- EVOLUTION_LOG_LEVEL: Worker log level (default: INFO; DEBUG adds per-strategy lines)
 - Note: Win rate thresholds are now in strategy_config.py (flexible: 80% high-win or 60% high-sharpe)
 """
 import os
 import time
-from typing import List, Dict, Any, Optional
+import asyncio
+import logging
+import numpy as np
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta, timezone
+from sqlalchemy import and_, case, func, or_
 from sqlalchemy.orm import Session
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from threading import Lock
 
-from ..db.session import get_db
+from ..db.session import get_db, ScopedSession
 from ..db import crud
-from ..strategy_engine.backtest_engine import BacktestEngine
+from ..db.models import UserStrategy, StrategyLineage, Notification
+from ..strategy_engine.backtest_engine import BacktestEngine, run_backtest_pure
+from ..strategy_engine.backtest_pool import get_backtest_pool, reset_backtest_pool
+from ..strategy_engine.ohlcv_cache import get_ohlcv_cache, BAR_SECONDS
 from ..strategy_engine.scoring import score_strategy
 from ..strategy_engine.status_manager import (
     determine_strategy_status,
     should_discard_strategy,
     StrategyStatus
 )
-from ..strategy_engine.strategy_status_helper import set_strategy_status
+from ..strategy_engine.strategy_status_helper import set_strategy_status, PENDING_NOTIFICATIONS_KEY
 from ..strategy_engine.mutation_engine import MutationEngine
 from ..strategy_engine.mutation_engine_enhanced import EnhancedMutationEngine
+from ..strategy_engine.mutation_royalty import mutation_royalty_calculator
+from ..strategy_engine.strategy_normalizer import normalize_strategy_ruleset
 from ..strategy_engine.constants import DEFAULT_SYMBOLS
 from ..strategy_engine.strategy_thresholds import (
     get_evolution_phase,
@@ -45,6 +57,13 @@ from ..strategy_engine.strategy_thresholds import (
 )
 from ..brain.mcn_adapter import get_mcn_adapter
 from ..brain.mcn_backup import get_backup_manager  # PHASE 4
+from ..brain.mcn_event_queue import MCNEventQueue
+from ..utils.redis_client import get_redis_client
+
+
+logger = logging.getLogger(__name__)
+# Per-strategy progress is logged at DEBUG; cycle-level lines at INFO
+logger.setLevel(os.environ.get("EVOLUTION_LOG_LEVEL", "INFO").upper())
 
 
 # Configuration constants - Use centralized config with env var overrides
@@ -61,13 +80,163 @@ MIN_TRADES_FOR_EVAL = int(os.environ.get("MIN_TRADES_FOR_EVAL", str(MIN_TRADES_F
 MAX_EVOLUTION_ATTEMPTS = int(os.environ.get("MAX_EVOLUTION_ATTEMPTS", str(DEFAULT_MAX_ATTEMPTS)))  # Default: 10
 MAX_STRATEGIES_TO_MAINTAIN = int(os.environ.get("MAX_STRATEGIES_TO_MAINTAIN", str(DEFAULT_MAX_STRATEGIES)))  # Default: 100
 PARALLEL_WORKERS = int(os.environ.get("EVOLUTION_PARALLEL_WORKERS", "3"))  # Process 3 strategies in parallel
+# Backtests spend most of their time waiting on Twelve Data, so more strategies
+# can be in flight than there are CPU-bound workers
+EVOLUTION_IO_CONCURRENCY = int(os.environ.get("EVOLUTION_IO_CONCURRENCY", str(PARALLEL_WORKERS * 4)))
 
-# Twelve Data rate limiting (377 credits/min for Grow plan)
-TWELVEDATA_CREDITS_PER_MIN = 377
-TWELVEDATA_CREDITS_PER_REQUEST = 1  # Each historical OHLCV request costs 1 credit
 # Evolution batch size - configurable via EVOLUTION_BATCH_SIZE env var (default: 50)
+# Twelve Data credits are paced by the shared token bucket in strategy_engine.ratelimit,
+# so the batch size only bounds how much work one cycle takes on
 EVOLUTION_BATCH_SIZE = int(os.environ.get("EVOLUTION_BATCH_SIZE", "50"))  # Number of strategies to process per cycle
-MAX_REQUESTS_PER_CYCLE = min(EVOLUTION_BATCH_SIZE, int(TWELVEDATA_CREDITS_PER_MIN * 0.8))  # Cap at rate limit or batch size
+MAX_REQUESTS_PER_CYCLE = EVOLUTION_BATCH_SIZE
+# Per-symbol metrics averaged for generalized (cross-asset) strategies
+CROSS_ASSET_METRICS_DTYPE = np.dtype([
+    ("winrate", "f8"),
+    ("total_return", "f8"),
+    ("max_drawdown", "f8"),
+    ("total_trades", "i8"),
+])
+# Backtest window: 200 days ensures enough trading days (accounting for weekends/holidays)
+BACKTEST_LOOKBACK_DAYS = 200
+# Longest a cycle waits for the previous cycle's MCN events before its backup
+MCN_QUEUE_FLUSH_TIMEOUT_SECONDS = 30
+# (symbol, timeframe) pairs whose history came back insufficient are not
+# re-requested until this expires (the provider won't have grown 200 days of data)
+KNOWN_INSUFFICIENT_TTL_SECONDS = int(os.environ.get("KNOWN_INSUFFICIENT_TTL_SECONDS", str(24 * 3600)))
+# (symbol, timeframe) -> expiry (epoch seconds); mirrored in Redis to share across workers
+KNOWN_INSUFFICIENT: Dict[Tuple[str, str], float] = {}
+_known_insufficient_lock = Lock()
+
+
+@dataclass(frozen=True)
+class EvolutionContext:
+    """Values fixed for the lifetime of one evolution cycle, shared by every strategy."""
+    start_date: datetime
+    end_date: datetime
+    # Candles prefetched for the cycle, keyed by (symbol, timeframe)
+    ohlcv_cache: Dict[Tuple[str, str], List[Any]] = field(default_factory=dict)
+    # Lineage links loaded once for the cycle (None = query per lookup)
+    lineage: Optional["LineageIndex"] = None
+
+
+class LineageIndex:
+    """
+    In-memory child -> parents map of strategy_lineage.
+    
+    Loaded with one query per cycle so lineage walks are dict lookups instead
+    of a SELECT per node. Rows created during the cycle are added with add().
+    """
+    
+    def __init__(self, parents_of: Optional[Dict[str, List[str]]] = None):
+        self._parents_of: Dict[str, List[str]] = parents_of or {}
+        self._lock = Lock()
+    
+    @classmethod
+    def load(cls, db: Session) -> "LineageIndex":
+        """Load every lineage link in one query."""
+        parents_of: Dict[str, List[str]] = {}
+        rows = db.query(StrategyLineage.child_strategy_id, StrategyLineage.parent_strategy_id).all()
+        for child_id, parent_id in rows:
+            parents_of.setdefault(child_id, []).append(parent_id)
+        return cls(parents_of)
+    
+    def add(self, child_id: str, parent_id: str):
+        """Record a lineage link created during the cycle."""
+        with self._lock:
+            self._parents_of.setdefault(child_id, []).append(parent_id)
+    
+    def root_and_depth(self, strategy_id: str, max_depth: int = crud.MAX_LINEAGE_DEPTH) -> Tuple[str, int]:
+        """
+        Same result as crud.get_lineage_root_and_depth, without the query.
+        
+        Walks parents level by level and returns the deepest root (ties broken
+        by lowest id), or (strategy_id, 0) if the strategy has no parents.
+        """
+        with self._lock:
+            root, root_depth = strategy_id, 0
+            frontier = {strategy_id}
+            depth = 0
+            while frontier and depth < max_depth:
+                depth += 1
+                next_frontier = set()
+                for sid in frontier:
+                    for parent_id in self._parents_of.get(sid, ()):
+                        if parent_id in self._parents_of:
+                            next_frontier.add(parent_id)
+                        elif depth > root_depth or parent_id < root:
+                            root, root_depth = parent_id, depth
+                frontier = next_frontier
+            return root, root_depth
+
+
+def _merge_update(update: Dict[str, Any], **fields):
+    """Merge field updates into a strategy's pending bulk update (None = leave unchanged)."""
+    update.update({k: v for k, v in fields.items() if v is not None})
+
+
+def _known_insufficient_key(symbol: str, timeframe: str) -> str:
+    return f"evolution:insufficient_data:{symbol}:{timeframe}"
+
+
+def mark_insufficient_data(symbol: str, timeframe: str):
+    """Remember that (symbol, timeframe) has insufficient history for KNOWN_INSUFFICIENT_TTL_SECONDS."""
+    with _known_insufficient_lock:
+        KNOWN_INSUFFICIENT[(symbol, timeframe)] = time.time() + KNOWN_INSUFFICIENT_TTL_SECONDS
+    redis_client = get_redis_client()
+    if redis_client.is_available:
+        redis_client.set(_known_insufficient_key(symbol, timeframe), "1", ttl_seconds=KNOWN_INSUFFICIENT_TTL_SECONDS)
+
+
+def is_known_insufficient(symbol: str, timeframe: str) -> bool:
+    """Check whether (symbol, timeframe) recently came back with insufficient history."""
+    key = (symbol, timeframe)
+    expiry = KNOWN_INSUFFICIENT.get(key)
+    if expiry is not None:
+        if expiry > time.time():
+            return True
+        with _known_insufficient_lock:
+            KNOWN_INSUFFICIENT.pop(key, None)
+    
+    # Another worker process may have recorded it
+    redis_client = get_redis_client()
+    if redis_client.is_available and redis_client.exists(_known_insufficient_key(symbol, timeframe)):
+        with _known_insufficient_lock:
+            KNOWN_INSUFFICIENT[key] = time.time() + KNOWN_INSUFFICIENT_TTL_SECONDS
+        return True
+    return False
+
+
+def _resolve_symbol_timeframe(ruleset: Dict[str, Any]) -> Tuple[str, str]:
+    """Get the symbol and timeframe a strategy is backtested on (defaults: AAPL, 1d)."""
+    symbol = ruleset.get("ticker") or ruleset.get("symbol") or ruleset.get("default_symbol", "AAPL")
+    # Handle if ticker is a list - use first symbol
+    if isinstance(symbol, list):
+        symbol = symbol[0] if symbol else "AAPL"
+    return symbol, ruleset.get("timeframe", "1d")
+
+
+def _last_bar_close(symbol: str, timeframe: str, ohlcv_cache: Optional[Dict[Tuple[str, str], List[Any]]]) -> Optional[datetime]:
+    """Close time of the newest completed bar known for (symbol, timeframe), or None if unknown."""
+    bar_seconds = BAR_SECONDS.get(timeframe, 86400)
+    candles = ohlcv_cache.get((symbol, timeframe)) if ohlcv_cache else None
+    if candles:
+        last_open = candles[-1].timestamp
+        if last_open.tzinfo is None:
+            last_open = last_open.replace(tzinfo=timezone.utc)
+        return last_open + timedelta(seconds=bar_seconds)
+    
+    disk_cache = get_ohlcv_cache()
+    last_ts = disk_cache.get_last_bar_ts(symbol, timeframe) if disk_cache else None
+    if last_ts is None:
+        return None
+    return datetime.fromtimestamp(last_ts + bar_seconds, tz=timezone.utc)
+
+
+def _strategy_symbol_timeframe(strategy) -> Tuple[str, str]:
+    """Get a strategy's backtest symbol and timeframe, from the resolved columns when filled."""
+    if strategy.symbol_resolved and strategy.timeframe_resolved:
+        return strategy.symbol_resolved, strategy.timeframe_resolved
+    return _resolve_symbol_timeframe(strategy.ruleset or {})
 
 
 class EvolutionWorker:
@@ -80,6 +249,12 @@ class EvolutionWorker:
         # Keep old engine as fallback
         self.legacy_mutation_engine = MutationEngine()
         self.mcn_adapter = get_mcn_adapter()
+        # MCN events are recorded in batches on a background thread
+        self.mcn_queue = MCNEventQueue(
+            self.mcn_adapter,
+            on_batch=self._append_events_to_wal,
+            lock=get_backup_manager().wal_lock,
+        )
     
     def run_evolution_cycle(self, db: Session) -> Dict[str, Any]:
         """
@@ -88,77 +263,52 @@ class EvolutionWorker:
         Returns:
             Summary of evolution cycle results
         """
-        print("🧬 Starting evolution cycle...")
+        logger.info("🧬 Starting evolution cycle...")
         
         # PHASE 2: Auto-detect evolution phase and log transition
         phase, phase_info = get_evolution_phase(db)
         thresholds = get_thresholds_for_phase(phase)
-        print(f"📊 Evolution Phase: {phase_info['name']} - {phase_info['description']}")
-        print(f"   Thresholds: winrate≥{thresholds['winrate_min']:.2%}, sharpe≥{thresholds['sharpe_min']:.2f}, trades≥{thresholds['trades_min']}")
+        logger.info("📊 Evolution Phase: %s - %s", phase_info['name'], phase_info['description'])
+        logger.info("   Thresholds: winrate≥%.2f%%, sharpe≥%.2f, trades≥%s", thresholds['winrate_min'] * 100, thresholds['sharpe_min'], thresholds['trades_min'])
         if thresholds.get("max_drawdown_max"):
-            print(f"   Max drawdown: ≤{thresholds['max_drawdown_max']:.1f}%")
+            logger.info("   Max drawdown: ≤%.1f%%", thresholds['max_drawdown_max'])
         if thresholds.get("symbol_robustness_required"):
-            print(f"   Symbol robustness: required across {thresholds['min_symbols']} symbols")
+            logger.info("   Symbol robustness: required across %s symbols", thresholds['min_symbols'])
         
-        # Get all active strategies (query directly from DB)
-        from ..db.models import UserStrategy
-        from datetime import datetime, timezone, timedelta
+        # Get active strategies (query directly from DB)
+        now = datetime.now(timezone.utc)
         
         # Query for active strategies that are not discarded
         try:
-            all_strategies = db.query(UserStrategy).filter(
+            active_filter = (
                 UserStrategy.is_active == True,
                 UserStrategy.status != StrategyStatus.DISCARDED
-            ).all()
-            print(f"📊 Found {len(all_strategies)} active strategies in database")
+            )
+            total_active = db.query(func.count(UserStrategy.id)).filter(*active_filter).scalar() or 0
+            logger.info("📊 Found %d active strategies in database", total_active)
+            
+            rows = self._select_batch(db, active_filter, now)
         except Exception as e:
-            print(f"❌ Error querying strategies: {e}")
-            import traceback
-            traceback.print_exc()
-            all_strategies = []
-        
-        # Prioritize strategies that:
-        # 1. Have never been backtested (last_backtest_at == None)
-        # 2. Have old backtests (older than 7 days)
-        # 3. Are in EXPERIMENT status (newly created)
-        now = datetime.now(timezone.utc)
-        seven_days_ago = now - timedelta(days=7)
+            logger.exception("❌ Error querying strategies: %s", e)
+            total_active = 0
+            rows = []
         
-        def get_priority(strategy):
-            """Calculate priority for strategy (lower number = higher priority)."""
-            # Highest priority: never backtested
-            if strategy.last_backtest_at is None:
-                return 0
-            # Second priority: old backtest (>7 days)
-            if strategy.last_backtest_at < seven_days_ago:
-                return 1
-            # Third priority: experiment status (newly created)
-            if strategy.status == StrategyStatus.EXPERIMENT:
-                return 2
-            # Lower priority: already evaluated
-            return 3
-        
-        # Sort by priority
-        active_strategies = sorted(all_strategies, key=get_priority)
-        
-        # Evolution batch size - configurable via EVOLUTION_BATCH_SIZE env var
-        # Limit to MAX_REQUESTS_PER_CYCLE (which respects both batch size and rate limits)
-        strategies_to_process = active_strategies[:MAX_REQUESTS_PER_CYCLE]
-        if len(active_strategies) > MAX_REQUESTS_PER_CYCLE:
-            print(f"⚠️  Limiting to {MAX_REQUESTS_PER_CYCLE} strategies per cycle (batch size: {EVOLUTION_BATCH_SIZE}, rate limit: {int(TWELVEDATA_CREDITS_PER_MIN * 0.8)}) ({len(active_strategies)} total available)")
+        strategies_to_process = [strategy for strategy, _ in rows]
+        if total_active > MAX_REQUESTS_PER_CYCLE:
+            logger.info("⚠️  Limiting to %d strategies per cycle (batch size: %d) (%d total available)", MAX_REQUESTS_PER_CYCLE, EVOLUTION_BATCH_SIZE, total_active)
         
         # Log priority breakdown
-        never_backtested = sum(1 for s in strategies_to_process if s.last_backtest_at is None)
-        old_backtests = sum(1 for s in strategies_to_process if s.last_backtest_at and s.last_backtest_at < seven_days_ago)
+        never_backtested = sum(1 for _, p in rows if p == 0)
+        old_backtests = sum(1 for _, p in rows if p == 1)
         experiment_status = sum(1 for s in strategies_to_process if s.status == StrategyStatus.EXPERIMENT)
         
-        print(f"📊 Found {len(strategies_to_process)} active strategies to evaluate (out of {len(active_strategies)} total)")
+        logger.info("📊 Found %d active strategies to evaluate (out of %d total)", len(strategies_to_process), total_active)
         if never_backtested > 0:
-            print(f"   - {never_backtested} never backtested (highest priority)")
+            logger.info("   - %d never backtested (highest priority)", never_backtested)
         if old_backtests > 0:
-            print(f"   - {old_backtests} with old backtests (>7 days)")
+            logger.info("   - %d with old backtests (>7 days)", old_backtests)
         if experiment_status > 0:
-            print(f"   - {experiment_status} in experiment status")
+            logger.info("   - %d in experiment status", experiment_status)
         
         # Use limited list for processing
         active_strategies = strategies_to_process
@@ -171,125 +321,315 @@ class EvolutionWorker:
             "mutated": 0,
             "discarded": 0,
             "backtests_run": 0,
+            "up_to_date": 0,
             "errors": 0,
         }
         
-        # PHASE 4: Create MCN backup before mutation rounds
+        # PHASE 4: Back up MCN before mutation rounds - a full backup when the
+        # snapshot interval has passed, otherwise just a cycle marker in the WAL
         backup_manager = get_backup_manager()
-        backup_path = backup_manager.create_backup("before_evolution_cycle")
+        # Let the previous cycle's MCN events land before backing up
+        if not self.mcn_queue.flush(timeout=MCN_QUEUE_FLUSH_TIMEOUT_SECONDS):
+            logger.warning("⚠️  MCN event queue still draining; backing up without the latest events")
+        backup_path = backup_manager.snapshot_if_due("before_evolution_cycle")
         if backup_path:
-            print(f"✅ MCN backup created: {backup_path}")
+            logger.info("✅ MCN backup created: %s", backup_path)
+        backup_manager.append_wal([{
+            "type": "evolution_cycle",
+            "timestamp": now.isoformat(),
+            "strategies": len(active_strategies),
+        }])
+        
+        # Every strategy in the cycle is backtested over the same window, so the
+        # candles can be fetched once per (symbol, timeframe) up front
+        end_date = now
+        start_date = end_date - timedelta(days=BACKTEST_LOOKBACK_DAYS)
+        ctx = EvolutionContext(
+            start_date=start_date,
+            end_date=end_date,
+            ohlcv_cache=self.prefetch_ohlcv(active_strategies, start_date, end_date),
+            lineage=LineageIndex.load(db),
+        )
         
         # PHASE 4: Process strategies in parallel
-        # Use ThreadPoolExecutor to process 4-8 strategies concurrently
+        # Backtests are overlapped on an asyncio loop (see _process_strategies_async)
         # Each strategy gets its own database session to avoid conflicts
-        db_lock = Lock()  # Lock for MCN event recording
         
         def process_strategy_with_session(strategy):
             """Process a single strategy with its own DB session."""
             try:
-                # Create new DB session for this thread
-                from ..db.session import SessionLocal
-                thread_db = SessionLocal()
+                # Use this thread's scoped session (executor threads are reused
+                # across strategies); remove() closes it and returns the connection
+                thread_db = ScopedSession()
                 try:
-                    result = self._process_strategy(thread_db, strategy)
+                    result = self._process_strategy(thread_db, strategy, ctx)
                     return result
                 finally:
-                    thread_db.close()
+                    ScopedSession.remove()
             except Exception as e:
-                print(f"❌ Error processing strategy {strategy.id}: {e}")
-                import traceback
-                traceback.print_exc()
-                return {"action": "error", "error": str(e)}
-        
-        # Process strategies in parallel
-        with ThreadPoolExecutor(max_workers=PARALLEL_WORKERS) as executor:
-            # Submit all strategies
-            future_to_strategy = {
-                executor.submit(process_strategy_with_session, strategy): strategy
-                for strategy in active_strategies
-            }
+                logger.exception("❌ Error processing strategy %s: %s", strategy.id, e)
+                return {"action": "error", "error": str(e)}, None
+        
+        # Process strategies concurrently; results come back in submission order
+        results = asyncio.run(self._process_strategies_async(active_strategies, process_strategy_with_session))
+        
+        # Strategy row updates from the whole batch, written in one bulk UPDATE
+        # below together with the status-change notifications they queued
+        pending_updates = []
+        pending_notifications = []
+        for strategy, outcome in zip(active_strategies, results):
+            if isinstance(outcome, Exception):
+                logger.error("❌ Error getting result for strategy %s: %s", strategy.id, outcome)
+                stats["errors"] += 1
+                continue
             
-            # Collect results as they complete
-            for future in as_completed(future_to_strategy):
-                strategy = future_to_strategy[future]
-                try:
-                    result = future.result()
-                    stats["backtests_run"] += 1
-                    
-                    if result["action"] == "promoted_to_candidate":
-                        stats["promoted_to_candidate"] += 1
-                    elif result["action"] == "promoted_to_proposable":
-                        stats["promoted_to_proposable"] += 1
-                    elif result["action"] == "demoted":
-                        stats["demoted"] += 1
-                    elif result["action"] == "mutated":
-                        stats["mutated"] += 1
-                    elif result["action"] == "discarded":
-                        stats["discarded"] += 1
-                    elif result["action"] == "error":
-                        stats["errors"] += 1
-                    elif result["action"] == "improved":
-                        # Log improvements for monitoring
-                        pass
-                    elif result["action"] == "worse":
-                        # Log degradations for monitoring
-                        pass
-                except Exception as e:
-                    print(f"❌ Error getting result for strategy {strategy.id}: {e}")
-                    stats["errors"] += 1
+            result, update = outcome
+            if update:
+                pending_notifications.extend(update.pop(PENDING_NOTIFICATIONS_KEY, ()))
+            if update and len(update) > 1:
+                pending_updates.append(update)
+            
+            if result["action"] == "up_to_date":
+                stats["up_to_date"] += 1
+                continue
+            
+            stats["backtests_run"] += 1
+            
+            if result["action"] == "promoted_to_candidate":
+                stats["promoted_to_candidate"] += 1
+            elif result["action"] == "promoted_to_proposable":
+                stats["promoted_to_proposable"] += 1
+            elif result["action"] == "demoted":
+                stats["demoted"] += 1
+            elif result["action"] == "mutated":
+                stats["mutated"] += 1
+            elif result["action"] == "discarded":
+                stats["discarded"] += 1
+            elif result["action"] == "error":
+                stats["errors"] += 1
+            elif result["action"] == "improved":
+                # Log improvements for monitoring
+                pass
+            elif result["action"] == "worse":
+                # Log degradations for monitoring
+                pass
+        
+        if pending_updates:
+            try:
+                db.bulk_update_mappings(UserStrategy, pending_updates)
+                # Same transaction: users are only notified of changes that were written
+                if pending_notifications:
+                    db.bulk_insert_mappings(Notification, pending_notifications)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error("❌ Error writing evolution updates for %d strategies: %s", len(pending_updates), e)
         
         # Enforce max strategies limit (keep best performers)
         self._enforce_strategy_limit(db, MAX_STRATEGIES_TO_MAINTAIN)
         
         # STABILITY: Log evolution summary - one line per cycle
-        print(f"[GSIN] Evolution summary: total={stats['total_strategies']}, tested={stats['backtests_run']}, mutated={stats['mutated']}, promoted={stats['promoted_to_proposable']}, discarded={stats['discarded']}")
+        logger.info(
+            "[GSIN] Evolution summary: total=%d, tested=%d, mutated=%d, promoted=%d, discarded=%d",
+            stats['total_strategies'], stats['backtests_run'], stats['mutated'], stats['promoted_to_proposable'], stats['discarded']
+        )
         return stats
     
+    def _select_batch(self, db: Session, active_filter, now: datetime) -> List[Tuple[Any, int]]:
+        """Select the strategies for one evolution cycle as (strategy, priority) rows, best first."""
+        # Prioritize strategies that:
+        # 1. Have never been backtested (last_backtest_at == None)
+        # 2. Have old backtests (older than 7 days)
+        # 3. Are in EXPERIMENT status (newly created)
+        # Strategies whose last visit ended without a backtest (up to date, known
+        # insufficient data, failed) drop to the lowest priority so they don't
+        # hold batch slots every cycle; within a priority the least recently
+        # visited come first. Ranking happens in SQL (backed by
+        # ix_user_strategies_evolution) so only the batch being processed is loaded
+        seven_days_ago = now - timedelta(days=7)
+        last_check = UserStrategy.last_evolution_check_at
+        skipped_last_visit = and_(
+            last_check.isnot(None),
+            or_(UserStrategy.last_backtest_at.is_(None), last_check > UserStrategy.last_backtest_at),
+        )
+        priority = case(
+            (skipped_last_visit, 3),  # Lowest priority: nothing ran last time
+            (UserStrategy.last_backtest_at.is_(None), 0),  # Highest priority: never backtested
+            (UserStrategy.last_backtest_at < seven_days_ago, 1),  # Second priority: old backtest (>7 days)
+            (UserStrategy.status == StrategyStatus.EXPERIMENT, 2),  # Third priority: experiment status
+            else_=3  # Lower priority: already evaluated
+        )
+        
+        # Evolution batch size - configurable via EVOLUTION_BATCH_SIZE env var
+        # Limit to MAX_REQUESTS_PER_CYCLE (request rate is paced by the Twelve Data token bucket)
+        return db.query(UserStrategy, priority).filter(*active_filter).order_by(
+            priority,
+            last_check.asc().nullsfirst(),
+            UserStrategy.last_backtest_at.asc().nullsfirst()
+        ).limit(MAX_REQUESTS_PER_CYCLE).all()
+    
+    def prefetch_ohlcv(
+        self,
+        strategies: List[Any],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[Tuple[str, str], List[Any]]:
+        """
+        Fetch candles once for every (symbol, timeframe) the batch will backtest.
+        
+        Many strategies share a symbol and timeframe, and every strategy in a
+        cycle uses the same window, so fetching per strategy repeats requests.
+        Failed or empty fetches are left out so the backtest retries them.
+        
+        Returns:
+            Candles keyed by (symbol, timeframe), for BacktestEngine's ohlcv_cache
+        """
+        keys = set()
+        for strategy in strategies:
+            symbol, timeframe = _strategy_symbol_timeframe(strategy)
+            symbols = DEFAULT_SYMBOLS if strategy.generalized else [symbol]
+            keys.update((s, timeframe) for s in symbols)
+        keys = {key for key in keys if not is_known_insufficient(*key)}
+        
+        def fetch(key):
+            symbol, timeframe = key
+            return self.backtest_engine._fetch_candles(symbol, timeframe, 0, start_date, end_date)
+        
+        ohlcv_cache = {}
+        with ThreadPoolExecutor(max_workers=EVOLUTION_IO_CONCURRENCY, thread_name_prefix="ohlcv") as executor:
+            for key, candles in zip(keys, executor.map(fetch, keys)):
+                if candles:
+                    ohlcv_cache[key] = candles
+        
+        logger.info("📊 Prefetched candles for %d/%d symbol/timeframe pairs", len(ohlcv_cache), len(keys))
+        return ohlcv_cache
+    
+    def _record_mcn_event(self, event_type: str, payload: Dict[str, Any], strategy_id: Optional[str] = None):
+        """Queue an MCN event for the background recorder (never blocks on MCN)."""
+        if not self.mcn_queue.submit({"event_type": event_type, "payload": payload, "strategy_id": strategy_id}):
+            logger.warning("⚠️  MCN event queue full; dropped oldest event (%d dropped so far)", self.mcn_queue.dropped)
+    
+    def _append_events_to_wal(self, events: List[Dict[str, Any]]):
+        """Log recorded MCN events to the backup WAL so they survive until the next snapshot."""
+        get_backup_manager().append_wal([{"type": "mcn_event", **event} for event in events])
+    
+    def _run_backtest(self, method: str, **kwargs) -> Dict[str, Any]:
+        """
+        Run a BacktestEngine method, in the backtest process pool when enabled.
+        
+        Called from the I/O threads: the thread blocks on the pool while the
+        math runs in a worker process. Exceptions raised by the backtest
+        (e.g. ValueError for insufficient data) propagate unchanged.
+        """
+        pool = get_backtest_pool()
+        if pool is not None:
+            try:
+                return pool.submit(run_backtest_pure, method, kwargs).result()
+            except BrokenProcessPool as e:
+                logger.warning("⚠️  Backtest process pool failed (%s) - running backtest in-thread", e)
+                reset_backtest_pool(pool)
+        return getattr(self.backtest_engine, method)(**kwargs)
+    
+    async def _process_strategies_async(self, strategies: List[Any], process) -> List[Any]:
+        """
+        Run process(strategy) for every strategy on a shared event loop.
+        
+        The backtests block on market data requests, so each one runs in an
+        executor thread while the loop keeps up to EVOLUTION_IO_CONCURRENCY of
+        them waiting on the network at once. Exceptions are returned in place
+        of results rather than cancelling the rest of the batch.
+        """
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=EVOLUTION_IO_CONCURRENCY, thread_name_prefix="evolution") as executor:
+            return await asyncio.gather(
+                *(loop.run_in_executor(executor, process, strategy) for strategy in strategies),
+                return_exceptions=True
+            )
+    
     def _process_strategy(
         self,
         db: Session,
-        strategy
-    ) -> Dict[str, Any]:
+        strategy,
+        ctx: Optional[EvolutionContext] = None
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
         """
         Process a single strategy: backtest, update status, mutate if needed.
         
+        Updates to the strategy row itself are not written here; they are
+        returned so the cycle can apply them in one bulk UPDATE. Notifications,
+        mutated children and lineage records are still written immediately.
+        
+        Args:
+            ctx: Cycle context (backtest window, prefetched candles). Without one,
+                the strategy is backtested over the last BACKTEST_LOOKBACK_DAYS.
+        
         Returns:
-            Dictionary with action taken and details
+            (result, update): dictionary with action taken and details, and the
+            UserStrategy bulk-update mapping ({"id": ..., field: value}) or None
         """
         strategy_id = strategy.id
         current_status = strategy.status or StrategyStatus.EXPERIMENT
+        # One timestamp for every write and event of this strategy
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
+        # Recorded on every visit, so a skip moves the strategy back in the batch order
+        update = {"id": strategy_id, "last_evolution_check_at": now}
         
         # Skip if already discarded
         if current_status == StrategyStatus.DISCARDED:
-            return {"action": "skipped", "reason": "already_discarded"}
+            return {"action": "skipped", "reason": "already_discarded"}, None
         
         # Run backtest with updated data
         # Use a default symbol and timeframe if not specified
-        symbol = strategy.ruleset.get("ticker") or strategy.ruleset.get("symbol") or strategy.ruleset.get("default_symbol", "AAPL")
-        # Handle if ticker is a list - use first symbol
-        if isinstance(symbol, list):
-            symbol = symbol[0] if symbol else "AAPL"
-        timeframe = strategy.ruleset.get("timeframe", "1d")
+        symbol, timeframe = _strategy_symbol_timeframe(strategy)
+        if not (strategy.symbol_resolved and strategy.timeframe_resolved):
+            # Store the resolved values so later cycles skip parsing the ruleset
+            _merge_update(update, symbol_resolved=symbol, timeframe_resolved=timeframe)
         
         # Calculate date range (last 6 months, but ensure we have enough historical data)
         # Use a date range that's more likely to have data (avoid weekends/holidays)
-        end_date = datetime.now(timezone.utc)
-        # Start from 200 days ago to ensure we get enough trading days (accounting for weekends/holidays)
-        start_date = end_date - timedelta(days=200)
+        if ctx is not None:
+            start_date, end_date, ohlcv_cache = ctx.start_date, ctx.end_date, ctx.ohlcv_cache
+        else:
+            end_date = now
+            start_date = end_date - timedelta(days=BACKTEST_LOOKBACK_DAYS)
+            ohlcv_cache = None
         
         # If strategy is generalized, test across all DEFAULT_SYMBOLS
         symbols_to_test = DEFAULT_SYMBOLS if strategy.generalized else [symbol]
         
+        # Only ship this strategy's candles to the backtest process
+        if ohlcv_cache:
+            ohlcv_cache = {
+                key: candles for key, candles in ohlcv_cache.items()
+                if key[1] == timeframe and key[0] in symbols_to_test
+            }
+        
+        # Skip single-symbol backtests that recently failed for lack of data
+        # (a repeat attempt would spend credits on the same short history)
+        if len(symbols_to_test) == 1 and is_known_insufficient(symbol, timeframe):
+            return {"action": "skipped_cached_empty", "symbol": symbol}, update
+        
+        # Skip if no bar has completed since the last backtest: it would see the same data
+        last_backtest_at = strategy.last_backtest_at
+        if last_backtest_at is not None:
+            if last_backtest_at.tzinfo is None:
+                last_backtest_at = last_backtest_at.replace(tzinfo=timezone.utc)
+            bar_closes = [_last_bar_close(s, timeframe, ohlcv_cache) for s in symbols_to_test]
+            if all(close is not None and close <= last_backtest_at for close in bar_closes):
+                return {"action": "up_to_date"}, update
+        
         try:
             # For generalized strategies, run cross-asset backtest
             if strategy.generalized and len(symbols_to_test) > 1:
-                cross_asset_results = self.backtest_engine.execute_backtest_across_assets(
+                cross_asset_results = self._run_backtest(
+                    "execute_backtest_across_assets",
                     strategy_ruleset=strategy.ruleset,
                     timeframe=timeframe,
                     start_date=start_date,
                     end_date=end_date,
-                    symbols=symbols_to_test
+                    symbols=symbols_to_test,
+                    ohlcv_cache=ohlcv_cache
                 )
                 
                 # Use average metrics from cross-asset results
@@ -297,10 +637,19 @@ class EvolutionWorker:
                 successful = {k: v for k, v in per_symbol.items() if "error" not in v and v.get("total_trades", 0) > 0}
                 
                 if successful:
-                    avg_winrate = sum(v.get("winrate", 0.0) for v in successful.values()) / len(successful)
-                    avg_return = sum(v.get("total_return", 0.0) for v in successful.values()) / len(successful)
-                    avg_drawdown = sum(abs(v.get("max_drawdown", 0.0)) for v in successful.values()) / len(successful)
-                    total_trades = sum(v.get("total_trades", 0) for v in successful.values())
+                    # One pass to collect per-symbol metrics, then reduce each column in NumPy
+                    metrics = np.fromiter(
+                        (
+                            (v.get("winrate", 0.0), v.get("total_return", 0.0), abs(v.get("max_drawdown", 0.0)), v.get("total_trades", 0))
+                            for v in successful.values()
+                        ),
+                        dtype=CROSS_ASSET_METRICS_DTYPE,
+                        count=len(successful)
+                    )
+                    avg_winrate = float(metrics["winrate"].mean())
+                    avg_return = float(metrics["total_return"].mean())
+                    avg_drawdown = float(metrics["max_drawdown"].mean())
+                    total_trades = int(metrics["total_trades"].sum())
                     
                     backtest_results = {
                         "total_return": avg_return,
@@ -314,67 +663,66 @@ class EvolutionWorker:
                 else:
                     # Fallback to single symbol if cross-asset fails
                     # FIX: Normalize ruleset before backtest
-                    from ..strategy_engine.strategy_normalizer import normalize_strategy_ruleset
                     normalized_ruleset = normalize_strategy_ruleset(strategy.ruleset)
-                    backtest_results = self.backtest_engine.run_backtest(
+                    backtest_results = self._run_backtest(
+                        "run_backtest",
                         symbol=symbol,
                         ruleset=normalized_ruleset,
                         timeframe=timeframe,
                         start_date=start_date,
                         end_date=end_date,
                         train_test_split=0.7,
-                        use_rolling_walkforward=True  # IMPROVEMENT: Use rolling walk-forward for true stability validation
+                        use_rolling_walkforward=True,  # IMPROVEMENT: Use rolling walk-forward for true stability validation
+                        ohlcv_cache=ohlcv_cache
                     )
             else:
                 # Single symbol backtest
                 # FIX: Normalize ruleset before backtest
-                from ..strategy_engine.strategy_normalizer import normalize_strategy_ruleset
                 normalized_ruleset = normalize_strategy_ruleset(strategy.ruleset)
-                backtest_results = self.backtest_engine.run_backtest(
+                backtest_results = self._run_backtest(
+                    "run_backtest",
                     symbol=symbol,
                     ruleset=normalized_ruleset,
                     timeframe=timeframe,
                     start_date=start_date,
                     end_date=end_date,
                     train_test_split=0.7,
-                    use_rolling_walkforward=True  # IMPROVEMENT: Use rolling walk-forward for true stability validation
+                    use_rolling_walkforward=True,  # IMPROVEMENT: Use rolling walk-forward for true stability validation
+                    ohlcv_cache=ohlcv_cache
                 )
         except ValueError as e:
             # PHASE 8: Insufficient data error - skip ticker, don't break evolution cycle
             error_msg = str(e)
             if "Insufficient data" in error_msg or "insufficient_data" in error_msg.lower():
-                print(f"⚠️  Backtest failed for strategy {strategy_id} ({symbol}, {timeframe}): {error_msg}")
-                print(f"   Date range: {start_date.date()} to {end_date.date()}")
-                print(f"   ⏭️  Skipping {symbol} - insufficient data (evolution cycle continues)")
+                logger.debug(
+                    "⏭️  Skipping strategy %s (%s, %s, %s to %s) - insufficient data (evolution cycle continues): %s",
+                    strategy_id, symbol, timeframe, start_date.date(), end_date.date(), error_msg
+                )
                 # PHASE 8: Don't increment evolution attempts for insufficient data - it's not a strategy failure
-                return {"action": "skipped_insufficient_data", "symbol": symbol, "error": str(e)}
+                mark_insufficient_data(symbol, timeframe)
+                return {"action": "skipped_insufficient_data", "symbol": symbol, "error": str(e)}, update
             else:
-                print(f"⚠️  Backtest failed for strategy {strategy_id}: {e}")
+                logger.warning("⚠️  Backtest failed for strategy %s: %s", strategy_id, e)
                 # Increment evolution attempts on failure
-                crud.update_user_strategy(
-                    db=db,
-                    strategy_id=strategy_id,
-                    evolution_attempts=(strategy.evolution_attempts or 0) + 1
-                )
-                return {"action": "backtest_failed", "error": str(e)}
+                _merge_update(update, evolution_attempts=(strategy.evolution_attempts or 0) + 1)
+                return {"action": "backtest_failed", "error": str(e)}, update
         except Exception as e:
             # PHASE 8: Handle all exceptions gracefully - don't break evolution cycle
-            print(f"⚠️  Backtest failed for strategy {strategy_id}: {e}")
+            logger.warning("⚠️  Backtest failed for strategy %s: %s", strategy_id, e)
             # Check if it's a data issue
             error_str = str(e).lower()
             if "insufficient" in error_str or "no data" in error_str or "empty" in error_str:
-                print(f"   ⏭️  Skipping due to data issue (evolution cycle continues)")
-                return {"action": "skipped_data_issue", "error": str(e)}
+                logger.debug("   ⏭️  Skipping due to data issue (evolution cycle continues)")
+                return {"action": "skipped_data_issue", "error": str(e)}, update
             # Increment evolution attempts on failure
-            crud.update_user_strategy(
-                db=db,
-                strategy_id=strategy_id,
-                evolution_attempts=(strategy.evolution_attempts or 0) + 1
-            )
-            return {"action": "backtest_failed", "error": str(e)}
+            _merge_update(update, evolution_attempts=(strategy.evolution_attempts or 0) + 1)
+            return {"action": "backtest_failed", "error": str(e)}, update
         
         # Calculate unified score
         score = score_strategy(backtest_results, use_test_metrics=True)
+        # Reported in the PHASE C promotion lines (was undefined there, so every
+        # promotion raised NameError after its status update)
+        sharpe_ratio = backtest_results.get("sharpe_ratio") or 0.0
         
         # Prepare strategy dict for status determination
         strategy_dict = {
@@ -392,8 +740,9 @@ class EvolutionWorker:
                 new_status=StrategyStatus.DISCARDED,
                 reason="Strategy failed discard criteria based on backtest results",
                 triggered_by="evolution_worker",
+                pending_updates=update,
                 score=score,
-                last_backtest_at=datetime.now(timezone.utc),
+                last_backtest_at=now,
                 last_backtest_results=backtest_results,
                 train_metrics=backtest_results.get("train_metrics"),
                 test_metrics=backtest_results.get("test_metrics"),
@@ -401,22 +750,21 @@ class EvolutionWorker:
             
             # Record discard event in MCN (non-blocking)
             try:
-                if self.mcn_adapter and self.mcn_adapter.is_available:
-                    self.mcn_adapter.record_event(
-                        event_type="strategy_discarded",
-                        payload={
-                            "strategy_id": strategy_id,
-                            "reason": "max_attempts_reached",
-                            "final_score": score,
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                        },
-                        strategy_id=strategy_id,
-                    )
+                self._record_mcn_event(
+                    event_type="strategy_discarded",
+                    payload={
+                        "strategy_id": strategy_id,
+                        "reason": "max_attempts_reached",
+                        "final_score": score,
+                        "timestamp": now_iso,
+                    },
+                    strategy_id=strategy_id,
+                )
             except Exception as e:
                 # MCN errors should not block evolution
-                print(f"⚠️  MCN event recording failed (non-fatal): {e}")
+                logger.warning("⚠️  MCN event recording failed (non-fatal): %s", e)
             
-            return {"action": "discarded", "reason": "max_attempts"}
+            return {"action": "discarded", "reason": "max_attempts"}, update
         
         # IMPROVEMENT 1: Determine new status based on backtest results
         # Add score to backtest_results for status determination
@@ -441,8 +789,9 @@ class EvolutionWorker:
                 new_status=new_status,
                 reason=f"Strategy promoted based on backtest results (score: {score:.3f})",
                 triggered_by="evolution_worker",
+                pending_updates=update,
                 score=score,
-                last_backtest_at=datetime.now(timezone.utc),
+                last_backtest_at=now,
                 last_backtest_results=backtest_results,
                 train_metrics=backtest_results.get("train_metrics"),
                 test_metrics=backtest_results.get("test_metrics"),
@@ -450,13 +799,12 @@ class EvolutionWorker:
             )
         else:
             # For other status changes or no change, update directly (no notification needed)
-            crud.update_user_strategy(
-                db=db,
-                strategy_id=strategy_id,
+            _merge_update(
+                update,
                 score=score,
                 status=new_status,
                 is_proposable=is_proposable,
-                last_backtest_at=datetime.now(timezone.utc),
+                last_backtest_at=now,
                 last_backtest_results=backtest_results,
                 train_metrics=backtest_results.get("train_metrics"),
                 test_metrics=backtest_results.get("test_metrics"),
@@ -465,25 +813,24 @@ class EvolutionWorker:
         
         # Record backtest event in MCN (non-blocking)
         try:
-            if self.mcn_adapter and self.mcn_adapter.is_available:
-                self.mcn_adapter.record_event(
-                    event_type="strategy_backtest",
-                    payload={
-                        "strategy_id": strategy_id,
-                        "symbol": symbol,
-                        "timeframe": timeframe,
-                        "total_return": backtest_results.get("total_return", 0.0),
-                        "win_rate": backtest_results.get("win_rate", 0.0),
-                        "max_drawdown": backtest_results.get("max_drawdown", 0.0),
-                        "score": score,
-                        "status": new_status,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                    strategy_id=strategy_id,
-                )
+            self._record_mcn_event(
+                event_type="strategy_backtest",
+                payload={
+                    "strategy_id": strategy_id,
+                    "symbol": symbol,
+                    "timeframe": timeframe,
+                    "total_return": backtest_results.get("total_return", 0.0),
+                    "win_rate": backtest_results.get("win_rate", 0.0),
+                    "max_drawdown": backtest_results.get("max_drawdown", 0.0),
+                    "score": score,
+                    "status": new_status,
+                    "timestamp": now_iso,
+                },
+                strategy_id=strategy_id,
+            )
         except Exception as e:
             # MCN errors should not block backtesting
-            print(f"⚠️  MCN event recording failed (non-fatal): {e}")
+            logger.warning("⚠️  MCN event recording failed (non-fatal): %s", e)
         
         # PHASE C: Determine action taken with specific logging
         action = "no_change"
@@ -492,19 +839,19 @@ class EvolutionWorker:
         
         if new_status == StrategyStatus.CANDIDATE and current_status == StrategyStatus.EXPERIMENT:
             action = "promoted_to_candidate"
-            print(f"✅ PHASE C: promoted {strategy_id} (experiment → candidate) - winrate={win_rate:.2f}, sharpe={sharpe_ratio:.2f}, score={score:.2f}")
+            logger.debug("✅ PHASE C: promoted %s (experiment → candidate) - winrate=%.2f, sharpe=%.2f, score=%.2f", strategy_id, win_rate, sharpe_ratio, score)
         elif new_status == StrategyStatus.PROPOSABLE and current_status != StrategyStatus.PROPOSABLE:
             action = "promoted_to_proposable"
-            print(f"✅ PHASE C: promoted {strategy_id} (candidate → proposable) - winrate={win_rate:.2f}, sharpe={sharpe_ratio:.2f}, score={score:.2f}")
+            logger.debug("✅ PHASE C: promoted %s (candidate → proposable) - winrate=%.2f, sharpe=%.2f, score=%.2f", strategy_id, win_rate, sharpe_ratio, score)
         elif new_status != current_status and new_status in [StrategyStatus.EXPERIMENT, StrategyStatus.CANDIDATE]:
             action = "worse"
-            print(f"⚠️  PHASE C: worse {strategy_id} (demoted)")
+            logger.debug("⚠️  PHASE C: worse %s (demoted)", strategy_id)
         elif score > previous_score:
             action = "improved"
-            print(f"📈 PHASE C: improved {strategy_id} (score: {previous_score:.2f} → {score:.2f})")
+            logger.debug("📈 PHASE C: improved %s (score: %.2f → %.2f)", strategy_id, previous_score, score)
         elif score < previous_score:
             action = "worse"
-            print(f"📉 PHASE C: worse {strategy_id} (score: {previous_score:.2f} → {score:.2f})")
+            logger.debug("📉 PHASE C: worse %s (score: %.2f → %.2f)", strategy_id, previous_score, score)
         
         # PHASE C: Fix mutation logic - force mutation when attempts >= 3, or when winrate < threshold
         should_mutate = False
@@ -520,39 +867,48 @@ class EvolutionWorker:
         # PHASE C: Check if strategy should be discarded
         if current_attempts >= MAX_EVOLUTION_ATTEMPTS:
             action = "discarded"
-            print(f"🗑️  PHASE C: discarded {strategy_id} (attempts: {current_attempts} >= {MAX_EVOLUTION_ATTEMPTS})")
-            crud.update_user_strategy(
-                db=db,
-                strategy_id=strategy_id,
-                status=StrategyStatus.DISCARDED,
-                is_active=False,
-            )
+            logger.debug("🗑️  PHASE C: discarded %s (attempts: %d >= %d)", strategy_id, current_attempts, MAX_EVOLUTION_ATTEMPTS)
+            _merge_update(update, status=StrategyStatus.DISCARDED, is_active=False)
             # PHASE C: Return early if discarded
-            return {"action": action, "strategy_id": strategy_id}
+            return {"action": action, "strategy_id": strategy_id}, update
         
         # CRITICAL FIX: Mutation logic was unreachable due to early return above
         # Now mutations will execute when should_mutate is True
         if should_mutate and current_attempts < MAX_EVOLUTION_ATTEMPTS:
-            print(f"🧬 PHASE C: Mutation triggered for {strategy_id} (reason: {mutation_reason}, attempts: {current_attempts})")
+            logger.debug("🧬 PHASE C: Mutation triggered for %s (reason: %s, attempts: %d)", strategy_id, mutation_reason, current_attempts)
             # PHASE C: Mutate strategy - prioritize indicator mutation when winrate < threshold
             if win_rate < 0.60:
                 # PHASE C: When winrate < threshold, mutate indicators
-                print(f"🧬 PHASE C: Mutating indicators for {strategy_id} (reason: {mutation_reason})")
+                logger.debug("🧬 PHASE C: Mutating indicators for %s (reason: %s)", strategy_id, mutation_reason)
                 try:
                     # PHASE C: Force indicator substitution mutation
                     indicator_mutation = self.mutation_engine._mutate_indicator_substitution(strategy)
                     mutations = [indicator_mutation]
                 except Exception as e:
                     # Fallback to normal mutation if indicator substitution fails
-                    print(f"⚠️  PHASE C: Indicator substitution failed, using normal mutation: {e}")
+                    logger.warning("⚠️  PHASE C: Indicator substitution failed, using normal mutation: %s", e)
                     mutations = self.mutation_engine.mutate_strategy(strategy, num_mutations=1)
             else:
                 # PHASE C: Normal mutation
                 mutations = self.mutation_engine.mutate_strategy(strategy, num_mutations=2)
             
             action = "mutated"
+            
+            # Royalty inputs that depend only on the parent: walk the lineage once
+            # per parent rather than once per child
+            if ctx is not None and ctx.lineage is not None:
+                original_strategy_id, depth = ctx.lineage.root_and_depth(strategy_id)
+            else:
+                original_strategy_id, depth = crud.get_lineage_root_and_depth(db, strategy_id)
+            original_strategy = crud.get_user_strategy(db, original_strategy_id) if original_strategy_id else strategy
+            mutation_count = depth + 1
+            original_dict = {
+                "ruleset": original_strategy.ruleset,
+                "parameters": original_strategy.parameters
+            }
+            
             for mutation in mutations:
-                print(f"🧬 PHASE C: mutated {strategy_id} → new child (type: {mutation.get('mutation_type', 'unknown')})")
+                logger.debug("🧬 PHASE C: mutated %s → new child (type: %s)", strategy_id, mutation.get('mutation_type', 'unknown'))
                 # Create new strategy from mutation
                 mutated_data = mutation.get("mutated_strategy", mutation)  # Handle both formats
                 
@@ -566,20 +922,6 @@ class EvolutionWorker:
                         parent_ids = [parent1_id, parent2_id]
                 
                 # Calculate royalty eligibility before creating strategy
-                from ..strategy_engine.mutation_royalty import mutation_royalty_calculator
-                
-                # Find original strategy
-                original_strategy_id = self._find_original_strategy(strategy_id, db)
-                original_strategy = crud.get_user_strategy(db, original_strategy_id) if original_strategy_id else strategy
-                
-                # Count mutations from original
-                mutation_count = self._count_mutations_from_original(original_strategy_id, strategy_id, db) + 1
-                
-                # Calculate royalty eligibility
-                original_dict = {
-                    "ruleset": original_strategy.ruleset,
-                    "parameters": original_strategy.parameters
-                }
                 mutated_dict = {
                     "ruleset": mutated_data.get("ruleset", strategy.ruleset),
                     "parameters": mutated_data.get("parameters", strategy.parameters)
@@ -602,38 +944,35 @@ class EvolutionWorker:
                 )
                 
                 # Create lineage record(s) for all parents
-                for parent_id in parent_ids:
-                    crud.create_strategy_lineage(
-                        db=db,
-                        parent_strategy_id=parent_id,
-                        child_strategy_id=new_strategy.id,
-                        mutation_type=mutation.get("mutation_type", "mutation"),
-                        creator_user_id=strategy.user_id,
-                    )
+                crud.create_strategy_lineages(
+                    db=db,
+                    parent_strategy_ids=parent_ids,
+                    child_strategy_id=new_strategy.id,
+                    mutation_type=mutation.get("mutation_type", "mutation"),
+                    creator_user_id=strategy.user_id,
+                )
+                if ctx is not None and ctx.lineage is not None:
+                    for parent_id in parent_ids:
+                        ctx.lineage.add(new_strategy.id, parent_id)
                 
                 # Record mutation event in MCN (non-blocking)
                 try:
-                    if self.mcn_adapter and self.mcn_adapter.is_available:
-                        self.mcn_adapter.record_event(
-                            event_type="strategy_mutated",
-                            payload={
-                                "parent_strategy_id": strategy_id,
-                                "child_strategy_id": new_strategy.id,
-                                "mutation_type": mutation["mutation_type"],
-                                "timestamp": datetime.now(timezone.utc).isoformat(),
-                            },
-                            strategy_id=strategy_id,
-                        )
+                    self._record_mcn_event(
+                        event_type="strategy_mutated",
+                        payload={
+                            "parent_strategy_id": strategy_id,
+                            "child_strategy_id": new_strategy.id,
+                            "mutation_type": mutation["mutation_type"],
+                            "timestamp": now_iso,
+                        },
+                        strategy_id=strategy_id,
+                    )
                 except Exception as e:
                     # MCN errors should not block evolution
-                    print(f"⚠️  MCN event recording failed (non-fatal): {e}")
+                    logger.warning("⚠️  MCN event recording failed (non-fatal): %s", e)
             
             # Increment evolution attempts
-            crud.update_user_strategy(
-                db=db,
-                strategy_id=strategy_id,
-                evolution_attempts=(strategy.evolution_attempts or 0) + 1
-            )
+            _merge_update(update, evolution_attempts=(strategy.evolution_attempts or 0) + 1)
             
             action = "mutated"
         
@@ -642,72 +981,45 @@ class EvolutionWorker:
             "old_status": current_status,
             "new_status": new_status,
             "score": score,
-        }
-    
-    def _find_original_strategy(self, strategy_id: str, db: Session) -> str:
-        """Find original strategy by traversing lineage backwards."""
-        from ..db import crud
-        parent_lineages = crud.get_strategy_lineages_by_child(db, strategy_id)
-        
-        if not parent_lineages:
-            # This is the original
-            return strategy_id
-        
-        # Recursively find original
-        parent_id = parent_lineages[0].parent_strategy_id
-        return self._find_original_strategy(parent_id, db)
-    
-    def _count_mutations_from_original(self, original_strategy_id: str, current_strategy_id: str, db: Session) -> int:
-        """Count number of mutations from original strategy."""
-        if original_strategy_id == current_strategy_id:
-            return 0
-        
-        from ..db import crud
-        parent_lineages = crud.get_strategy_lineages_by_child(db, current_strategy_id)
-        
-        if not parent_lineages:
-            return 0
-        
-        parent_id = parent_lineages[0].parent_strategy_id
-        return 1 + self._count_mutations_from_original(original_strategy_id, parent_id, db)
+        }, update
     
     def _enforce_strategy_limit(self, db: Session, max_strategies: int):
         """
         Enforce maximum number of active strategies.
         Keep only the best performers (by score).
         """
-        from ..db.models import UserStrategy
-        all_strategies = db.query(UserStrategy).filter(
-            UserStrategy.is_active == True
-        ).all()
-        active_strategies = [s for s in all_strategies if s.status != StrategyStatus.DISCARDED]
-        
-        if len(active_strategies) <= max_strategies:
+        # Rank by score in SQL (missing score counts as 0.0, id breaks ties) and
+        # load only the ids past the top N
+        excess_ids = [
+            strategy_id for (strategy_id,) in db.query(UserStrategy.id).filter(
+                UserStrategy.is_active == True,
+                UserStrategy.status != StrategyStatus.DISCARDED
+            ).order_by(
+                func.coalesce(UserStrategy.score, 0.0).desc(),
+                UserStrategy.id
+            ).offset(max_strategies).all()
+        ]
+        if not excess_ids:
             return
         
-        # Sort by score (descending), keep top N
-        sorted_strategies = sorted(
-            active_strategies,
-            key=lambda s: s.score if s.score is not None else 0.0,
-            reverse=True
-        )
-        
         # Mark excess strategies as inactive
-        for strategy in sorted_strategies[max_strategies:]:
-            crud.update_user_strategy(
-                db=db,
-                strategy_id=strategy.id,
-                is_active=False
-            )
-            print(f"🔇 Deactivated strategy {strategy.id} (limit reached)")
+        db.query(UserStrategy).filter(UserStrategy.id.in_(excess_ids)).update(
+            {UserStrategy.is_active: False}, synchronize_session=False
+        )
+        db.commit()
+        logger.debug("🔇 Deactivated %d strategies (limit reached): %s", len(excess_ids), excess_ids)
 
 
-def run_evolution_worker_once():
-    """Run evolution worker once (for testing or manual trigger)."""
-    from ..db.session import get_db
+def run_evolution_worker_once(worker: Optional[EvolutionWorker] = None):
+    """
+    Run evolution worker once (for testing or manual trigger).
+    
+    Args:
+        worker: Worker to reuse across cycles (keeps its engines and caches); a new one if None
+    """
     db = next(get_db())
     try:
-        worker = EvolutionWorker()
+        worker = worker or EvolutionWorker()
         stats = worker.run_evolution_cycle(db)
         return stats
     finally:
@@ -715,32 +1027,12 @@ def run_evolution_worker_once():
 
 
 def run_evolution_worker_loop():
-    """Run evolution worker in a continuous loop (for production)."""
-    from ..db.session import get_db
-    from ..utils.logger import log
-    import os
+    """Run evolution worker in a continuous loop (standalone; the API schedules it via workers.scheduler)."""
+    from .scheduler import run_periodic
     
+    worker = EvolutionWorker()
     # Use EVOLUTION_INTERVAL_SECONDS from config (default: 480s / 8 minutes)
-    interval_seconds = EVOLUTION_INTERVAL_SECONDS
-    
-    log(f"🚀 Evolution worker started (interval: {interval_seconds} seconds)")
-    
-    while True:
-        try:
-            db = next(get_db())
-            try:
-                worker = EvolutionWorker()
-                stats = worker.run_evolution_cycle(db)
-                log(f"✅ Evolution cycle complete: {stats}")
-            finally:
-                db.close()
-        except Exception as e:
-            log(f"❌ Evolution worker error: {e}")
-            import traceback
-            traceback.print_exc()
-        
-        # PHASE C: Sleep for configured interval
-        time.sleep(interval_seconds)
+    asyncio.run(run_periodic("Evolution worker", lambda: run_evolution_worker_once(worker), EVOLUTION_INTERVAL_SECONDS))
 
 
 if __name__ == "__main__":
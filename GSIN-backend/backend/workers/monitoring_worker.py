@@ -16,16 +16,18 @@ This worker runs periodically to:
 3. Send notifications to users about strategy status changes
 """
 import os
-import time
-from typing import Dict, Any, List, Optional
+import asyncio
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 from threading import Lock
+from concurrent.futures import Future, wait
+from concurrent.futures.process import BrokenProcessPool
 
 from ..db.session import get_db
 from ..db import crud
 from ..db.models import UserStrategy
-from ..strategy_engine.backtest_engine import BacktestEngine
+from ..strategy_engine.backtest_engine import BacktestEngine, run_backtest_pure
 from ..strategy_engine.scoring import score_strategy
 from ..strategy_engine.status_manager import StrategyStatus, determine_strategy_status
 from ..strategy_engine.strategy_fingerprint import create_strategy_fingerprint, strategies_match_fingerprint
@@ -42,17 +44,45 @@ from ..strategy_engine.strategy_config import (
     MONITORING_DISCARD_ROBUSTNESS_THRESHOLD,
     MONITORING_DISCARD_MIN_TRADES,
     MONITORING_DISCARD_MIN_EVALUATION_CYCLES,
+    WIN_RATE_THRESHOLD_PROPOSABLE_HIGH_WIN,
+    WIN_RATE_THRESHOLD_PROPOSABLE_HIGH_SHARPE,
+    MIN_SHARPE_FOR_PROPOSABLE_HIGH_WIN,
+    MIN_SHARPE_FOR_PROPOSABLE_HIGH_SHARPE,
+    MIN_PROFIT_FACTOR_FOR_PROPOSABLE,
+    MAX_DRAWDOWN_FOR_PROPOSABLE,
+    MIN_SCORE_FOR_PROPOSABLE,
+    MIN_TEST_WIN_RATE,
+    MCN_REGIME_STABILITY_SCORE_MIN,
+    MCN_OVERFITTING_RISK_REQUIRED,
+    MIN_TRADES_FOR_PROPOSABLE,
 )
 from ..brain.mcn_adapter import get_mcn_adapter
+from ..strategy_engine.backtest_pool import get_backtest_pool, reset_backtest_pool
 from ..utils.logger import log
 
 
+def _regime_score(per_symbol_performance: Optional[Dict[str, Any]]) -> Optional[float]:
+    """Fraction of symbols with win rate >= 50%, or None without per-symbol data."""
+    if not per_symbol_performance:
+        return None
+    profitable_symbols = sum(
+        1 for perf in per_symbol_performance.values()
+        if isinstance(perf, dict) and perf.get("win_rate", 0.0) >= 0.5
+    )
+    return profitable_symbols / len(per_symbol_performance)
+
+
 class MonitoringWorker:
     """Worker that monitors and gates strategy lifecycle."""
     
     def __init__(self):
         self.backtest_engine = BacktestEngine()
         self.mcn_adapter = get_mcn_adapter()
+        # Per-cycle caches of MCN lineage memory (reset by run_monitoring_cycle)
+        self._lineage_cache: Dict[str, Dict[str, Any]] = {}
+        self._ancestor_memory_cache: Dict[str, Dict[str, Any]] = {}
+        # Sanity-check candles keyed by (symbol, timeframe), shared by the cycle's pending strategies
+        self._sanity_candles: Dict[Tuple[str, str], List[Any]] = {}
     
     def run_monitoring_cycle(self, db: Session) -> Dict[str, Any]:
         """
@@ -62,6 +92,9 @@ class MonitoringWorker:
             Summary of monitoring cycle results
         """
         log("🔍 Starting monitoring cycle...")
+        self._lineage_cache = {}
+        self._ancestor_memory_cache = {}
+        self._sanity_candles = {}
         
         stats = {
             "pending_review_processed": 0,
@@ -82,8 +115,18 @@ class MonitoringWorker:
             
             log(f"📋 Found {len(pending_strategies)} strategies with PENDING_REVIEW status")
             
+            # Sanity-check backtests run in parallel in the backtest process
+            # pool; statuses are still applied here one strategy at a time
+            self._sanity_candles = self._prefetch_sanity_candles(pending_strategies)
+            sanity_backtests = self._submit_sanity_checks(pending_strategies)
+            # Finish the backtests before the first write, so the cycle's
+            # transaction isn't held open while they run
+            wait(sanity_backtests.values())
+            
             for strategy in pending_strategies:
-                result = self._process_pending_strategy(db, strategy)
+                result = self._in_savepoint(db, strategy.id, lambda: self._process_pending_strategy(db, strategy, sanity_backtests.get(strategy.id)))
+                if result is None:
+                    continue
                 stats["pending_review_processed"] += 1
                 
                 if result["action"] == "duplicate":
@@ -96,28 +139,27 @@ class MonitoringWorker:
                 if result.get("notification_sent"):
                     stats["notifications_sent"] += 1
             
-            # 2. Compute robustness for experiment/candidate strategies
-            active_strategies = db.query(UserStrategy).filter(
-                UserStrategy.is_active == True,
-                UserStrategy.status.in_([StrategyStatus.EXPERIMENT, StrategyStatus.CANDIDATE]),
-                UserStrategy.status != StrategyStatus.DISCARDED
-            ).all()
+            # 2. Compute robustness for experiment/candidate strategies with enough data
+            for strategy in self._get_strategies_for_robustness_check(db):
+                result = self._in_savepoint(db, strategy.id, lambda: self._check_robustness_and_promote(db, strategy))
+                if result is None:
+                    continue
+                stats["robustness_checks"] += 1
+                
+                if result["action"] == "promoted_to_proposable":
+                    stats["promoted_to_proposable"] += 1
+                elif result["action"] == "discarded":
+                    stats["discarded"] += 1
+                
+                if result.get("notification_sent"):
+                    stats["notifications_sent"] += 1
             
-            for strategy in active_strategies:
-                # Only check strategies with enough data
-                if strategy.last_backtest_results and strategy.last_backtest_results.get("total_trades", 0) >= MONITORING_DISCARD_MIN_TRADES:
-                    result = self._check_robustness_and_promote(db, strategy)
-                    stats["robustness_checks"] += 1
-                    
-                    if result["action"] == "promoted_to_proposable":
-                        stats["promoted_to_proposable"] += 1
-                    elif result["action"] == "discarded":
-                        stats["discarded"] += 1
-                    
-                    if result.get("notification_sent"):
-                        stats["notifications_sent"] += 1
+            # Status changes and notifications are flushed as they happen and
+            # committed together; each strategy's changes sit in a savepoint
+            db.commit()
         
         except Exception as e:
+            db.rollback()
             log(f"❌ Monitoring cycle error: {e}")
             import traceback
             traceback.print_exc()
@@ -125,15 +167,96 @@ class MonitoringWorker:
         log(f"✅ Monitoring cycle complete: {stats}")
         return stats
     
+    def _in_savepoint(self, db: Session, strategy_id: str, step: Callable[[], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Run one strategy's step in a savepoint of the cycle's transaction.
+        
+        set_strategy_status logs and swallows a failed flush, which leaves the
+        savepoint unusable; committing it then raises, and rolling it back
+        discards only this strategy's changes instead of the whole cycle's.
+        
+        Returns:
+            The step's result, or None if it failed and was rolled back
+        """
+        savepoint = db.begin_nested()
+        try:
+            result = step()
+            savepoint.commit()
+            return result
+        except Exception as e:
+            savepoint.rollback()
+            log(f"❌ Monitoring failed for strategy {strategy_id}, its changes were rolled back: {e}")
+            return None
+    
+    def _get_strategies_for_robustness_check(self, db: Session) -> List[UserStrategy]:
+        """
+        Get active experiment/candidate strategies with enough trades to evaluate.
+        
+        The trade-count gate runs in SQL, so strategies without enough data
+        (and their JSON columns) are never loaded.
+        """
+        total_trades = UserStrategy.last_backtest_results["total_trades"].as_float()
+        return db.query(UserStrategy).filter(
+            UserStrategy.is_active == True,
+            UserStrategy.status.in_([StrategyStatus.EXPERIMENT, StrategyStatus.CANDIDATE]),
+            total_trades >= MONITORING_DISCARD_MIN_TRADES
+        ).all()
+    
+    def _prefetch_sanity_candles(self, strategies: List[UserStrategy]) -> Dict[Tuple[str, str], List[Any]]:
+        """
+        Fetch sanity-check candles once per (symbol, timeframe) in the batch.
+        
+        Pending uploads often share a symbol (AAPL is the default), and the
+        window depends only on the timeframe. Empty fetches are left out so the
+        backtest retries them.
+        """
+        ohlcv_cache = {}
+        for strategy in strategies:
+            kwargs = self._sanity_check_kwargs(strategy)
+            key = (kwargs["symbol"], kwargs["timeframe"])
+            if key in ohlcv_cache:
+                continue
+            try:
+                ohlcv_cache[key] = self.backtest_engine._fetch_candles(
+                    kwargs["symbol"], kwargs["timeframe"], 0, kwargs["start_date"], kwargs["end_date"]
+                )
+            except Exception as e:
+                log(f"⚠️  Failed to prefetch candles for {key[0]} ({key[1]}): {e}")
+                ohlcv_cache[key] = []
+        return {key: candles for key, candles in ohlcv_cache.items() if candles}
+    
+    def _submit_sanity_checks(self, strategies: List[UserStrategy]) -> Dict[str, Future]:
+        """
+        Start sanity-check backtests for strategies in the backtest process pool.
+        
+        Returns:
+            Futures keyed by strategy id ({} if the pool is disabled)
+        """
+        pool = get_backtest_pool()
+        if pool is None:
+            return {}
+        
+        futures = {}
+        for strategy in strategies:
+            try:
+                futures[strategy.id] = pool.submit(run_backtest_pure, "run_backtest", self._sanity_check_kwargs(strategy))
+            except (BrokenProcessPool, RuntimeError) as e:
+                log(f"⚠️  Backtest process pool unavailable ({e}) - running sanity checks in-process")
+                if isinstance(e, BrokenProcessPool):
+                    reset_backtest_pool(pool)
+                break
+        return futures
+    
     def _process_pending_strategy(
         self,
         db: Session,
-        strategy: UserStrategy
+        strategy: UserStrategy,
+        sanity_backtest: Optional[Future] = None
     ) -> Dict[str, Any]:
         """
         Process a pending_review strategy:
         1. Check for duplicates
-        2. Run sanity check
+        2. Run sanity check (or collect the one started by _submit_sanity_checks)
         3. Accept or reject
         """
         strategy_id = strategy.id
@@ -147,7 +270,8 @@ class MonitoringWorker:
                 strategy=strategy,
                 new_status=StrategyStatus.DUPLICATE,
                 reason="This strategy matches an existing strategy in our system.",
-                triggered_by="monitoring_worker"
+                triggered_by="monitoring_worker",
+                commit=False
             )
             
             return {
@@ -157,7 +281,7 @@ class MonitoringWorker:
             }
         
         # Step 2: Run sanity check (lightweight backtest)
-        sanity_result = self._run_sanity_check(strategy)
+        sanity_result = self._run_sanity_check(strategy, sanity_backtest)
         
         if not sanity_result["passed"]:
             # Mark as rejected using centralized helper
@@ -166,7 +290,8 @@ class MonitoringWorker:
                 strategy=strategy,
                 new_status=StrategyStatus.REJECTED,
                 reason=sanity_result.get("reason", "Strategy failed initial validation checks."),
-                triggered_by="monitoring_worker"
+                triggered_by="monitoring_worker",
+                commit=False
             )
             
             return {
@@ -183,7 +308,8 @@ class MonitoringWorker:
             reason="Your strategy passed initial checks and is now being backtested by the Brain.",
             triggered_by="monitoring_worker",
             last_backtest_at=datetime.now(timezone.utc),
-            last_backtest_results=sanity_result.get("backtest_results")
+            last_backtest_results=sanity_result.get("backtest_results"),
+            commit=False
         )
         
         return {
@@ -197,57 +323,74 @@ class MonitoringWorker:
         strategy: UserStrategy
     ) -> Optional[UserStrategy]:
         """Check if strategy matches an existing strategy's fingerprint."""
-        strategy_fp = create_strategy_fingerprint(strategy.ruleset)
+        # The stored fingerprint is kept current by crud; only rows that predate it are hashed
+        strategy_fp = strategy.strategy_fingerprint or create_strategy_fingerprint(strategy.ruleset)
         
-        # Get all active strategies (excluding this one)
-        existing_strategies = db.query(UserStrategy).filter(
+        # Indexed lookup on the stored fingerprint (set by crud on create/update)
+        return db.query(UserStrategy).filter(
+            UserStrategy.strategy_fingerprint == strategy_fp,
             UserStrategy.id != strategy.id,
-            UserStrategy.status != StrategyStatus.DISCARDED,
-            UserStrategy.status != StrategyStatus.REJECTED,
-            UserStrategy.status != StrategyStatus.DUPLICATE
-        ).all()
-        
-        for existing in existing_strategies:
-            existing_fp = create_strategy_fingerprint(existing.ruleset)
-            if strategy_fp == existing_fp:
-                return existing
-        
-        return None
+            UserStrategy.status.notin_([
+                StrategyStatus.DISCARDED,
+                StrategyStatus.REJECTED,
+                StrategyStatus.DUPLICATE,
+            ])
+        ).first()
+    
+    def _sanity_check_kwargs(self, strategy: UserStrategy) -> Dict[str, Any]:
+        """Arguments of the sanity-check backtest (plain values, so they can go to a worker process)."""
+        # Extract symbol and timeframe
+        symbol = strategy.ruleset.get("ticker") or strategy.ruleset.get("symbol") or strategy.ruleset.get("default_symbol", "AAPL")
+        if isinstance(symbol, list):
+            symbol = symbol[0] if symbol else "AAPL"
+        timeframe = strategy.ruleset.get("timeframe", "1d")
+        
+        # Use a smaller date range for sanity check (6-12 months for daily, smaller for intraday)
+        end_date = datetime.now(timezone.utc)
+        if timeframe in ["1d", "4h"]:
+            start_date = end_date - timedelta(days=180)  # 6 months
+        elif timeframe in ["1h", "15m"]:
+            start_date = end_date - timedelta(days=30)  # 1 month
+        else:
+            start_date = end_date - timedelta(days=7)  # 1 week for very short timeframes
+        
+        kwargs = {
+            "symbol": symbol,
+            "ruleset": strategy.ruleset,
+            "timeframe": timeframe,
+            "start_date": start_date,
+            "end_date": end_date,
+            "train_test_split": 0.7,
+        }
+        # Only this strategy's series, to keep what is sent to the pool small
+        candles = self._sanity_candles.get((symbol, timeframe))
+        if candles:
+            kwargs["ohlcv_cache"] = {(symbol, timeframe): candles}
+        return kwargs
     
     def _run_sanity_check(
         self,
-        strategy: UserStrategy
+        strategy: UserStrategy,
+        sanity_backtest: Optional[Future] = None
     ) -> Dict[str, Any]:
         """
         Run a lightweight sanity check on a new strategy.
         
         Uses a small historical window to quickly validate basic functionality.
+        
+        Args:
+            sanity_backtest: Backtest already running in the process pool, if any
         """
         try:
-            # Extract symbol and timeframe
-            symbol = strategy.ruleset.get("ticker") or strategy.ruleset.get("symbol") or strategy.ruleset.get("default_symbol", "AAPL")
-            if isinstance(symbol, list):
-                symbol = symbol[0] if symbol else "AAPL"
-            timeframe = strategy.ruleset.get("timeframe", "1d")
-            
-            # Use a smaller date range for sanity check (6-12 months for daily, smaller for intraday)
-            end_date = datetime.now(timezone.utc)
-            if timeframe in ["1d", "4h"]:
-                start_date = end_date - timedelta(days=180)  # 6 months
-            elif timeframe in ["1h", "15m"]:
-                start_date = end_date - timedelta(days=30)  # 1 month
-            else:
-                start_date = end_date - timedelta(days=7)  # 1 week for very short timeframes
-            
             # Run lightweight backtest
-            backtest_results = self.backtest_engine.run_backtest(
-                symbol=symbol,
-                ruleset=strategy.ruleset,
-                timeframe=timeframe,
-                start_date=start_date,
-                end_date=end_date,
-                train_test_split=0.7
-            )
+            backtest_results = None
+            if sanity_backtest is not None:
+                try:
+                    backtest_results = sanity_backtest.result()
+                except BrokenProcessPool as e:
+                    log(f"⚠️  Backtest process pool failed ({e}) - rerunning sanity check in-process")
+            if backtest_results is None:
+                backtest_results = self.backtest_engine.run_backtest(**self._sanity_check_kwargs(strategy))
             
             # Extract metrics
             total_trades = backtest_results.get("total_trades", 0)
@@ -294,6 +437,52 @@ class MonitoringWorker:
                 "reason": f"Strategy validation failed: {str(e)}"
             }
     
+    def _get_mcn_robustness(
+        self,
+        db: Session,
+        strategy: UserStrategy,
+        regime_score: Optional[float] = None
+    ) -> Tuple[float, str]:
+        """
+        Get MCN regime stability and overfitting risk from the strategy's lineage.
+        
+        Args:
+            regime_score: Profitable-symbol fraction (from _regime_score), used
+                as the regime stability when known
+        
+        Returns:
+            (mcn_regime_stability_score, mcn_overfitting_risk); passing defaults if MCN is unavailable
+        """
+        mcn_regime_stability_score = 0.0
+        mcn_overfitting_risk = "Unknown"
+        
+        try:
+            lineage_memory = self._lineage_cache.get(strategy.id)
+            if lineage_memory is None:
+                # Strategies sharing ancestors reuse their MCN memory within the cycle
+                lineage_memory = self.mcn_adapter.get_strategy_lineage_memory(
+                    strategy.id, db, memory_cache=self._ancestor_memory_cache
+                )
+                self._lineage_cache[strategy.id] = lineage_memory
+            if lineage_memory:
+                ancestor_stability = lineage_memory.get("ancestor_stability", 0.5)
+                has_overfit = lineage_memory.get("has_overfit_ancestors", False)
+                
+                # Regime stability from per_symbol_performance if available
+                mcn_regime_stability_score = regime_score if regime_score is not None else ancestor_stability
+                
+                mcn_overfitting_risk = "High" if has_overfit else "Low"
+            else:
+                # Default to passing if MCN unavailable
+                mcn_regime_stability_score = 0.75
+                mcn_overfitting_risk = "Low"
+        except Exception as e:
+            # Default to passing if MCN check fails
+            mcn_regime_stability_score = 0.75
+            mcn_overfitting_risk = "Low"
+        
+        return mcn_regime_stability_score, mcn_overfitting_risk
+    
     def _check_robustness_and_promote(
         self,
         db: Session,
@@ -305,8 +494,9 @@ class MonitoringWorker:
         if not strategy.last_backtest_results:
             return {"action": "skipped", "reason": "no_backtest_data"}
         
-        # Calculate robustness score
-        robustness_score = self._calculate_robustness_score(strategy)
+        # Calculate robustness score (per-symbol regime score is shared with the MCN check)
+        regime_score = _regime_score(strategy.per_symbol_performance)
+        robustness_score = self._calculate_robustness_score(strategy, regime_score)
         
         current_status = strategy.status or StrategyStatus.EXPERIMENT
         
@@ -318,61 +508,13 @@ class MonitoringWorker:
             win_rate = metrics.get("win_rate", 0.0) or 0.0
             sharpe = metrics.get("sharpe_ratio", 0.0) or 0.0
             profit_factor = metrics.get("profit_factor", 0.0) or 0.0
-            max_drawdown = abs(metrics.get("max_drawdown", 0.0))
+            max_drawdown = abs(metrics.get("max_drawdown", 0.0) or 0.0)
             total_trades = metrics.get("total_trades", 0) or 0
             score = strategy.score or 0.0
             test_metrics = metrics.get("test_metrics", {})
             test_win_rate = test_metrics.get("win_rate", win_rate) if test_metrics else win_rate
             
-            # Get MCN robustness data
-            mcn_regime_stability_score = 0.0
-            mcn_overfitting_risk = "Unknown"
-            
-            try:
-                from ..brain.mcn_adapter import get_mcn_adapter
-                mcn_adapter = get_mcn_adapter()
-                lineage_memory = mcn_adapter.get_strategy_lineage_memory(strategy.id, db)
-                if lineage_memory:
-                    ancestor_stability = lineage_memory.get("ancestor_stability", 0.5)
-                    has_overfit = lineage_memory.get("has_overfit_ancestors", False)
-                    
-                    # Calculate regime stability from per_symbol_performance if available
-                    if strategy.per_symbol_performance:
-                        profitable_symbols = sum(1 for perf in strategy.per_symbol_performance.values() 
-                                               if isinstance(perf, dict) and perf.get("win_rate", 0.0) >= 0.5)
-                        total_symbols = len(strategy.per_symbol_performance)
-                        if total_symbols > 0:
-                            mcn_regime_stability_score = profitable_symbols / total_symbols
-                        else:
-                            mcn_regime_stability_score = ancestor_stability
-                    else:
-                        mcn_regime_stability_score = ancestor_stability
-                    
-                    mcn_overfitting_risk = "High" if has_overfit else "Low"
-                else:
-                    # Default to passing if MCN unavailable
-                    mcn_regime_stability_score = 0.75
-                    mcn_overfitting_risk = "Low"
-            except Exception as e:
-                # Default to passing if MCN check fails
-                mcn_regime_stability_score = 0.75
-                mcn_overfitting_risk = "Low"
-            
             # Flexible thresholds: Path 1 (High Win) OR Path 2 (High Sharpe)
-            from ..strategy_engine.strategy_config import (
-                WIN_RATE_THRESHOLD_PROPOSABLE_HIGH_WIN,
-                WIN_RATE_THRESHOLD_PROPOSABLE_HIGH_SHARPE,
-                MIN_SHARPE_FOR_PROPOSABLE_HIGH_WIN,
-                MIN_SHARPE_FOR_PROPOSABLE_HIGH_SHARPE,
-                MIN_PROFIT_FACTOR_FOR_PROPOSABLE,
-                MAX_DRAWDOWN_FOR_PROPOSABLE,
-                MIN_SCORE_FOR_PROPOSABLE,
-                MIN_TEST_WIN_RATE,
-                MCN_REGIME_STABILITY_SCORE_MIN,
-                MCN_OVERFITTING_RISK_REQUIRED,
-                MIN_TRADES_FOR_PROPOSABLE,
-            )
-            
             path1_met = (
                 total_trades >= MIN_TRADES_FOR_PROPOSABLE and
                 win_rate >= WIN_RATE_THRESHOLD_PROPOSABLE_HIGH_WIN and  # 80%
@@ -393,32 +535,32 @@ class MonitoringWorker:
                 test_win_rate >= MIN_TEST_WIN_RATE  # 0.70
             )
             
-            # MCN requirements
-            mcn_requirements_met = (
-                mcn_regime_stability_score >= MCN_REGIME_STABILITY_SCORE_MIN and
-                mcn_overfitting_risk == MCN_OVERFITTING_RISK_REQUIRED
-            )
-            
-            # Base requirements: Either path must be met + robustness score + MCN checks
-            if (
-                (path1_met or path2_met) and
-                robustness_score >= MONITORING_ROBUSTNESS_SCORE_MIN and
-                mcn_requirements_met
-            ):
-                # Promote to proposable using centralized helper
-                set_strategy_status(
-                    db=db,
-                    strategy=strategy,
-                    new_status=StrategyStatus.PROPOSABLE,
-                    reason="Your strategy has passed robustness checks and is now available for other users to run. You are now eligible for royalties according to your plan.",
-                    triggered_by="monitoring_worker"
+            # The MCN lookups are only worth doing once the numeric gates pass
+            if (path1_met or path2_met) and robustness_score >= MONITORING_ROBUSTNESS_SCORE_MIN:
+                mcn_regime_stability_score, mcn_overfitting_risk = self._get_mcn_robustness(db, strategy, regime_score)
+                
+                # MCN requirements
+                mcn_requirements_met = (
+                    mcn_regime_stability_score >= MCN_REGIME_STABILITY_SCORE_MIN and
+                    mcn_overfitting_risk == MCN_OVERFITTING_RISK_REQUIRED
                 )
                 
-                return {
-                    "action": "promoted_to_proposable",
-                    "robustness_score": robustness_score,
-                    "notification_sent": True
-                }
+                if mcn_requirements_met:
+                    # Promote to proposable using centralized helper
+                    set_strategy_status(
+                        db=db,
+                        strategy=strategy,
+                        new_status=StrategyStatus.PROPOSABLE,
+                        reason="Your strategy has passed robustness checks and is now available for other users to run. You are now eligible for royalties according to your plan.",
+                        triggered_by="monitoring_worker",
+                        commit=False
+                    )
+                    
+                    return {
+                        "action": "promoted_to_proposable",
+                        "robustness_score": robustness_score,
+                        "notification_sent": True
+                    }
         
         # Check if should discard experiment strategies
         if current_status == StrategyStatus.EXPERIMENT:
@@ -436,7 +578,8 @@ class MonitoringWorker:
                     strategy=strategy,
                     new_status=StrategyStatus.DISCARDED,
                     reason="Your strategy has been deprecated based on new performance data.",
-                    triggered_by="monitoring_worker"
+                    triggered_by="monitoring_worker",
+                    commit=False
                 )
                 
                 return {
@@ -452,7 +595,8 @@ class MonitoringWorker:
     
     def _calculate_robustness_score(
         self,
-        strategy: UserStrategy
+        strategy: UserStrategy,
+        regime_score: Optional[float] = None
     ) -> float:
         """
         Calculate robustness score (0-100) based on:
@@ -460,6 +604,10 @@ class MonitoringWorker:
         - Walk-forward stability
         - Parameter sensitivity
         - Classic metrics
+        
+        Args:
+            regime_score: Precomputed _regime_score(strategy.per_symbol_performance)
+                (computed here if None)
         """
         if not strategy.last_backtest_results:
             return 0.0
@@ -470,7 +618,7 @@ class MonitoringWorker:
         # Component 1: Classic metrics (40% weight)
         sharpe = metrics.get("sharpe_ratio", 0.0) or 0.0
         profit_factor = metrics.get("profit_factor", 0.0) or 0.0
-        max_drawdown = abs(metrics.get("max_drawdown", 0.0))
+        max_drawdown = abs(metrics.get("max_drawdown", 0.0) or 0.0)
         
         classic_score = 0.0
         if sharpe > 0:
@@ -484,17 +632,9 @@ class MonitoringWorker:
         
         # Component 2: Regime diversity (30% weight)
         # Check per_symbol_performance as proxy for regime diversity
-        regime_score = 0.5  # Default
-        if strategy.per_symbol_performance:
-            profitable_symbols = sum(
-                1 for perf in strategy.per_symbol_performance.values()
-                if isinstance(perf, dict) and perf.get("win_rate", 0.0) >= 0.5
-            )
-            total_symbols = len(strategy.per_symbol_performance)
-            if total_symbols > 0:
-                regime_score = profitable_symbols / total_symbols
-        
-        score_components.append(regime_score * 0.30)
+        if regime_score is None:
+            regime_score = _regime_score(strategy.per_symbol_performance)
+        score_components.append((0.5 if regime_score is None else regime_score) * 0.30)  # 0.5 default
         
         # Component 3: Walk-forward stability (20% weight)
         train_metrics = strategy.train_metrics or {}
@@ -525,11 +665,16 @@ class MonitoringWorker:
     
 
 
-def run_monitoring_worker_once():
-    """Run monitoring worker once (for testing)."""
+def run_monitoring_worker_once(worker: Optional[MonitoringWorker] = None):
+    """
+    Run monitoring worker once (for testing).
+    
+    Args:
+        worker: Worker to reuse across cycles (keeps its backtest engine); a new one if None
+    """
     db = next(get_db())
     try:
-        worker = MonitoringWorker()
+        worker = worker or MonitoringWorker()
         stats = worker.run_monitoring_cycle(db)
         return stats
     finally:
@@ -537,28 +682,11 @@ def run_monitoring_worker_once():
 
 
 def run_monitoring_worker_loop():
-    """Run monitoring worker in a continuous loop."""
-    from ..db.session import get_db
-    from ..utils.logger import log
-    
-    interval_seconds = MONITORING_WORKER_INTERVAL_SECONDS
-    log(f"🔍 Monitoring worker started (interval: {interval_seconds} seconds)")
+    """Run monitoring worker in a continuous loop (standalone; the API schedules it via workers.scheduler)."""
+    from .scheduler import run_periodic
     
-    while True:
-        try:
-            db = next(get_db())
-            try:
-                worker = MonitoringWorker()
-                stats = worker.run_monitoring_cycle(db)
-                log(f"✅ Monitoring cycle complete: {stats}")
-            finally:
-                db.close()
-        except Exception as e:
-            log(f"❌ Monitoring worker error: {e}")
-            import traceback
-            traceback.print_exc()
-        
-        time.sleep(interval_seconds)
+    worker = MonitoringWorker()
+    asyncio.run(run_periodic("Monitoring worker", lambda: run_monitoring_worker_once(worker), MONITORING_WORKER_INTERVAL_SECONDS))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,62 @@
+# backend/workers/scheduler.py
+"""
+Periodic scheduling for the background workers.
+
+The evolution and monitoring workers run as tasks on one asyncio loop (the
+API's, when started from main.py) instead of each owning a thread that sits
+in time.sleep(). A cycle runs in a worker thread with its own DB session,
+which is closed before the task sleeps, so no connection is held between
+cycles.
+"""
+import asyncio
+import traceback
+from typing import Any, Callable, List
+
+from ..utils.logger import log
+
+
+async def run_periodic(name: str, run_once: Callable[[], Any], interval_seconds: float):
+    """
+    Run `run_once` in a worker thread every `interval_seconds`, until cancelled.
+    
+    Errors in a cycle are logged and the next cycle runs as scheduled.
+    """
+    log(f"🚀 {name} started (interval: {interval_seconds} seconds)")
+    while True:
+        try:
+            stats = await asyncio.to_thread(run_once)
+            log(f"✅ {name} cycle complete: {stats}")
+        except Exception as e:
+            log(f"❌ {name} error: {e}")
+            traceback.print_exc()
+        
+        await asyncio.sleep(interval_seconds)
+
+
+def start_background_workers() -> List[asyncio.Task]:
+    """
+    Schedule the evolution and monitoring workers on the running event loop.
+    
+    Each worker is created once and reused every cycle, so its backtest
+    engine and caches persist between cycles.
+    """
+    from .evolution_worker import EvolutionWorker, run_evolution_worker_once, EVOLUTION_INTERVAL_SECONDS
+    from .monitoring_worker import MonitoringWorker, run_monitoring_worker_once, MONITORING_WORKER_INTERVAL_SECONDS
+    
+    evolution_worker = EvolutionWorker()
+    monitoring_worker = MonitoringWorker()
+    return [
+        asyncio.create_task(run_periodic(
+            "Evolution worker", lambda: run_evolution_worker_once(evolution_worker), EVOLUTION_INTERVAL_SECONDS
+        )),
+        asyncio.create_task(run_periodic(
+            "Monitoring worker", lambda: run_monitoring_worker_once(monitoring_worker), MONITORING_WORKER_INTERVAL_SECONDS
+        )),
+    ]
+
+
+async def stop_background_workers(tasks: List[asyncio.Task]):
+    """Cancel worker tasks (a cycle already running finishes in its thread)."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,47 +1,102 @@
 # MCN stub — replace with your private implementation later
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from time import time
 
-# Simple in-memory store with decay & weights
-_MEMORY: List[Dict[str, Any]] = []
+import numpy as np
+
+# Simple in-memory store with decay & weights, kept as parallel arrays:
+# vectors, weights and timestamps live in preallocated NumPy buffers used as
+# a ring (oldest entry at _head), so decay/stats are single vectorized passes.
 _DECAY = 0.99  # per-maintain call
 _MAX = 2000
 
+_VECS: Optional[np.ndarray] = None   # (_MAX, dim) float32
+_W = np.empty(_MAX, np.float32)      # weights
+_TS = np.empty(_MAX, np.float64)     # insertion timestamps
+_META: List[Optional[Dict]] = [None] * _MAX
+_n = 0     # number of live entries
+_head = 0  # physical slot of the oldest entry
+
+def _init(dim: int) -> None:
+    global _VECS
+    _VECS = np.empty((_MAX, dim), np.float32)
+
+def _slots(start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+    # physical slots of live entries [start:stop), oldest first
+    stop = _n if stop is None else stop
+    return (_head + np.arange(start, stop)) % _MAX
+
+def _records(slots: np.ndarray) -> List[Dict[str, Any]]:
+    # one gather + tolist per column rather than per-entry conversions
+    if len(slots) == 0:
+        return []
+    rows = zip(slots.tolist(), _VECS[slots].tolist(), _W[slots].tolist(), _TS[slots].tolist())
+    return [{"vec": v, "meta": _META[i], "w": w, "ts": t} for i, v, w, t in rows]
+
 def remember(vectors: List[List[float]], meta: List[Dict]) -> None:
-    ts = time()
-    for v, m in zip(vectors, meta):
-        _MEMORY.append({
-            "vec": [float(x) for x in v],
-            "meta": dict(m),
-            "w": 1.0,             # initial weight
-            "ts": ts
-        })
-    # cap size (FIFO)
-    if len(_MEMORY) > _MAX:
-        del _MEMORY[:len(_MEMORY) - _MAX]
+    global _n, _head
+    k = min(len(vectors), len(meta))
+    if k == 0:
+        return
+    vecs = np.asarray(vectors[:k], dtype=np.float32)
+    meta = meta[:k]
+    if _VECS is None:
+        _init(vecs.shape[1])
+    # only the newest _MAX can survive the cap (FIFO)
+    if k > _MAX:
+        vecs, meta, k = vecs[-_MAX:], meta[-_MAX:], _MAX
+
+    slots = (_head + _n + np.arange(k)) % _MAX
+    _VECS[slots] = vecs
+    _W[slots] = 1.0            # initial weight
+    _TS[slots] = time()
+    for i, m in zip(slots.tolist(), meta):
+        _META[i] = dict(m)
+
+    overflow = max(0, _n + k - _MAX)
+    _head = (_head + overflow) % _MAX
+    _n = min(_n + k, _MAX)
 
 def query(vectors: List[List[float]], topk: int = 5) -> List[Dict]:
     # trivial: return latest topk by weight/time
-    return sorted(_MEMORY, key=lambda r: (r["w"], r["ts"]))[-topk:]
+    if topk <= 0:
+        return []
+    slots = _slots()
+    w = _W[slots]
+    # only entries weighing at least the topk-th largest weight can qualify
+    cand = np.arange(_n)
+    if topk < _n:
+        kth = np.partition(w, _n - topk)[_n - topk]
+        cand = np.flatnonzero(w >= kth)
+    order = cand[np.lexsort((_TS[slots[cand]], w[cand]))]
+    return _records(slots[order[-topk:]])
 
 def maintain() -> None:
     # exponential decay of weights; clip and drop near-zero
-    keep: List[Dict[str, Any]] = []
-    for r in _MEMORY:
-        r["w"] *= _DECAY
-        if r["w"] >= 1e-4:
-            keep.append(r)
-    _MEMORY[:] = keep
+    global _n, _head, _META
+    if _n == 0:
+        return
+    slots = _slots()
+    _W[slots] *= _DECAY
+    keep = slots[_W[slots] >= 1e-4]
+    m = len(keep)
+    if m == _n:
+        return  # nothing dropped: the ring stays as it is
+    # compact survivors to the front (fancy indexing copies, so overlap is safe)
+    _VECS[:m] = _VECS[keep]
+    _W[:m] = _W[keep]
+    _TS[:m] = _TS[keep]
+    _META = [_META[i] for i in keep.tolist()] + [None] * (_MAX - m)
+    _n, _head = m, 0
 
 # ---- helper accessors for UI (not part of public contract) ----
 def _peek(n: int = 200) -> List[Dict[str, Any]]:
-    return _MEMORY[-n:]
+    return _records(_slots(max(0, _n - n)))
 
 def _stats() -> Dict[str, Any]:
-    n = len(_MEMORY)
-    if n == 0:
+    if _n == 0:
         return {"count": 0, "avg_vec": [0,0,0], "avg_w": 0.0}
-    avg_vec = [sum(r["vec"][i] for r in _MEMORY)/n for i in range(3)]
-    avg_w = sum(r["w"] for r in _MEMORY)/n
-    return {"count": n, "avg_vec": avg_vec, "avg_w": avg_w}
-
+    slots = _slots()
+    avg_vec = _VECS[slots, :3].mean(axis=0, dtype=np.float64).tolist()
+    avg_w = float(_W[slots].mean(dtype=np.float64))
+    return {"count": _n, "avg_vec": avg_vec, "avg_w": avg_w}
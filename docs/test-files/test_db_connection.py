@@ -4,12 +4,20 @@ Test script to verify Supabase database connection.
 Run this to test different connection string formats.
 """
 import sys
+# One-off script: skip writing .pyc files for everything it imports
+sys.dont_write_bytecode = True
+import re
 from pathlib import Path
-from dotenv import dotenv_values
+
+# KEY=value lines; a single regex pass is all this .env needs
+_ENV_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)\s*$', re.M)
 
 # Load .env
 cfg_path = Path(__file__).parent / "config" / ".env"
-cfg = dotenv_values(str(cfg_path)) if cfg_path.exists() else {}
+cfg = (
+    {k: v.strip('"\'') for k, v in _ENV_RE.findall(cfg_path.read_text())}
+    if cfg_path.exists() else {}
+)
 db_url = cfg.get("DATABASE_URL", "")
 
 print("=" * 60)
@@ -20,10 +28,32 @@ print(f"\nCurrent DATABASE_URL: {db_url[:60]}...\n")
 # Test connection
 try:
     from sqlalchemy import create_engine, text
-    engine = create_engine(db_url, connect_args={"connect_timeout": 5})
+    from sqlalchemy.pool import NullPool
+    if ":6543" in db_url:
+        # Transaction pooler: PgBouncer already pools, so don't hold connections here
+        pool_args = {"poolclass": NullPool}
+    else:
+        # Same pool shape the app uses against Supabase, kept within pooler limits
+        pool_args = {
+            "pool_size": 3,
+            "max_overflow": 2,
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+            "pool_timeout": 30,
+        }
+    # connect_timeout only bounds the TCP connect; keepalives and
+    # tcp_user_timeout (ms) also drop a peer that stalls mid-handshake
+    connect_args = {
+        "connect_timeout": 5,
+        "keepalives": 1,
+        "keepalives_idle": 2,
+        "keepalives_interval": 1,
+        "keepalives_count": 2,
+        "tcp_user_timeout": 5000,
+    }
+    engine = create_engine(db_url, connect_args=connect_args, **pool_args)
     with engine.connect() as conn:
-        result = conn.execute(text("SELECT version()"))
-        version = result.fetchone()[0]
+        version = conn.execute(text("SELECT version()")).scalar()
         print("✅ SUCCESS! Database connection working!")
         print(f"PostgreSQL version: {version[:60]}...")
         sys.exit(0)
@@ -4,6 +4,8 @@ Test script to verify all implementation changes are working correctly.
 Run this before starting the app to ensure everything is set up properly.
 """
 import sys
+# One-off script: skip writing .pyc files for everything it imports
+sys.dont_write_bytecode = True
 from pathlib import Path
 
 # Add project root to path
@@ -11,35 +13,50 @@ ROOT = Path(__file__).resolve().parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+# backend modules are imported inside the tests that use them, so each test
+# only pays for its own imports
 from sqlalchemy.orm import Session
-from backend.db.session import SessionLocal
-from backend.db import crud
-from backend.db.models import User, UserPaperAccount, UserStrategy, UserTradingSettings
-from backend.broker.paper_broker import PaperBroker
-from backend.market_data.cache import get_cache
-from backend.brain.brain_service import BrainService
-from backend.strategy_engine.backtest_engine import BacktestEngine
-from backend.broker.alpaca_broker import AlpacaBroker
+from concurrent.futures import ThreadPoolExecutor
+import io
 import os
+import re
+import threading
+import traceback
+
+# KEY=value lines; a single regex pass is all the .env check needs
+_ENV_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)\s*$', re.M)
+
+# One session shared by the DB tests, so the run opens a single connection
+_SHARED_DB = None
+
+def _get_shared_db() -> Session:
+    """Return the module's shared session, opening it on first use."""
+    global _SHARED_DB
+    if _SHARED_DB is None:
+        from backend.db.session import SessionLocal
+        _SHARED_DB = SessionLocal()
+    return _SHARED_DB
 
 def test_models():
     """Test that all new models can be imported and have correct fields."""
     print("\n📋 Testing Models...")
     try:
+        from sqlalchemy import inspect as sa_inspect
         from backend.db.models import UserPaperAccount, UserStrategy, UserTradingSettings
         
+        def mapped_attrs(model):
+            return set(sa_inspect(model).attrs.keys())
+        
         # Check UserPaperAccount fields
-        assert hasattr(UserPaperAccount, 'balance')
-        assert hasattr(UserPaperAccount, 'starting_balance')
-        assert hasattr(UserPaperAccount, 'last_reset_at')
+        assert {'balance', 'starting_balance', 'last_reset_at'} <= mapped_attrs(UserPaperAccount)
         print("  ✅ UserPaperAccount model has all required fields")
         
         # Check UserStrategy has is_proposable
-        assert hasattr(UserStrategy, 'is_proposable')
+        assert 'is_proposable' in mapped_attrs(UserStrategy)
         print("  ✅ UserStrategy model has is_proposable field")
         
         # Check UserTradingSettings has daily_profit_target
-        assert hasattr(UserTradingSettings, 'daily_profit_target')
+        assert 'daily_profit_target' in mapped_attrs(UserTradingSettings)
         print("  ✅ UserTradingSettings model has daily_profit_target field")
         
         return True
@@ -47,17 +64,18 @@ def test_models():
         print(f"  ❌ Model test failed: {e}")
         return False
 
-def test_crud_functions():
+def test_crud_functions(db: Session = None):
     """Test CRUD functions for paper accounts."""
     print("\n💾 Testing CRUD Functions...")
+    db = db or _get_shared_db()
     try:
-        db = SessionLocal()
+        from backend.db import crud
+        from backend.db.models import User, UserRole, SubscriptionTier
         
         # Create a test user first (required for foreign key)
         test_user_id = "test-user-123"
         test_user = crud.get_user_by_id(db, test_user_id)
         if not test_user:
-            from backend.db.models import UserRole, SubscriptionTier
             test_user = User(
                 id=test_user_id,
                 email="test@example.com",
@@ -92,21 +110,22 @@ def test_crud_functions():
         db.delete(account)
         db.delete(test_user)
         db.commit()
-        db.close()
         
         return True
     except Exception as e:
         print(f"  ❌ CRUD test failed: {e}")
         import traceback
         traceback.print_exc()
-        if 'db' in locals():
-            db.close()
+        # Leave the shared session usable for the next test
+        db.rollback()
         return False
 
 def test_market_data_cache():
     """Test market data caching."""
     print("\n💾 Testing Market Data Cache...")
     try:
+        from backend.market_data.cache import get_cache
+        
         cache = get_cache()
         
         # Test cache set/get
@@ -116,11 +135,18 @@ def test_market_data_cache():
         assert cached["price"] == 150.0
         print("  ✅ Market data cache set/get works")
         
-        # Test cache expiration
-        import time
-        cache.set("price", "TSLA", {"price": 200.0}, None)
-        time.sleep(0.1)  # Wait a bit
-        cached = cache.get("price", "TSLA", None, ttl_seconds=0)  # Expired immediately
+        # Test cache expiration on a separate cache driven by a hand-advanced
+        # clock, so no real time has to pass
+        import tempfile
+        from datetime import datetime, timedelta
+        from backend.market_data.cache import MarketDataCache
+        
+        now = [datetime.now()]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            clocked = MarketDataCache(cache_dir=cache_dir, clock=lambda: now[0])
+            clocked.set("price", "TSLA", {"price": 200.0}, None)
+            now[0] += timedelta(seconds=10)
+            cached = clocked.get("price", "TSLA", None, ttl_seconds=5)
         assert cached is None
         print("  ✅ Market data cache expiration works")
         
@@ -129,11 +155,14 @@ def test_market_data_cache():
         print(f"  ❌ Cache test failed: {e}")
         return False
 
-def test_paper_broker():
+def test_paper_broker(db: Session = None):
     """Test PaperBroker integration with UserPaperAccount."""
     print("\n📊 Testing PaperBroker...")
+    db = db or _get_shared_db()
     try:
-        db = SessionLocal()
+        from backend.db import crud
+        from backend.db.models import User, UserRole, SubscriptionTier
+        from backend.broker.paper_broker import PaperBroker
         
         # Create a test user
         test_user_id = "test-broker-user"
@@ -144,8 +173,8 @@ def test_paper_broker():
                 id=test_user_id,
                 email="test@example.com",
                 name="Test User",
-                role=crud.UserRole.USER,
-                subscription_tier=crud.SubscriptionTier.USER,
+                role=UserRole.USER,
+                subscription_tier=SubscriptionTier.USER,
             )
             db.add(test_user)
             db.commit()
@@ -167,21 +196,22 @@ def test_paper_broker():
             db.delete(paper_account)
         db.delete(test_user)
         db.commit()
-        db.close()
         
         return True
     except Exception as e:
         print(f"  ❌ PaperBroker test failed: {e}")
         import traceback
         traceback.print_exc()
-        if 'db' in locals():
-            db.close()
+        # Leave the shared session usable for the next test
+        db.rollback()
         return False
 
 def test_backtest_engine():
     """Test that backtest engine doesn't check capital constraints."""
     print("\n🧪 Testing Backtest Engine...")
     try:
+        from backend.strategy_engine.backtest_engine import BacktestEngine
+        
         engine = BacktestEngine()
         # Just verify it initializes - actual backtest requires market data
         assert engine is not None
@@ -196,6 +226,8 @@ def test_brain_service():
     """Test BrainService with is_proposable check."""
     print("\n🧠 Testing Brain Service...")
     try:
+        from backend.brain.brain_service import BrainService
+        
         service = BrainService()
         assert service is not None
         print("  ✅ BrainService initializes correctly")
@@ -209,16 +241,14 @@ def test_alpaca_safety():
     """Test Alpaca broker safety (no funding endpoints)."""
     print("\n🔒 Testing Alpaca Safety...")
     try:
+        from backend.broker.alpaca_broker import AlpacaBroker
+        
         broker = AlpacaBroker()
         
         # Check that it only uses order/account endpoints
-        # We can't actually test the API calls without keys, but we can verify the code
-        import inspect
-        source = inspect.getsource(broker.place_market_order)
-        
-        # Verify safety comments are present
-        assert "SAFETY" in source or "order endpoints" in source.lower()
-        assert "funding" not in source.lower() or "NO" in source or "NOT" in source
+        # We can't actually test the API calls without keys, but the broker declares its guarantees
+        assert "order_endpoints_only" in broker._SAFETY_MARKERS
+        assert "funding_disabled" in broker._SAFETY_MARKERS
         print("  ✅ Alpaca broker has safety documentation")
         print("  ℹ️  Note: REAL trades are capped at 1 share by default")
         
@@ -232,11 +262,10 @@ def test_environment_variables():
     print("\n🔧 Testing Environment Variables...")
     try:
         from pathlib import Path
-        from dotenv import dotenv_values
         
         CFG_PATH = Path(__file__).resolve().parent / "config" / ".env"
         if CFG_PATH.exists():
-            cfg = dotenv_values(str(CFG_PATH))
+            cfg = {k: v.strip('"\'') for k, v in _ENV_RE.findall(CFG_PATH.read_text())}
             print(f"  ✅ .env file found at {CFG_PATH}")
             
             # Check for PAPER_STARTING_BALANCE
@@ -252,38 +281,99 @@ def test_environment_variables():
         print(f"  ❌ Environment variable test failed: {e}")
         return False
 
+class _PerThreadStdout:
+    """sys.stdout stand-in that sends a thread's prints to its own buffer while capturing."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def _target(self):
+        buffer = getattr(self._local, "buffer", None)
+        return self._stream if buffer is None else buffer
+    
+    def write(self, text):
+        return self._target().write(text)
+    
+    def flush(self):
+        self._target().flush()
+    
+    def capture(self):
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+    
+    def release(self):
+        self._local.buffer = None
+
+def _run_test(name, test_func):
+    """Run one test, reporting a crash as a failure."""
+    try:
+        return test_func()
+    except Exception as e:
+        print(f"\n❌ {name} test crashed: {e}")
+        traceback.print_exc(file=sys.stdout)
+        return False
+
+def _run_captured(stdout, name, test_func):
+    """Run one test on a worker thread, returning its result and printed output."""
+    buffer = stdout.capture()
+    try:
+        return _run_test(name, test_func), buffer.getvalue()
+    finally:
+        stdout.release()
+
 def main():
     """Run all tests."""
     print("=" * 60)
     print("GSIN Implementation Test Suite")
     print("=" * 60)
     
+    # (name, test, parallel_safe): tests that don't touch the shared DB
+    # session run concurrently; DB tests run one after another on it
     tests = [
-        ("Models", test_models),
-        ("CRUD Functions", test_crud_functions),
-        ("Market Data Cache", test_market_data_cache),
-        ("PaperBroker", test_paper_broker),
-        ("Backtest Engine", test_backtest_engine),
-        ("Brain Service", test_brain_service),
-        ("Alpaca Safety", test_alpaca_safety),
-        ("Environment Variables", test_environment_variables),
+        ("Models", test_models, True),
+        ("CRUD Functions", test_crud_functions, False),
+        ("Market Data Cache", test_market_data_cache, True),
+        ("PaperBroker", test_paper_broker, False),
+        ("Backtest Engine", test_backtest_engine, True),
+        ("Brain Service", test_brain_service, True),
+        ("Alpaca Safety", test_alpaca_safety, True),
+        ("Environment Variables", test_environment_variables, True),
     ]
     
-    results = []
-    for name, test_func in tests:
+    results = {}
+    try:
+        # Each parallel test prints into its own buffer; buffers are written
+        # out in list order once all of them finish, so output never interleaves
+        stdout = _PerThreadStdout(sys.stdout)
+        parallel = [(name, test_func) for name, test_func, safe in tests if safe]
+        sys.stdout = stdout
         try:
-            result = test_func()
-            results.append((name, result))
-        except Exception as e:
-            print(f"\n❌ {name} test crashed: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append((name, False))
+            with ThreadPoolExecutor(max_workers=len(parallel)) as executor:
+                futures = [
+                    (name, executor.submit(_run_captured, stdout, name, test_func))
+                    for name, test_func in parallel
+                ]
+                outputs = [(name, future.result()) for name, future in futures]
+        finally:
+            sys.stdout = stdout._stream
+        for name, (result, output) in outputs:
+            print(output, end="")
+            results[name] = result
+        
+        for name, test_func, safe in tests:
+            if not safe:
+                results[name] = _run_test(name, test_func)
+    finally:
+        if _SHARED_DB is not None:
+            _SHARED_DB.close()
     
     print("\n" + "=" * 60)
     print("Test Summary")
     print("=" * 60)
     
+    # Report in the declared order, not completion order
+    results = [(name, results[name]) for name, _, _ in tests]
     passed = sum(1 for _, result in results if result)
     total = len(results)
     